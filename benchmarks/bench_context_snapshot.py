@@ -0,0 +1,68 @@
+"""
+Benchmark: ComponentContext namespace snapshot modes
+====================================================
+
+Times entering and exiting a `with parameters():` block in a module namespace
+that holds large NumPy arrays and lookup tables, comparing the "identity"
+snapshot mode against the legacy "deepcopy" mode.
+
+Usage
+-----
+    python -m benchmarks.bench_context_snapshot [--mb 200] [--blocks 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from qspy.contexts.base import ComponentContext
+
+MODULE_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import parameters
+
+Model()
+for _i in range(_n_blocks):
+    with parameters():
+        globals()[f"k_{_i}"] = (1.0, "1/s")
+"""
+
+
+def run(mode, payload, n_blocks):
+    """Execute the model script in a fresh module namespace; return (seconds, peak MB)."""
+    ComponentContext.snapshot_mode = mode
+    namespace = {"__name__": f"bench_{mode}", "_n_blocks": n_blocks, **payload}
+    code = compile(MODULE_SOURCE, f"<bench_{mode}>", "exec")
+    tracemalloc.start()
+    start = time.perf_counter()
+    exec(code, namespace)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mb", type=float, default=200.0, help="Module-scope data size (MB)")
+    parser.add_argument("--blocks", type=int, default=5, help="Number of parameter blocks")
+    args = parser.parse_args()
+
+    n = int(args.mb * 1e6 / 8 / 4)
+    payload = {
+        f"table_{i}": np.random.default_rng(i).random(n) for i in range(4)
+    }
+    payload["lookup"] = {f"key_{i}": list(range(10)) for i in range(10_000)}
+
+    print(f"Module data: {args.mb:.0f} MB, {args.blocks} parameter blocks")
+    print(f"{'mode':<10} {'time (s)':>10} {'peak alloc (MB)':>16}")
+    for mode in ("deepcopy", "identity"):
+        elapsed, peak = run(mode, payload, args.blocks)
+        print(f"{mode:<10} {elapsed:>10.3f} {peak:>16.1f}")
+    ComponentContext.snapshot_mode = "identity"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: `import qspy` startup time
+=====================================
+
+Runs `python -X importtime -c "import qspy"` in fresh interpreters and reports the
+median cumulative import time of `qspy` together with the slowest top-level
+imports underneath it. The documented `from qspy import *` is timed the same
+way. Also checks that neither statement imports the lazily loaded stacks
+(validation, diagrams, pysb.pkpd) eagerly.
+
+Exits with status 1 if the median exceeds `--max-ms` or an eager import is found,
+so it can be used as a regression gate.
+
+Usage
+-----
+    python -m benchmarks.bench_import_time [--repeat 5] [--top 10] [--max-ms 2000]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules that `import qspy` must not pull in (they're loaded on first use).
+LAZY_MODULES = (
+    "qspy.validation.metadata",
+    "qspy.validation.modelchecker",
+    "qspy.utils.diagrams",
+    "microbench",
+    "pyvipr",
+    "mergram",
+    "seaborn",
+    "pysb.pkpd",
+)
+
+
+# Statements timed, by label.
+STATEMENTS = {"import qspy": "import qspy", "from qspy import *": "from qspy import *"}
+
+
+def import_profile(statement="import qspy"):
+    """Run `statement` in a fresh interpreter; return {name: cumulative us} by first import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            timings.setdefault(name.strip(), int(cumulative))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail above this median")
+    args = parser.parse_args()
+
+    failed = False
+    for label, statement in STATEMENTS.items():
+        profiles = [import_profile(statement) for _ in range(args.repeat)]
+        total_ms = statistics.median(p["qspy"] for p in profiles) / 1000
+        eager = sorted({m for p in profiles for m in LAZY_MODULES if m in p})
+
+        slowest = sorted(profiles[-1].items(), key=lambda item: item[1], reverse=True)
+        print(f"{label}: {total_ms:.0f} ms (median of {args.repeat})")
+        print(f"{'module':<40} {'cumulative (ms)':>16}")
+        for name, cumulative in slowest[1 : args.top + 1]:
+            print(f"{name:<40} {cumulative / 1000:>16.1f}")
+        print()
+
+        if eager:
+            print(f"FAIL: `{label}` eagerly imported: {', '.join(eager)}")
+            failed = True
+        if args.max_ms is not None and total_ms > args.max_ms:
+            print(f"FAIL: `{label}` took {total_ms:.0f} ms, over {args.max_ms:.0f} ms")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: `log_event` per-call overhead
+========================================
+
+Times a `@log_event(log_args=True, log_result=True)`-decorated no-op called with
+PySB components, comparing the previous implementation (eager f-string rendering,
+synchronous `RotatingFileHandler`) with the current one (lazy %-style rendering
+written by a `QueueListener` thread), both at INFO and with INFO disabled.
+
+Usage
+-----
+    python -m benchmarks.bench_log_event [--calls 2000] [--rules 50]
+"""
+
+import argparse
+import functools
+import logging
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from qspy.utils import logging as qspy_logging
+
+
+def legacy_log_event(logger, log_args=False, log_result=False):
+    """The pre-queue `log_event`: renders every message eagerly."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            fname = func.__qualname__
+            logger.info(f">>> Entering `{fname}`")
+            if log_args:
+                logger.info(f"    Args: {args}, Kwargs: {kwargs}")
+            start = time.time()
+            result = func(*args, **kwargs)
+            duration = time.time() - start
+            logger.info(f"<<< Exiting `{fname}` ({duration:.3f}s)")
+            if log_result:
+                logger.info(f"    Result: {result}")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def build_components(n_rules):
+    """Build a small PySB model and return its rules (costly to repr)."""
+    from pysb import Model, Monomer, Parameter, Rule
+
+    Model()
+    A = Monomer("A", ["b", "s"], {"s": ["u", "p"]})
+    B = Monomer("B", ["a"])
+    rules = []
+    for i in range(n_rules):
+        kf = Parameter(f"kf_{i}", 1.0)
+        kr = Parameter(f"kr_{i}", 0.1)
+        rules.append(
+            Rule(
+                f"bind_{i}",
+                A(b=None, s="u") + B(a=None) | A(b=1, s="u") % B(a=1),
+                kf,
+                kr,
+            )
+        )
+    return rules
+
+
+def make_logger(name, log_path, background):
+    """Return a fresh logger writing to `log_path`, optionally via a queue."""
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    handler = RotatingFileHandler(log_path, maxBytes=50_000_000, backupCount=1)
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    if background:
+        import queue
+
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(qspy_logging._DeferredQueueHandler(log_queue))
+        qspy_logging._start_listener(log_queue, handler)
+    else:
+        logger.addHandler(handler)
+    return logger
+
+
+def time_calls(func, rules, n_calls):
+    """Return the mean time per call in microseconds."""
+    start = time.perf_counter()
+    for i in range(n_calls):
+        func(rules[i % len(rules)], rate=rules[i % len(rules)].rate_forward)
+    return (time.perf_counter() - start) / n_calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000, help="Decorated calls per case")
+    parser.add_argument("--rules", type=int, default=50, help="Rules to pass as arguments")
+    args = parser.parse_args()
+
+    rules = build_components(args.rules)
+
+    def target(rule, rate=None):
+        return rule
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for level_name, level in (("INFO", logging.INFO), ("WARNING", logging.WARNING)):
+            legacy_logger = make_logger("bench.legacy", Path(tmp) / "legacy.log", False)
+            legacy_logger.setLevel(level)
+            legacy = legacy_log_event(legacy_logger, True, True)(target)
+            results[("legacy", level_name)] = time_calls(legacy, rules, args.calls)
+
+            lazy_logger = make_logger("bench.lazy", Path(tmp) / "lazy.log", True)
+            lazy_logger.setLevel(level)
+            lazy = qspy_logging.log_event("bench.lazy", log_args=True, log_result=True)(target)
+            results[("lazy+queue", level_name)] = time_calls(lazy, rules, args.calls)
+            qspy_logging._stop_listener()
+
+    print(f"{'implementation':<14} {'level':<8} {'us/call':>10}")
+    for (impl, level_name), us in results.items():
+        print(f"{impl:<14} {level_name:<8} {us:>10.1f}")
+    for level_name in ("INFO", "WARNING"):
+        legacy = results[("legacy", level_name)]
+        lazy = results[("lazy+queue", level_name)]
+        print(f"{level_name}: {legacy / lazy:.1f}x less overhead in the calling thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,25 +15,67 @@ Modules
 - Logging utilities
 - Integration with PySB PKPD simulation tools
 
+The validation tools, the diagrammer, and `simulate` pull in heavy optional
+stacks (microbench, pyvipr/networkx/seaborn, pysb.pkpd), so they are loaded
+lazily on first attribute access (PEP 562) rather than at `import qspy`. They are
+left out of `__all__` so that ``from qspy import *`` stays fast too; import them
+by name (``from qspy import ModelChecker``) where they are needed.
+
 """
 
+import importlib
+
 from qspy.config import QSPY_VERSION
 
 __version__ = QSPY_VERSION
 
 from qspy.core import *  # Import core model components
 from qspy.contexts import *  # Import context managers for parameters, expressions, compartments, etc.
-from qspy.validation import (
-    ModelMetadataTracker,
-    ModelChecker,
-)  # Import validation tools
-from qspy.utils.diagrams import (
-    ModelMermaidDiagrammer,
-)  # Import diagram generation tools
 from qspy.functionaltags import *  # Import functional tags for model components
-from pysb.pkpd import simulate
+
+# Public names resolved on first access, mapped to the module that defines them.
+_LAZY_ATTRS = {
+    "ModelMetadataTracker": "qspy.validation.metadata",  # Validation tools
+    "ModelChecker": "qspy.validation.modelchecker",
+    "ModelMermaidDiagrammer": "qspy.utils.diagrams",  # Diagram generation tools
+    "simulate": "pysb.pkpd",
+}
+
+
+def __getattr__(name):
+    """
+    Import lazily loaded public attributes on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name.
+
+    Returns
+    -------
+    object
+        The requested attribute.
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a lazily loaded attribute.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache it so later lookups don't go through __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily loaded attributes in `dir(qspy)`."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
+# The lazily loaded names are deliberately not listed: a star import would load them.
 __all__ = [
     "Model",
     "Parameter",
@@ -52,11 +94,8 @@ __all__ = [
     "initials",
     "rules",
     "observables",
+    "auto_observables",
     "macros",
-    "simulate",
-    "ModelMetadataTracker",
-    "ModelChecker",
-    "ModelMermaidDiagrammer",
     "PROTEIN",
     "DRUG",
     "RNA",
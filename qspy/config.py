@@ -17,6 +17,22 @@ METADATA_DIR : Path
     Directory for storing model metadata files.
 SUMMARY_DIR : Path
     Path for the model summary markdown file.
+RESULTS_DIR : Path
+    Directory for memory-mapped simulation results.
+CACHE_DIR : Path
+    Directory for persistent QSPy caches.
+NETWORK_CACHE_DIR : Path
+    Directory for cached BioNetGen reaction networks.
+ENV_CACHE_DIR : Path
+    Directory for persisted environment snapshots.
+CHECK_CACHE_DIR : Path
+    Directory for persisted ModelChecker results.
+CHECK_CACHE_MAX_ENTRIES : int
+    Number of check results each ModelChecker keeps in memory.
+RESULT_CACHE_DIR : Path
+    Directory for cached simulation results.
+RESULT_CACHE_MAX_BYTES : int
+    Size budget of the simulation result cache.
 QSPY_VERSION : str
     The current version of QSPy.
 """
@@ -35,6 +51,16 @@ DEFAULT_UNITS = {"concentration": "mg/L", "time": "h", "volume": "L"}
 # Output & reporting
 METADATA_DIR = OUTPUT_DIR / "metadata"
 SUMMARY_DIR = OUTPUT_DIR / "model_summary.md"
+RESULTS_DIR = OUTPUT_DIR / "results"
+
+# Caches
+CACHE_DIR = OUTPUT_DIR / "cache"
+NETWORK_CACHE_DIR = CACHE_DIR / "networks"
+ENV_CACHE_DIR = CACHE_DIR / "environment"
+CHECK_CACHE_DIR = CACHE_DIR / "checks"
+CHECK_CACHE_MAX_ENTRIES = 256
+RESULT_CACHE_DIR = CACHE_DIR / "results"
+RESULT_CACHE_MAX_BYTES = 1 << 30
 
 # Versioning
 QSPY_VERSION = "0.1.1"
@@ -51,10 +77,17 @@ def set_output_dir(path: str | Path):
     global OUTPUT_DIR, LOG_PATH, METADATA_DIR, SUMMARY_DIR
     OUTPUT_DIR = Path(path)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    global LOG_PATH, METADATA_DIR, SUMMARY_DIR
+    global LOG_PATH, METADATA_DIR, SUMMARY_DIR, CACHE_DIR, NETWORK_CACHE_DIR, ENV_CACHE_DIR
+    global CHECK_CACHE_DIR, RESULTS_DIR, RESULT_CACHE_DIR
     LOG_PATH = OUTPUT_DIR / "logs/qspy.log"
     METADATA_DIR = OUTPUT_DIR / "metadata"
     SUMMARY_DIR = OUTPUT_DIR / "model_summary.md"
+    RESULTS_DIR = OUTPUT_DIR / "results"
+    CACHE_DIR = OUTPUT_DIR / "cache"
+    NETWORK_CACHE_DIR = CACHE_DIR / "networks"
+    ENV_CACHE_DIR = CACHE_DIR / "environment"
+    CHECK_CACHE_DIR = CACHE_DIR / "checks"
+    RESULT_CACHE_DIR = CACHE_DIR / "results"
 
 def set_log_path(path: str | Path):
     """
@@ -26,19 +26,20 @@ Examples
 import copy
 import inspect
 import logging
+import time
 import weakref
 from abc import ABC, abstractmethod
 from types import ModuleType
 
-from pysb.core import SelfExporter, ComponentSet
+from pysb.core import Component, SelfExporter, ComponentSet
 
 from qspy.config import LOGGER_NAME
 from qspy.utils.logging import ensure_qspy_logging
+from qspy.utils.profiling import REGISTRY
 
 
 # Types to skip during introspection
-# These are typically PySB components or context objects that don't need to be tracked/deep
-# copied.
+# These are typically PySB components or context objects that don't need to be tracked.
 SKIP_TYPES = (
     "Parameter",
     "Monomer",
@@ -117,6 +118,9 @@ class ComponentContext(ABC):
         Reference to the caller's frame for introspection.
     _locals_before : dict
         Snapshot of local variables before entering the context.
+    snapshot_mode : str
+        "identity" (default) snapshots names and object identities without
+        copying; "deepcopy" deep-copies the namespace (legacy behavior).
     _override : bool
         If True, disables module-scope enforcement.
 
@@ -139,6 +143,9 @@ class ComponentContext(ABC):
     """
 
     component_name = "component"  # e.g. 'parameter', 'monomer'
+    # How the caller's namespace is snapshotted on entry: "identity" keeps
+    # references to the existing objects; "deepcopy" is the legacy full copy.
+    snapshot_mode = "identity"
 
     def __init__(self, manual: bool = False, verbose: bool = False):
         """
@@ -179,6 +186,9 @@ class ComponentContext(ABC):
         """
         ensure_qspy_logging()
         logger = logging.getLogger(LOGGER_NAME)
+        # Timed inline rather than decorated: the frame lookups below depend
+        # on __enter__ being called directly by the `with` statement.
+        start = time.perf_counter_ns()
         try:
             logger.info(f"[QSPy] Entering context: {self.__class__.__name__}")
             if self.model is None:
@@ -207,22 +217,23 @@ class ComponentContext(ABC):
                 )
 
             if not self.manual:
-                # Filter out model components and context objects before deepcopy
-
-                filtered_locals = {
-                    k: v
-                    for k, v in self._frame.f_locals.items()
-                    if not ((hasattr(v, "__class__") and k in SKIP_TYPES) or is_module(v))
-                }
-                # print(filtered_locals)
+                # Filter out model components and context objects before the snapshot
+                filtered_locals = self._filter_locals(self._frame.f_locals)
                 for key in filtered_locals:
                     logger.debug(f"Local variable: {key}")
-                self._locals_before = copy.deepcopy(filtered_locals)
+                if self.snapshot_mode == "deepcopy":
+                    self._locals_before = copy.deepcopy(filtered_locals)
+                else:
+                    # Shallow snapshot: holds references (not copies), so memory
+                    # is proportional to the number of names, not their sizes.
+                    self._locals_before = dict(filtered_locals)
 
             return self if self.manual else None
         except Exception as e:
             logger.error(f"[QSPy][ERROR] Exception on entering context: {e}")
             raise
+        finally:
+            REGISTRY.record(self._timing_key("__enter__"), time.perf_counter_ns() - start)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
@@ -246,6 +257,7 @@ class ComponentContext(ABC):
         """
 
         logger = logging.getLogger(LOGGER_NAME)
+        start = time.perf_counter_ns()
         try:
             logger.info(f"[QSPy] Exiting context: {self.__class__.__name__}")
             if self.manual:
@@ -253,13 +265,8 @@ class ComponentContext(ABC):
                     self._add_component(name, *args)
             else:
                 # Filter out model components and context objects before comparison
-
-                filtered_locals = {
-                    k: v
-                    for k, v in self._frame.f_locals.items()
-                    if not ((hasattr(v, "__class__") and k in SKIP_TYPES) or is_module(v))
-                }
-                new_vars = set(filtered_locals.keys()) - set(self._locals_before.keys())
+                filtered_locals = self._filter_locals(self._frame.f_locals)
+                new_vars = self._changed_names(filtered_locals)
 
                 for var_name in new_vars:
                     val = filtered_locals[var_name]
@@ -273,6 +280,132 @@ class ComponentContext(ABC):
             #         self._frame.f_locals[component.name] = component
         except Exception as e:
             logger.error(f"[QSPy][ERROR] Exception on exiting context: {e}")
+        finally:
+            REGISTRY.record(self._timing_key("__exit__"), time.perf_counter_ns() - start)
+
+    def _timing_key(self, method):
+        """
+        Return the timing-registry key for a method of this context class.
+
+        Parameters
+        ----------
+        method : str
+            Method name (e.g. "__enter__").
+
+        Returns
+        -------
+        str
+            Qualified key, e.g. "qspy.contexts.contexts.parameters.__exit__".
+        """
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}.{method}"
+
+    @staticmethod
+    def _filter_locals(frame_locals):
+        """
+        Filter model components, context objects, and modules out of a namespace.
+
+        Parameters
+        ----------
+        frame_locals : dict
+            The namespace to filter.
+
+        Returns
+        -------
+        dict
+            Filtered namespace, in the original insertion order.
+        """
+        return {
+            k: v
+            for k, v in frame_locals.items()
+            if not ((hasattr(v, "__class__") and k in SKIP_TYPES) or is_module(v))
+        }
+
+    def _changed_names(self, filtered_locals):
+        """
+        List the names defined or rebound since the context was entered.
+
+        In "identity" snapshot mode, a name counts as changed if it is new or is
+        now bound to a different object. In "deepcopy" mode only new names count,
+        matching the original behavior.
+
+        Names bound to a pysb `Component` that is already registered with the
+        model (e.g. exported by `SelfExporter`) are not definitions and are
+        skipped. A rebound name only counts if its new value is a valid
+        definition for this context, so ordinary script variables reassigned in
+        the block (loop variables, accumulators) are left alone.
+
+        Parameters
+        ----------
+        filtered_locals : dict
+            Filtered namespace at context exit.
+
+        Returns
+        -------
+        list of str
+            Changed names, in definition order.
+        """
+        before = self._locals_before
+        candidates = [
+            (k, v)
+            for k, v in filtered_locals.items()
+            if not (isinstance(v, Component) and self._is_registered(k, v))
+        ]
+        if self.snapshot_mode == "deepcopy":
+            return [k for k, _ in candidates if k not in before]
+        missing = object()
+        changed = []
+        for k, v in candidates:
+            old = before.get(k, missing)
+            if old is v:
+                continue
+            if old is not missing and not self._is_definition(k, v):
+                logging.getLogger(LOGGER_NAME).debug(
+                    f"[QSPy] Ignoring rebound non-{self.component_name} name: {k}"
+                )
+                continue
+            changed.append(k)
+        return changed
+
+    def _is_registered(self, name, component):
+        """
+        Check whether a component is the model's component of that name.
+
+        Parameters
+        ----------
+        name : str
+            Name the component is bound to.
+        component : pysb.Component
+            The bound component.
+
+        Returns
+        -------
+        bool
+            True if the model already holds `component` under `name`.
+        """
+        return self.model.get_component(name) is component
+
+    def _is_definition(self, name, val):
+        """
+        Check whether a value is a valid definition for this context.
+
+        Parameters
+        ----------
+        name : str
+            Name the value is bound to.
+        val : object
+            The bound value.
+
+        Returns
+        -------
+        bool
+            True if `_validate_value` accepts the value.
+        """
+        try:
+            self._validate_value(name, val)
+        except (ValueError, TypeError):
+            return False
+        return True
 
     def __call__(self, name, *args):
         """
@@ -312,7 +445,7 @@ class ComponentContext(ABC):
         ValueError
             If the component already exists in the model.
         """
-        if name in self.model.component_names:
+        if self.model.has_component(name):
             raise ValueError(
                 f"{self.component_name.capitalize()} '{name}' already exists in the model."
             )
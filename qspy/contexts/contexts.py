@@ -41,12 +41,15 @@ from enum import Enum
 
 import sympy
 import pysb
-from pysb.units.core import check as units_check
+from pysb.core import SelfExporter
+from pysb.units.core import Unit
 
 from qspy.contexts.base import ComponentContext
 from qspy.core import Monomer, Parameter, Expression, Rule, Compartment
 from qspy.config import LOGGER_NAME
 from qspy.utils.logging import log_event
+from qspy.utils.tables import read_parameter_table, validate_parameter_table
+from qspy.validation.units import check_units_incremental
 from qspy.contexts.base import SKIP_TYPES
 
 # from pysb.units import add_macro_units
@@ -92,6 +95,8 @@ class parameters(ComponentContext):
         Validate the value and unit for a parameter.
     create_component(name, value, unit)
         Create a parameter or expression component.
+    from_table(table, name_col="name", value_col="value", unit_col="unit")
+        Define parameters in bulk from a tabular file or array.
     """
 
     component_name = "parameter"
@@ -161,7 +166,10 @@ class parameters(ComponentContext):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Exit the parameter context and perform unit checking.
+        Exit the parameter context and check the units of the new components.
+
+        Only components added since the last unit check are checked; see
+        `qspy.validation.units`.
 
         Parameters
         ----------
@@ -177,10 +185,75 @@ class parameters(ComponentContext):
         None
         """
         super().__exit__(exc_type, exc_val, exc_tb)
-        # Check units for all parameters in the model
-        units_check(self.model)
+        # Attribute unit warnings to the `with` statement being exited.
+        check_units_incremental(self.model, frame=self._frame)
         return
 
+    @classmethod
+    @log_event()
+    def from_table(cls, table, name_col="name", value_col="value", unit_col="unit"):
+        """
+        Define parameters in bulk from a tabular file or array.
+
+        The whole table is validated before any parameter is created: values are
+        checked in one vectorized pass and each distinct unit string is parsed
+        (and converted to the model's simulation units) only once. The parameters
+        are then registered with the model and exported to the calling module in
+        one batch, and their units are checked incrementally.
+
+        Parameters
+        ----------
+        table : str, Path, pandas.DataFrame, Mapping, or array_like
+            A ``.csv``, ``.tsv``, or ``.toml`` file, or an in-memory table; see
+            `qspy.utils.tables.read_parameter_table`.
+        name_col : str, optional
+            Column holding parameter names (default: "name").
+        value_col : str, optional
+            Column holding parameter values (default: "value").
+        unit_col : str or None, optional
+            Column holding unit strings (default: "unit").
+
+        Returns
+        -------
+        list of Parameter
+            The new parameters, in table order.
+
+        Raises
+        ------
+        RuntimeError
+            If no active model is found.
+        ValueError
+            If any name, value, or unit in the table is invalid.
+
+        Examples
+        --------
+        >>> parameters.from_table("pk_parameters.csv")
+        """
+        model = SelfExporter.default_model
+        if model is None:
+            raise RuntimeError("No active model found. Did you instantiate a Model()?")
+        names, values, units = read_parameter_table(table, name_col, value_col, unit_col)
+        values, parsed = validate_parameter_table(names, values, units, model=model)
+
+        # Each distinct unit was parsed once during validation. With simulation
+        # units set, pysb.units converts the parsed unit to the model's units and
+        # records the converted unit string; without them the annotation keeps
+        # what it is given, so it gets the unit string instead.
+        reuse_parsed = hasattr(model, "simulation_units")
+        params = []
+        for name, value, unit in zip(names, values, units):
+            param = Parameter(name, value, _export=False)
+            if unit is not None:
+                Unit(param, parsed[unit] if reuse_parsed else unit)
+            params.append(param)
+
+        for param in params:
+            model.add_component(param)
+        if SelfExporter.do_export and SelfExporter.target_globals is not None:
+            SelfExporter.target_globals.update({p.name: p for p in params})
+        check_units_incremental(model)
+        return params
+
 
 class compartments(ComponentContext):
     """
@@ -609,17 +682,16 @@ def macros():
     logger = logging.getLogger(LOGGER_NAME)
     model = SelfExporter.default_model
 
-    componenents_before = set(model.components.keys())
+    componenents_before = set(model.component_names)
 
     logger.info("[QSPy] Entering macros context manager")
     try:
         yield
     finally:
-        components_after = set(model.components.keys())
-        added = components_after - componenents_before
+        added = [name for name in model.component_names if name not in componenents_before]
         if added:
             # Log the names of newly added components
-            added_components = [comp for comp in model.components if comp.name in added]
+            added_components = [model.get_component(name) for name in added]
             logger.info(f"[QSPy] Components added in context: {added_components}")
         else:
             logger.info("[QSPy] No new components added")
@@ -17,8 +17,10 @@ Functions
 mp_lshift : Overloads '<<' for MonomerPattern/ComplexPattern to create Initial objects.
 mp_invert : Overloads '~' for MonomerPattern/ComplexPattern to create Observables with auto-naming.
 mp_gt : Overloads '>' for MonomerPattern/ComplexPattern to create Observables with custom names.
+observable_name : Memoized, structure-based auto-name for a MonomerPattern/ComplexPattern.
+auto_observables : Create auto-named Observables for many patterns in one call.
 _make_mono_string : Utility to generate string names for MonomerPatterns.
-_make_complex_string : Utility to generate string names for ComplexPatterns.
+_make_complex_string : Utility to generate string names for ComplexPatterns of any size.
 
 Operator Overloads
 ------------------
@@ -42,10 +44,10 @@ Initial(m(b=None), 100)
 """
 
 from pathlib import Path
-from datetime import datetime
 import os
-import re
+import weakref
 from enum import Enum
+from types import MappingProxyType
 
 import pysb.units
 from pysb.units.core import *
@@ -53,10 +55,15 @@ from pysb.core import SelfExporter, MonomerPattern, ComplexPattern
 import pysb.core
 from qspy.config import METADATA_DIR, LOGGER_NAME, SUMMARY_DIR
 from qspy.utils.logging import ensure_qspy_logging
-from qspy.functionaltags import FunctionalTag
+from qspy.functionaltags import NO_TAG, FunctionalTag
+from qspy.utils.hashing import COMPONENT_KINDS, MerkleTree, structural_diff
+from qspy.utils.dependencies import DependencyGraph
+from qspy.utils.summary import ModelSummary
+from qspy.utils.tag_index import TagIndex
 from qspy.utils.logging import log_event
 
 __all__ = pysb.units.core.__all__.copy()
+__all__ += ["observable_name", "auto_observables"]
 
 
 class Model(Model):
@@ -72,8 +79,26 @@ class Model(Model):
         Set simulation units for concentration, time, and volume.
     component_names
         List of component names in the model.
+    component_index
+        Read-only mapping of component names to components.
+    has_component(name)
+        Constant-time check for a component name.
+    get_component(name, default)
+        Constant-time component lookup by name.
+    structural_tree
+        Incrementally maintained Merkle tree of component digests.
+    structural_hash(kinds, extra)
+        Declaration-order independent structural hash of the model.
+    structural_diff(other, kinds)
+        Components that differ from another version of the model.
+    dependency_graph
+        Incrementally maintained graph of component references.
+    tag_index
+        Incrementally maintained index of monomers by functional tag.
     qspy_metadata
         Dictionary of QSPy metadata for the model.
+    simulate_batch(param_matrix, tspan, observables)
+        Simulate many parameter sets and return an (N x T x O) observable array.
     summarize(path, include_diagram)
         Generate a Markdown summary of the model and optionally a diagram.
     """
@@ -97,6 +122,151 @@ class Model(Model):
         SimulationUnits(concentration, time, volume)
         return
 
+    def _name_index(self):
+        """
+        Return the component-name index, building it on first use.
+
+        The index is created lazily rather than in `__init__` because PySB's
+        SelfExporter locates the model's module by walking the constructor's
+        call stack, which an extra constructor frame would break.
+
+        Returns
+        -------
+        dict
+            Mapping of component names to components.
+        """
+        index = self.__dict__.get("_component_index")
+        if index is None:
+            index = {c.name: c for c in self.all_components()}
+            self._component_index = index
+        return index
+
+    def add_component(self, other):
+        """
+        Add a component to the model and to the component-name index.
+
+        Parameters
+        ----------
+        other : pysb.Component
+            The component to add.
+
+        Raises
+        ------
+        ComponentDuplicateNameError
+            If a different component with the same name is already in the model.
+        """
+        index = self._name_index()
+        existing = index.get(other.name)
+        if existing is not None and existing is not other:
+            raise pysb.core.ComponentDuplicateNameError(
+                f"Tried to add a component with a duplicate name: {other.name}"
+            )
+        super().add_component(other)
+        index[other.name] = other
+        for attr in ("_structural_tree", "_dependency_graph", "_tag_index"):
+            tracker = self.__dict__.get(attr)
+            if tracker is not None:
+                tracker.add(other)
+
+    def add_initial(self, initial):
+        """
+        Add an initial condition and register it with the structural hash tree
+        and the dependency graph.
+
+        Parameters
+        ----------
+        initial : pysb.Initial
+            The initial condition to add.
+        """
+        super().add_initial(initial)
+        for attr in ("_structural_tree", "_dependency_graph"):
+            tracker = self.__dict__.get(attr)
+            if tracker is not None:
+                tracker.add(initial)
+
+    def _rename_component(self, component, new_name):
+        """
+        Rename a component and update the component-name index.
+
+        Parameters
+        ----------
+        component : pysb.Component
+            The component being renamed.
+        new_name : str
+            The new component name.
+        """
+        super()._rename_component(component, new_name)
+        index = self._name_index()
+        if index.get(component.name) is component:
+            del index[component.name]
+            index[new_name] = component
+        tree = self.__dict__.get("_structural_tree")
+        if tree is not None:
+            tree.invalidate(component)
+        for attr in ("_dependency_graph", "_tag_index"):
+            tracker = self.__dict__.get(attr)
+            if tracker is not None:
+                tracker.invalidate()
+
+    def _functional_tag_changed(self, monomer):
+        """
+        Update the functional-tag index after a monomer is retagged.
+
+        Parameters
+        ----------
+        monomer : Monomer
+            The retagged monomer.
+        """
+        index = self.__dict__.get("_tag_index")
+        if index is not None:
+            index.retag(monomer)
+
+    @property
+    def component_index(self):
+        """
+        Read-only mapping of component names to components.
+
+        Returns
+        -------
+        mappingproxy
+            Live view of the model's component-name index.
+        """
+        return MappingProxyType(self._name_index())
+
+    def has_component(self, name):
+        """
+        Check whether the model has a component with the given name in O(1).
+
+        Parameters
+        ----------
+        name : str
+            Component name.
+
+        Returns
+        -------
+        bool
+            True if a component with that name exists.
+        """
+        return name in self._name_index()
+
+    def get_component(self, name, default=None):
+        """
+        Look up a component by name in O(1).
+
+        Parameters
+        ----------
+        name : str
+            Component name.
+        default : object, optional
+            Value returned if no component has that name (default: None).
+
+        Returns
+        -------
+        pysb.Component or object
+            The named component, or `default`.
+        """
+        return self._name_index().get(name, default)
+
     @property
     def component_names(self):
         """
@@ -105,9 +275,101 @@ class Model(Model):
         Returns
         -------
         list of str
-            Names of model components.
+            Names of model components, in the order they were added.
+        """
+        return list(self._name_index())
+
+    @property
+    def structural_tree(self):
+        """
+        Merkle tree of component digests, kept up to date as components are added.
+
+        Built on first access, like the component-name index.
+
+        Returns
+        -------
+        qspy.utils.hashing.MerkleTree
+            The model's structural hash tree.
+        """
+        tree = self.__dict__.get("_structural_tree")
+        if tree is None:
+            tree = self._structural_tree = MerkleTree(self)
+        return tree
+
+    def structural_hash(self, kinds=COMPONENT_KINDS, extra=None):
+        """
+        Compute the declaration-order independent structural hash of the model.
+
+        Only components added or modified since the last call are re-digested.
+
+        Parameters
+        ----------
+        kinds : iterable of str, optional
+            Component kinds to include (default: all).
+        extra : str, optional
+            Additional string mixed into the hash (e.g., tool versions or options).
+
+        Returns
+        -------
+        str
+            Hex SHA-256 root digest.
+        """
+        return self.structural_tree.root(kinds, extra)
+
+    def structural_diff(self, other, kinds=COMPONENT_KINDS):
+        """
+        Report the components that differ from another version of the model.
+
+        Parameters
+        ----------
+        other : Model, MerkleTree, or dict
+            The earlier version: another model, its tree, or a snapshot from
+            `structural_tree.snapshot()`.
+        kinds : iterable of str, optional
+            Component kinds to compare (default: all).
+
+        Returns
+        -------
+        dict
+            Maps each kind whose subtree differs to its sorted "added",
+            "removed", and "changed" component labels.
+        """
+        return structural_diff(other, self.structural_tree, kinds=kinds)
+
+    @property
+    def dependency_graph(self):
+        """
+        Graph of component references, kept up to date as components are added.
+
+        Built on first access, like the component-name index.
+
+        Returns
+        -------
+        qspy.utils.dependencies.DependencyGraph
+            The model's dependency graph.
+        """
+        graph = self.__dict__.get("_dependency_graph")
+        if graph is None:
+            graph = self._dependency_graph = DependencyGraph(self)
+        return graph
+
+    @property
+    def tag_index(self):
+        """
+        Index of monomers by functional tag, kept up to date as monomers are
+        added or retagged.
+
+        Built on first access, like the dependency graph.
+
+        Returns
+        -------
+        qspy.utils.tag_index.TagIndex
+            The model's functional-tag index.
         """
-        return [component.name for component in self.components]
+        index = self.__dict__.get("_tag_index")
+        if index is None:
+            index = self._tag_index = TagIndex(self)
+        return index
 
     @property
     def qspy_metadata(self):
@@ -124,11 +386,109 @@ class Model(Model):
         else:
             return {}
 
+    def simulate_batch(
+        self, param_matrix, tspan, observables=None, param_names=None, **kwargs
+    ):
+        """
+        Simulate the model for many parameter sets with one compiled RHS.
+
+        The batch simulator (reaction network and compiled right-hand side) is
+        cached on the model and reused for later calls with the same integrator
+        settings, as long as the model structure is unchanged.
+
+        Parameters
+        ----------
+        param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+            (N x P) parameter values keyed by `Parameter` name. Parameters not
+            given keep their nominal values.
+        tspan : array_like
+            Output time points (length T).
+        observables : list of str, Observable, or tag query, optional
+            Observables to return, in output order (default: all, O in total);
+            see `qspy.simulation.batch.resolve_outputs`.
+        param_names : list of str, optional
+            Column names when `param_matrix` is a plain 2D array.
+        **kwargs
+            `initials`, `time_chunk`, `sink` and `cache` are passed to the run
+            (see `qspy.simulation.batch.BatchSimulator.run`); other keyword
+            arguments (e.g., `integrator`, `compiler`, integrator options)
+            configure the simulator.
+
+        Returns
+        -------
+        numpy.ndarray or qspy.simulation.results.SimulationResult
+            Observable trajectories of shape (N, T, O); a lazy memory-mapped
+            result when `sink` is given.
+        """
+        from qspy.simulation.batch import BatchSimulator
+        from qspy.utils.network_cache import NetworkCache
+
+        initials = kwargs.pop("initials", None)
+        run_kwargs = {
+            k: kwargs.pop(k) for k in ("time_chunk", "sink", "cache") if k in kwargs
+        }
+        key = (
+            NetworkCache.key(self),
+            tuple(sorted((k, repr(v)) for k, v in kwargs.items())),
+        )
+        simulators = self.__dict__.setdefault("_qspy_batch_simulators", {})
+        if key not in simulators:
+            simulators.clear()
+            simulators[key] = BatchSimulator(self, **kwargs)
+        return simulators[key].run(
+            param_matrix,
+            tspan,
+            observables=observables,
+            param_names=param_names,
+            initials=initials,
+            **run_kwargs,
+        )
+
+    def __getstate__(self):
+        """
+        Return the pickling state, dropping process-local caches.
+
+        Returns
+        -------
+        dict
+            Model state for pickling.
+        """
+        state = super().__getstate__()
+        state.pop("_qspy_batch_simulators", None)
+        state.pop("_qspy_unit_checker", None)
+        state.pop("_structural_tree", None)
+        state.pop("_dependency_graph", None)
+        state.pop("_qspy_summary", None)
+        state.pop("_tag_index", None)
+        return state
+
+    @property
+    def summary(self):
+        """
+        Markdown summary of the model, generated on first use.
+
+        The summary memoizes its tables against the model's structural hash, so
+        repeated summaries of an unchanged model are not rebuilt.
+
+        Returns
+        -------
+        qspy.utils.summary.ModelSummary
+            The model's summary.
+        """
+        summary = self.__dict__.get("_qspy_summary")
+        if summary is None:
+            summary = self._qspy_summary = ModelSummary(self)
+        return summary
+
     @log_event(log_args=True)
     def markdown_summary(self, path=SUMMARY_DIR, include_diagram=True):
         """
         Generate a Markdown summary of the model and optionally a diagram.
 
+        The summary is streamed to the file section by section (see
+        `qspy.utils.summary.ModelSummary.write`); tables already memoized by
+        `Model.summary` are reused.
+
         Parameters
         ----------
         path : str or Path, optional
@@ -140,112 +500,10 @@ class Model(Model):
         -------
         None
         """
-        lines = []
-        lines.append(f"# QSPy Model Summary: `{self.name}`\n")
-
-        metadata = self.qspy_metadata
-        lines.append(f"**Model name**: `{self.name}` \n")
-        lines.append(f"**Hash**: \n`{metadata.get('hash', 'N/A')}` \n")
-        lines.append(f"**Version**: {metadata.get('version', 'N/A')} \n")
-        lines.append(f"**Author**: {metadata.get('author', 'N/A')} \n")
-        lines.append(f"**Executed by**: {metadata.get('current_user', 'N/A')} \n")
-        lines.append(
-            f"**Timestamp**: {metadata.get('created_at', datetime.now().isoformat())}\n"
-        )
-
-        if include_diagram and hasattr(self, "mermaid_diagram"):
-            diagram_md = self.mermaid_diagram.markdown_block
-            lines.append("## 🖼️ Model Diagram\n")
-            lines.append(f"{diagram_md}\n")
-
-        # Core units table
-        lines.append("## Core Units\n| Quantity | Unit |")
-        lines.append("|-----------|------|")
-        units = getattr(self, "simulation_units", None)
-        if units:
-            lines.append(f"| Concentration | {units.concentration} |")
-            lines.append(f"| Time         | {units.time} |")
-            lines.append(f"| Volume       | {units.volume} |")
-        else:
-            lines.append("No core model units defined.")
-            lines.append("    They can added with the `Model.with_units` method.")
-
-        # Component counts table
-        lines.append("## Numbers of Model Component\n| Component Type | Count |")
-        lines.append("|---------------|-------|")
-        lines += [
-            f"| Monomers | {len(getattr(self, 'monomers', []))} |",
-            f"| Parameters | {len(getattr(self, 'parameters', []))} |",
-            f"| Expressions | {len(getattr(self, 'expressions', []))} |",
-            f"| Compartments | {len(getattr(self, 'compartments', []))} |",
-            f"| Rules | {len(getattr(self, 'rules', []))} |",
-            f"| Initial Conditions | {len(getattr(self, 'initial_conditions', []))} |",
-            f"| Observables | {len(getattr(self, 'observables', []))} |",
-        ]
-
-        # Compartments table
-        lines.append("\n## Compartments\n| Name | Size |")
-        lines.append("|------|------|")
-        lines += [
-            f"| {cpt.name} | {cpt.size.name if hasattr(cpt.size, 'name') else str(cpt.size)} |"
-            for cpt in getattr(self, "compartments", [])
-        ] or ["| _None_ | _N/A_ |"]
-
-        # Monomers table
-        lines.append("## Monomers\n| Name | Sites | States | Functional Tag |")
-        lines.append("|------|-------|--------|---------------|")
-        lines += [
-            f"| {m.name} | {m.sites} | {m.site_states} | {getattr(m.functional_tag, 'value', m.functional_tag)} |"
-            for m in self.monomers
-        ] or ["| _None_ | _N/A_ | _N/A_ | _N/A_ |"]
-
-        # Parameters table
-        lines.append("\n## Parameters\n| Name | Value | Units |")
-        lines.append("|------|--------|--------|")
-        lines += [
-            f"| {p.name} | {p.value} | {p.unit.to_string()} |" for p in self.parameters
-        ] or ["| _None_ | _N/A_ |"]
-
-        # Expressions table
-        lines.append("\n## Expressions\n| Name | Expression |")
-        lines.append("|------|------------|")
-        lines += [
-            f"| {e.name} | `{e.expr}` |" for e in getattr(self, "expressions", [])
-        ] or ["| _None_ | _N/A_ |"]
-
-        # Initial Conditions table
-        lines.append("\n## Initial Conditions\n| Species | Value | Units |")
-        lines.append("|---------|--------|--------|")
-        lines += [
-            f"| {str(ic[0])} | {ic[1].value if isinstance(ic[1], Parameter) else ic[1].get_value():.2f} | {ic[1].units.value}"
-            for ic in self.initial_conditions
-        ] or ["| _None_ | _N/A_ |"]
-
-        def _sanitize_rule_expression(expr):
-            """
-            Sanitize rule expression for Markdown rendering.
-            Replaces ' | ' with ' \| ' to avoid Markdown table formatting issues.
-            """
-            return repr(expr).replace(" | ", " \| ")
-        # Rules table
-        lines.append("\n## Rules\n| Name | Rule Expression | k_f | k_r | reversible |")
-        lines.append("|------|-----------------|-----|-----|------------|")
-        lines += [
-            f"| {r.name} | `{_sanitize_rule_expression(r.rule_expression)}` | {r.rate_forward.name} | {r.rate_reverse.name if r.rate_reverse is not None else 'None'} | {r.is_reversible} |"
-            for r in self.rules
-        ] or ["| _None_ | _N/A_ | _N/A_ | _N/A_ | _N/A_ |"]
-
-        # Observables table
-        lines.append("\n## Observables\n| Name | Reaction Pattern |")
-        lines.append("|------|------------------|")
-        lines += [
-            f"| {o.name} | `{o.reaction_pattern}` |" for o in self.observables
-        ] or ["| _None_ | _N/A_ |"]
-
-        path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        summary = self.summary
+        summary.path = Path(path)
+        summary.include_diagram = include_diagram
+        summary.write()
 
 
 # patch the MonomerPattern object
@@ -279,85 +537,85 @@ pysb.core.MonomerPattern.__lshift__ = mp_lshift
 pysb.core.ComplexPattern.__lshift__ = mp_lshift
 
 
-translation = str.maketrans(
-    {" ": "", "=": "", "(": "_", ")": "", "*": "", ",": "_", "'": ""}
-)
+# Observable names generated by `~pattern`, memoized per pattern object.
+_OBSERVABLE_NAMES = weakref.WeakKeyDictionary()
+
+
+def _site_token(value):
+    """
+    Return the name fragment for one site condition.
+
+    Parameters
+    ----------
+    value : object
+        A site condition: None, a bond number, a state string, a
+        (state, bond) tuple, a list of bonds, a MultiState, ANY, or WILD.
+
+    Returns
+    -------
+    str
+        Name fragment (bond numbers and states joined by underscores).
+    """
+    if value is None:
+        return "None"
+    if isinstance(value, (str, int)):
+        return str(value)
+    if isinstance(value, (tuple, list)):
+        return "_".join(_site_token(v) for v in value)
+    if isinstance(value, pysb.core.MultiState):
+        return "_".join(_site_token(v) for v in value.sites)
+    return getattr(value, "__name__", None) or repr(value)
 
 
 def _make_mono_string(monopattern):
     """
-    Generate a string representation for a MonomerPattern.
+    Generate a name for a MonomerPattern from its site conditions.
+
+    The name is the monomer name followed by the site conditions in the
+    monomer's site order and the compartment, e.g. ``A(b=1, s='p') ** C`` ->
+    ``A_1_p_C``. Unbound (None) sites are left out when other sites are
+    specified, so ``A(b=None, s='p')`` -> ``A_p`` but ``A(b=None)`` -> ``A_None``.
+    A string is taken to be a name already and is returned unchanged.
 
     Parameters
     ----------
     monopattern : MonomerPattern or str
-        The monomer pattern or its string representation.
+        The monomer pattern, or a name to use as is.
 
     Returns
     -------
     str
         String representation suitable for naming.
-    """
-    if isinstance(monopattern, MonomerPattern):
-        string_repr = repr(monopattern)
-    elif isinstance(monopattern, str):
-        string_repr = monopattern
-    else:
-        raise ValueError(
-            "Input pattern must a MonomerPattern or string representation of one"
-        )
-    # name = "place_holder"
-    # Get the text (if any) inside the parenthesis [e.g., molecule(b=None)]
-    parenthetical = re.search("\((.*)\)", string_repr).group(0).strip("(").strip(")")
-    mono = string_repr.split("(")[0]
-    comp = ""
-    # Get the compartment string if included in the pattern
-    if "**" in string_repr:
-        comp = string_repr.split("**")[1].replace(" ", "")
-    if parenthetical:
-        # Check for bond and state info [(b=None, state='p')]
-        # NOTE - does not account for multiple bonding sites
-        if "," in parenthetical:
-            bond, state = parenthetical.split(",")
-            bond = bond.split("=")[1]
-            state = state.split("'")[1]
-            # print(bond, state)
-            if bond == "None":
-                if comp:
-                    # None bond w/ state and compartment
-                    name = f"{mono}_{state}_{comp}"
-
-                else:
-                    # None bond with state - no compartment
-                    name = f"{mono}_{state}"
-            else:
-                # Include bond, state, and compartment
-                name = f"{mono}_{bond}_{state}_{comp}"
 
-        else:
-            # Get bond or state info when only one is present (not both) [e.g., (b=None) or (state='u')]
-            bond_or_state = parenthetical.split("=")[1].replace("'", "")
-            # print(bond_or_state)
-            if comp:
-                # Bond/state and compartment
-                name = f"{mono}_{bond_or_state}_{comp}"
-            else:
-                # Bond/state - no compartment
-                name = f"{mono}_{bond_or_state}"
-    else:
-        # No bond or state info [e.g., empty parenthesis ()]
-        if comp:
-            # With compartment
-            name = f"{mono}_{comp}"
-        else:
-            # No compartment
-            name = f"{mono}"
-    return name
+    Raises
+    ------
+    ValueError
+        If the input is neither a MonomerPattern nor a string.
+    """
+    if isinstance(monopattern, str):
+        return monopattern
+    if not isinstance(monopattern, MonomerPattern):
+        raise ValueError("Input pattern must a MonomerPattern or a string")
+    conditions = monopattern.site_conditions
+    tokens = [
+        conditions[site]
+        for site in dict.fromkeys(monopattern.monomer.sites)
+        if site in conditions
+    ]
+    if any(token is not None for token in tokens):
+        tokens = [token for token in tokens if token is not None]
+    parts = [monopattern.monomer.name] + [_site_token(token) for token in tokens]
+    if monopattern.compartment is not None:
+        parts.append(monopattern.compartment.name)
+    return "_".join(parts)
 
 
 def _make_complex_string(complexpattern):
     """
-    Generate a string representation for a ComplexPattern.
+    Generate a name for a ComplexPattern of any number of monomers.
+
+    The monomer pattern names (see `_make_mono_string`) are joined in pattern
+    order, followed by the complex's compartment if it has one.
 
     Parameters
     ----------
@@ -369,17 +627,101 @@ def _make_complex_string(complexpattern):
     str
         String representation suitable for naming.
     """
-    string_repr = repr(complexpattern)
-    # Split at the bond operator '%' to
-    # get the left and right-hand monomer patterns.
-    mono_left, mono_right = string_repr.split("%")
-    # Process each monomer pattern:
-    name_left = _make_mono_string(mono_left)
-    name_right = _make_mono_string(mono_right)
-    name = f"{name_left}_{name_right}"
+    parts = [_make_mono_string(mp) for mp in complexpattern.monomer_patterns]
+    if complexpattern.compartment is not None:
+        parts.append(complexpattern.compartment.name)
+    return "_".join(parts)
+
+
+def observable_name(pattern):
+    """
+    Return the auto-generated observable name for a pattern.
+
+    Names are built from the pattern structure (see `_make_mono_string` and
+    `_make_complex_string`) and memoized per pattern object.
+
+    Parameters
+    ----------
+    pattern : MonomerPattern or ComplexPattern
+        The pattern to name.
+
+    Returns
+    -------
+    str
+        The observable name.
+
+    Raises
+    ------
+    ValueError
+        If the input is not a MonomerPattern or ComplexPattern.
+    """
+    name = _OBSERVABLE_NAMES.get(pattern)
+    if name is None:
+        if isinstance(pattern, MonomerPattern):
+            name = _make_mono_string(pattern)
+        elif isinstance(pattern, ComplexPattern):
+            name = _make_complex_string(pattern)
+        else:
+            raise ValueError("Input pattern must be a MonomerPattern or ComplexPattern")
+        _OBSERVABLE_NAMES[pattern] = name
     return name
 
 
+def auto_observables(patterns, match="molecules"):
+    """
+    Create auto-named observables for many patterns in one call.
+
+    All names are generated and checked before any observable is created. The
+    observables are then registered with the model and exported to the calling
+    module in one batch (as with `parameters.from_table`).
+
+    Parameters
+    ----------
+    patterns : iterable of MonomerPattern or ComplexPattern
+        The patterns to observe.
+    match : {"molecules", "species"}, optional
+        Observable match mode (default: "molecules").
+
+    Returns
+    -------
+    list of Observable
+        The new observables, in pattern order.
+
+    Raises
+    ------
+    RuntimeError
+        If no active model is found.
+    pysb.core.ComponentDuplicateNameError
+        If two patterns get the same name or a name is already in use.
+
+    Examples
+    --------
+    >>> auto_observables(A(b=None, s=s) for s in ("u", "p"))
+    [Observable('A_u', A(b=None, s='u')), Observable('A_p', A(b=None, s='p'))]
+    """
+    model = SelfExporter.default_model
+    if model is None:
+        raise RuntimeError("No active model found. Did you instantiate a Model()?")
+    patterns = list(patterns)
+    names = [observable_name(pattern) for pattern in patterns]
+    seen = set()
+    for name in names:
+        if name in seen or model.has_component(name):
+            raise pysb.core.ComponentDuplicateNameError(
+                f"Observable name '{name}' is already in use"
+            )
+        seen.add(name)
+    observables = [
+        Observable(name, pattern, match=match, _export=False)
+        for name, pattern in zip(names, patterns)
+    ]
+    for observable in observables:
+        model.add_component(observable)
+    if SelfExporter.do_export and SelfExporter.target_globals is not None:
+        SelfExporter.target_globals.update({o.name: o for o in observables})
+    return observables
+
+
 # Make observable definition availabe with
 # the iversion '~' prefix operator and an
 # auto generated name based on the monomer or complex
@@ -396,17 +738,9 @@ def mp_invert(self):
     Returns
     -------
     Observable
-        Observable object with an auto-generated name.
+        Observable object with an auto-generated name (see `observable_name`).
     """
-
-    if isinstance(self, MonomerPattern):
-        name = _make_mono_string(self)
-
-    elif isinstance(self, ComplexPattern):
-        name = _make_complex_string(self)
-
-    # name = 'gooo'
-    return Observable(name, self)
+    return Observable(observable_name(self), self)
 
 
 pysb.core.MonomerPattern.__invert__ = mp_invert
@@ -474,12 +808,35 @@ class Monomer(Monomer):
         *args, **kwargs
             Arguments passed to the PySB Monomer constructor.
         """
-        self.functional_tag = FunctionalTag(
-            "None", "None"
-        )  # Default to no functional tag
+        self.functional_tag = NO_TAG  # Default to no functional tag
         super().__init__(*args, **kwargs)
         return
 
+    @property
+    def functional_tag(self):
+        """
+        The monomer's functional tag (NO_TAG if untagged).
+
+        Setting it updates the functional-tag index of the monomer's model.
+
+        Returns
+        -------
+        FunctionalTag
+            The monomer's functional tag.
+        """
+        return self.__dict__.get("_functional_tag", NO_TAG)
+
+    @functional_tag.setter
+    def functional_tag(self, tag):
+        old = self.__dict__.get("_functional_tag")
+        self.__dict__["_functional_tag"] = tag
+        model_ref = self.__dict__.get("model")
+        model = model_ref() if model_ref is not None else None
+        if old is not tag and model is not None:
+            notify = getattr(model, "_functional_tag_changed", None)
+            if notify is not None:
+                notify(self)
+
     def __matmul__(self, other: Enum):
         """
         Attach a functional tag to the monomer using the '@' operator.
@@ -495,9 +852,7 @@ class Monomer(Monomer):
             The monomer instance with the functional tag set.
         """
         if isinstance(other, Enum):
-            ftag_str = other.value
-            ftag = FunctionalTag(*FunctionalTag.parse(ftag_str))
-            setattr(self, "functional_tag", ftag)
+            setattr(self, "functional_tag", FunctionalTag.of(other))
         return self
 
     def __imatmul__(self, other: Enum):
@@ -515,9 +870,7 @@ class Monomer(Monomer):
             The monomer instance with the functional tag set.
         """
         if isinstance(other, Enum):
-            ftag_str = other.value
-            ftag = FunctionalTag(*FunctionalTag.parse(ftag_str))
-            setattr(self, "functional_tag", ftag)
+            setattr(self, "functional_tag", FunctionalTag.of(other))
         return self
 
     def __repr__(self):
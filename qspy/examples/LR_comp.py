@@ -5,6 +5,7 @@
 # Adapted from the LR_comp.bngl model at https://github.com/RuleWorld/BNGTutorial/blob/master/CBNGL/LR_comp.bngl
 
 from qspy import *
+from qspy import ModelChecker, ModelMermaidDiagrammer, ModelMetadataTracker
 from pysb.units import set_molecule_volume
 
 Model().with_units(concentration="molecules", time="s", volume="um**3")
@@ -10,7 +10,7 @@ introspection, and validation of model entities.
 
 Classes and Enums
 -----------------
-- FunctionalTag : Dataclass for representing and parsing functional tags.
+- FunctionalTag : Interned, immutable class/function tag (flyweight).
 - PROTEIN       : Enum of common protein roles (e.g., ligand, receptor, kinase).
 - DRUG          : Enum of drug roles (e.g., inhibitor, agonist, antibody).
 - RNA           : Enum of RNA roles (e.g., messenger, micro, siRNA).
@@ -24,6 +24,11 @@ Functions
 ---------
 - prefixer : Utility to construct canonical tag strings from class and function labels.
 
+Attributes
+----------
+- ENUM_TAGS : Precomputed mapping from each built-in Enum member to its interned tag.
+- NO_TAG    : The tag of untagged monomers (``None::None``).
+
 Examples
 --------
 >>> from qspy.functionaltags import FunctionalTag, PROTEIN
@@ -36,10 +41,12 @@ Examples
 
 >>> FunctionalTag.parse("drug::inhibitor")
 ('drug', 'inhibitor')
+
+>>> FunctionalTag.of(PROTEIN.KINASE) is ENUM_TAGS[PROTEIN.KINASE]
+True
 """
 
 from enum import Enum
-from dataclasses import dataclass
 
 __all__ = [
     "PROTEIN",
@@ -91,7 +98,6 @@ def prefixer(function: str, prefix: str, sep: str = TAG_SEP):
     return "".join([prefix, sep, function])
 
 
-@dataclass(frozen=True)
 class FunctionalTag:
     """
     Represents a functional tag for labeling monomers with semantic class/function metadata.
@@ -100,6 +106,12 @@ class FunctionalTag:
     subclass or functional role (e.g., 'ligand', 'receptor'). These tags enable semantic annotation
     of model components to support introspection, filtering, and validation workflows.
 
+    Tags are immutable flyweights: constructing a tag with the same class and
+    function always returns the same interned instance, so equality and hashing
+    are by identity. The tag for each Enum member is computed once
+    (`FunctionalTag.of`, `ENUM_TAGS`), so comparing a tag with an Enum member is
+    a dictionary lookup rather than a string parse.
+
     Parameters
     ----------
     class_ : str
@@ -109,15 +121,21 @@ class FunctionalTag:
 
     Attributes
     ----------
+    class_ : str
+        The molecular class label.
+    function : str
+        The functional or subclass label.
     value : str
-        The canonical string representation of the tag (e.g., "protein__receptor").
+        The canonical string representation of the tag (e.g., "protein::receptor").
         This is derived by prefixing the function with its class using the defined separator.
 
     Methods
     -------
     __eq__(other)
-        Compares functional tags by class and function. Supports comparison with
+        Compares functional tags by identity. Supports comparison with
         other FunctionalTag instances or Enum-based tag values.
+    of(member : Enum) -> FunctionalTag
+        Returns the interned tag of an Enum member.
     parse(prefix_tag : str) -> Tuple[str, str]
         Parses a canonical tag string into its (class, function) components.
 
@@ -126,36 +144,98 @@ class FunctionalTag:
     >>> tag = FunctionalTag("protein", "ligand")
     >>> tag.value
     'protein::ligand'
+    >>> tag is FunctionalTag.of(PROTEIN.LIGAND)
+    True
 
     >>> FunctionalTag.parse("rna::micro")
     ('rna', 'micro')
     """
 
-    class_: str
-    function: str
+    __slots__ = ("class_", "function", "value", "__weakref__")
+
+    # (class_, function) -> interned tag
+    _interned = {}
+    # Enum member -> interned tag
+    _members = {}
+
+    def __new__(cls, class_, function):
+        tag = cls._interned.get((class_, function))
+        if tag is None:
+            tag = super().__new__(cls)
+            object.__setattr__(tag, "class_", class_)
+            object.__setattr__(tag, "function", function)
+            object.__setattr__(tag, "value", prefixer(function, class_))
+            # setdefault is atomic, so concurrent constructions agree on one tag.
+            tag = cls._interned.setdefault((class_, function), tag)
+        return tag
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"cannot assign to field '{name}' of an immutable FunctionalTag"
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            f"cannot delete field '{name}' of an immutable FunctionalTag"
+        )
 
     def __eq__(self, other):
         if isinstance(other, FunctionalTag):
-            return (self.class_, self.function) == (other.class_, other.function)
+            return self is other
         elif isinstance(other, Enum):
-            return (self.class_, self.function) == self.parse(other.value)
+            try:
+                return self is FunctionalTag.of(other)
+            except ValueError:
+                return False
         else:
             return False
 
-    @property
-    def value(self):
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return f"FunctionalTag(class_={self.class_!r}, function={self.function!r})"
+
+    def __reduce__(self):
+        # Unpickled tags are re-interned.
+        return (FunctionalTag, (self.class_, self.function))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def of(cls, member):
         """
-        str: The canonical string representation of the functional tag.
+        Return the interned tag of an Enum member.
 
-        Returns the tag as a string in the format "<class>::<function>", e.g., "protein::ligand".
+        The member's value is parsed only the first time it is looked up.
+
+        Parameters
+        ----------
+        member : Enum
+            Enum member whose value is a canonical tag string (e.g., PROTEIN.LIGAND).
+
+        Returns
+        -------
+        FunctionalTag
+            The member's tag.
+
+        Raises
+        ------
+        ValueError
+            If the member's value is not a canonical tag string.
 
         Examples
         --------
-        >>> tag = FunctionalTag("protein", "ligand")
-        >>> tag.value
-        'protein::ligand'
+        >>> FunctionalTag.of(DRUG.INHIBITOR)
+        FunctionalTag(class_='drug', function='inhibitor')
         """
-        return prefixer(self.function, self.class_)
+        tag = cls._members.get(member)
+        if tag is None:
+            tag = cls._members.setdefault(member, cls(*cls.parse(member.value)))
+        return tag
 
     @staticmethod
     def parse(prefix_tag: str):
@@ -181,6 +261,10 @@ class FunctionalTag:
         return class_, function
 
 
+# Tag of monomers without a functional tag.
+NO_TAG = FunctionalTag("None", "None")
+
+
 # === Protein roles ===
 PROTEIN_PREFIX = "protein"
 
@@ -544,6 +628,14 @@ class NANOPARTICLE(Enum):
     THERANOSTIC = prefixer("theranostic", NANOPARTICLE_PREFIX)
 
 
+# Interned tag of every built-in tag member, computed once at import.
+ENUM_TAGS = {
+    member: FunctionalTag.of(member)
+    for enum in (PROTEIN, DRUG, RNA, DNA, METABOLITE, LIPID, ION, NANOPARTICLE)
+    for member in enum
+}
+
+
 # # === Rate constant orders ===
 # RATE_PREFIX = "rate_constant"
 
@@ -0,0 +1,38 @@
+"""
+QSPy Simulation Subpackage
+==========================
+
+This subpackage provides simulation tools for QSPy models that go beyond the
+single-run `simulate` function re-exported from `pysb.pkpd`.
+
+Modules
+-------
+- batch : Vectorized batch simulation for parameter sweeps.
+- cache : Disk-backed, LRU-evicted cache of simulation results.
+- population : Process-pool population runner with shared-memory results.
+- results : Memory-mapped on-disk result sink with lazy read-back.
+
+Classes
+-------
+- BatchSimulator
+- PopulationSimulator
+- ResultCache
+- SimulationResult
+- TrajectoryWriter
+"""
+
+from qspy.simulation.batch import BatchSimulator, simulate_batch
+from qspy.simulation.cache import ResultCache
+from qspy.simulation.population import PopulationSimulator, simulate_population
+from qspy.simulation.results import SimulationResult, TrajectoryWriter, open_result
+
+__all__ = [
+    "BatchSimulator",
+    "simulate_batch",
+    "ResultCache",
+    "PopulationSimulator",
+    "simulate_population",
+    "SimulationResult",
+    "TrajectoryWriter",
+    "open_result",
+]
@@ -0,0 +1,599 @@
+"""
+QSPy Batch Simulation
+=====================
+
+This module provides vectorized batch simulation of a model over many parameter
+sets, as needed for dose-ranging and sensitivity sweeps. The reaction network and
+the compiled ODE right-hand side are built once and reused for every parameter
+set, and observables are written straight into a single (N x T x O) NumPy array
+instead of N separate trajectory objects.
+
+Observables are computed with a sparse (O x S) species-to-observable projection.
+With ``time_chunk=k`` each run is integrated k output points at a time and every
+chunk is projected as soon as the solver returns it, so at most k species rows
+are held in memory at once instead of the full (T x S) trajectory. With
+``sink=path`` the (N x T x O) result is written to a memory-mapped ``.npy`` file
+under `RESULTS_DIR` instead of memory (see `qspy.simulation.results`). With
+``cache=True`` (or a `qspy.simulation.cache.ResultCache`) rows already simulated
+with the same model, parameters, initial conditions, time grid, and solver
+options are loaded from the on-disk result cache instead of being integrated.
+
+The outputs are selected before the run, by observable name or by functional
+tag (e.g. ``observables=[DRUG, PROTEIN.RECEPTOR]``), and only the selected
+observable columns are allocated.
+
+Classes
+-------
+BatchSimulator : Reusable batch simulator bound to one model.
+
+Functions
+---------
+parameter_matrix : Expand a partial parameter specification into a full matrix.
+resolve_outputs : Resolve an output specification (names or functional tags) to observables.
+observable_projection : Build the sparse (O x S) species-to-observable projection.
+observable_matrix : Build the dense (S x O) species-to-observable weight matrix.
+integrate_observables : Integrate one parameter set and return only its observables.
+simulate_batch : Simulate a model for every row of a parameter matrix.
+
+Examples
+--------
+>>> sweep = {"kf": np.logspace(-2, 2, 1000)}
+>>> out = model.simulate_batch(sweep, tspan=np.linspace(0, 24, 97), observables=["AB"])
+>>> out.shape
+(1000, 97, 1)
+>>> model.simulate_batch(sweep, tspan, observables=[DRUG]).shape
+(1000, 97, 2)
+>>> model.simulate_batch(sweep, tspan, time_chunk=16).shape  # project as it integrates
+(1000, 97, 5)
+"""
+
+import logging
+from collections.abc import Mapping
+from enum import Enum
+
+import numpy as np
+import pysb.core
+import scipy.sparse
+from pysb.simulator import ScipyOdeSimulator
+from pysb.simulator.scipyode import _integrator_process
+
+from qspy.config import LOGGER_NAME
+from qspy.functionaltags import FunctionalTag
+from qspy.simulation.cache import ResultCache
+from qspy.simulation.results import TrajectoryWriter
+from qspy.utils.logging import ensure_qspy_logging, log_event
+from qspy.utils.network_cache import generate_equations
+from qspy.utils.tag_index import model_tag_index
+
+
+def parameter_matrix(model, param_matrix, param_names=None):
+    """
+    Expand a partial parameter specification into a full (N x P) matrix.
+
+    Columns not given in `param_matrix` are filled with the model's nominal
+    parameter values, in `model.parameters` order.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model whose parameters are being set.
+    param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+        Parameter values keyed by `Parameter` name. Mappings and DataFrames map
+        names to length-N columns (scalars are broadcast); structured arrays
+        use their field names; plain 2D arrays need `param_names`, unless they
+        already have one column per model parameter.
+    param_names : list of str, optional
+        Column names for a plain 2D array.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (N, len(model.parameters)).
+
+    Raises
+    ------
+    ValueError
+        If a name is not a model parameter or the column shapes are inconsistent.
+    """
+    names = [p.name for p in model.parameters]
+    index = {name: i for i, name in enumerate(names)}
+
+    if hasattr(param_matrix, "columns") and hasattr(param_matrix, "to_numpy"):
+        # pandas.DataFrame
+        columns = {
+            str(c): param_matrix[c].to_numpy(dtype=float) for c in param_matrix.columns
+        }
+    elif isinstance(param_matrix, Mapping):
+        columns = {k: np.asarray(v, dtype=float) for k, v in param_matrix.items()}
+    else:
+        array = np.asarray(param_matrix)
+        if array.dtype.names is not None:
+            columns = {k: np.asarray(array[k], dtype=float) for k in array.dtype.names}
+        else:
+            array = np.atleast_2d(np.asarray(array, dtype=float))
+            if param_names is None:
+                if array.shape[1] != len(names):
+                    raise ValueError(
+                        "param_names must be given unless param_matrix has one "
+                        f"column per model parameter ({len(names)})"
+                    )
+                param_names = names
+            if len(param_names) != array.shape[1]:
+                raise ValueError(
+                    f"param_matrix has {array.shape[1]} columns but "
+                    f"{len(param_names)} param_names were given"
+                )
+            columns = dict(zip(param_names, array.T))
+
+    unknown = [k for k in columns if k not in index]
+    if unknown:
+        raise ValueError(f"Unknown model parameters in param_matrix: {unknown}")
+    lengths = {np.size(v) for v in columns.values() if np.ndim(v) > 0}
+    if len(lengths) > 1:
+        raise ValueError(f"param_matrix columns have inconsistent lengths: {lengths}")
+    n_sims = lengths.pop() if lengths else 1
+
+    full = np.tile(np.array([p.value for p in model.parameters], dtype=float), (n_sims, 1))
+    for name, column in columns.items():
+        full[:, index[name]] = column
+    return full
+
+
+def resolve_outputs(model, observables=None):
+    """
+    Resolve an output specification to the observables it selects.
+
+    Each entry is an `Observable`, an observable name, or a functional-tag query
+    (a tag Enum member such as ``PROTEIN.RECEPTOR``, a tag Enum class such as
+    ``DRUG``, a `FunctionalTag`, or a ``"class::function"``/``"class"`` string).
+    Tag queries select every observable whose pattern involves a monomer with
+    the tag (see `qspy.utils.tag_index.TagIndex.observables`). Names take
+    precedence over tag strings.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model being simulated.
+    observables : list, or a single entry, optional
+        The output specification (default: all model observables).
+
+    Returns
+    -------
+    list of pysb.Observable
+        The selected observables, without duplicates, in specification order.
+
+    Raises
+    ------
+    ValueError
+        If an entry selects no observables.
+
+    Examples
+    --------
+    >>> [obs.name for obs in resolve_outputs(model, [DRUG, "R_free"])]
+    ['Drug_total', 'RD', 'R_free']
+    """
+    if observables is None:
+        return list(model.observables)
+    if isinstance(observables, (str, Enum, FunctionalTag, pysb.core.Observable)) or (
+        isinstance(observables, type) and issubclass(observables, Enum)
+    ):
+        observables = [observables]
+    selected = {}
+    for entry in observables:
+        if isinstance(entry, pysb.core.Observable):
+            found = [entry]
+        else:
+            found = None
+            if isinstance(entry, str):
+                try:
+                    found = [model.observables[entry]]
+                except KeyError:
+                    pass
+            if found is None:
+                found = model_tag_index(model).observables(entry)
+            if not found:
+                raise ValueError(f"Output specification {entry!r} selects no observables")
+        for obs in found:
+            selected.setdefault(obs.name, obs)
+    return list(selected.values())
+
+
+def observable_projection(model, observables=None):
+    """
+    Build the sparse (O x S) species-to-observable projection.
+
+    Each observable is a weighted sum of species, so row j holds the
+    coefficients of observable j and ``projection @ y`` maps a species vector to
+    the observable values.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        Model with a generated reaction network.
+    observables : list of str, Observable, or tag query, optional
+        Output specification, in output order (default: all model observables);
+        see `resolve_outputs`.
+
+    Returns
+    -------
+    tuple of (scipy.sparse.csr_matrix, list of str)
+        The projection matrix and the observable names for its rows.
+    """
+    selected = resolve_outputs(model, observables)
+    rows, cols, coefficients = [], [], []
+    for j, obs in enumerate(selected):
+        rows.extend([j] * len(obs.species))
+        cols.extend(obs.species)
+        coefficients.extend(obs.coefficients)
+    # Duplicate (row, species) entries are summed on conversion to CSR.
+    projection = scipy.sparse.coo_matrix(
+        (np.asarray(coefficients, dtype=float), (rows, cols)),
+        shape=(len(selected), len(model.species)),
+    ).tocsr()
+    return projection, [obs.name for obs in selected]
+
+
+def observable_matrix(model, observables=None):
+    """
+    Build the dense (S x O) species-to-observable weight matrix.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        Model with a generated reaction network.
+    observables : list of str, Observable, or tag query, optional
+        Output specification, in output order (default: all model observables);
+        see `resolve_outputs`.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, list of str)
+        The weight matrix and the observable names for its columns.
+    """
+    projection, names = observable_projection(model, observables)
+    return projection.T.toarray(), names
+
+
+def _result_cache(cache):
+    """Return the ResultCache for a `cache` argument (None when disabled)."""
+    if cache is None or cache is False:
+        return None
+    return ResultCache() if cache is True else cache
+
+
+def integrate_observables(
+    initial_values,
+    param_values,
+    tspan,
+    projection,
+    integrator_name,
+    integrator_opts,
+    rhs_builder,
+    time_chunk=None,
+    out=None,
+):
+    """
+    Integrate one parameter set and return only its observable trajectories.
+
+    With `time_chunk`, the time grid is integrated in segments of `time_chunk`
+    output points, each restarted from the final state of the previous segment.
+    Every segment is projected onto the observables as soon as the solver
+    returns it and then dropped, so peak memory is (time_chunk x S) species
+    values instead of (T x S). Restarting the solver at segment boundaries
+    changes the results only within the integrator tolerances.
+
+    Parameters
+    ----------
+    initial_values : numpy.ndarray
+        Initial species values.
+    param_values : numpy.ndarray
+        Full parameter vector (including derived parameters).
+    tspan : numpy.ndarray
+        Output time points.
+    projection : scipy.sparse.csr_matrix
+        (O x S) projection from `observable_projection`.
+    integrator_name : str
+        SciPy integrator name.
+    integrator_opts : dict
+        SciPy integrator options.
+    rhs_builder : pysb.simulator.scipyode.RhsBuilder
+        Compiled RHS builder.
+    time_chunk : int, optional
+        Output points per solver segment; None integrates the whole grid at once.
+    out : numpy.ndarray, optional
+        (T x O) array (e.g., a row of a memory-mapped result) to write each
+        segment into as it is projected.
+
+    Returns
+    -------
+    numpy.ndarray
+        Observable trajectories of shape (T, O) (`out`, if given).
+    """
+    n_times = len(tspan)
+    if not time_chunk or n_times <= 1:
+        segments = [(0, n_times)]
+    else:
+        step = max(1, int(time_chunk))
+        # Consecutive segments share their boundary point, which carries the state.
+        segments = [(i, min(i + step, n_times - 1) + 1) for i in range(0, n_times - 1, step)]
+    if out is None:
+        out = np.empty((n_times, projection.shape[0]))
+    state = initial_values
+    for start, stop in segments:
+        species = _integrator_process(
+            state,
+            param_values,
+            tspan=tspan[start:stop],
+            integrator_name=integrator_name,
+            integrator_opts=integrator_opts,
+            rhs_builder=rhs_builder,
+        )
+        out[start:stop] = (projection @ species.T).T
+        state = species[-1]
+    return out
+
+
+class BatchSimulator:
+    """
+    Reusable batch simulator bound to one model.
+
+    The reaction network is generated (or loaded from the network cache) and the
+    ODE right-hand side is compiled once on construction; every call to `run`
+    reuses them.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to simulate.
+    integrator : str, optional
+        SciPy integrator name (default: "lsoda").
+    compiler : str, optional
+        PySB RHS compiler ("cython" or "python"); None selects automatically.
+    **integrator_options
+        Options passed to the SciPy integrator.
+
+    Attributes
+    ----------
+    model : pysb.Model
+        The model being simulated.
+    simulator : pysb.simulator.ScipyOdeSimulator
+        Simulator holding the compiled RHS.
+
+    Methods
+    -------
+    run(param_matrix, tspan, observables=None, param_names=None, initials=None, ...)
+        Simulate every parameter set and return observables as an (N x T x O) array.
+    """
+
+    def __init__(self, model, integrator="lsoda", compiler=None, **integrator_options):
+        """
+        Initialize the BatchSimulator.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model to simulate.
+        integrator : str, optional
+            SciPy integrator name (default: "lsoda").
+        compiler : str, optional
+            PySB RHS compiler ("cython" or "python"); None selects automatically.
+        **integrator_options
+            Options passed to the SciPy integrator.
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.model = model
+        self.integrator = integrator
+        generate_equations(model)
+        self.simulator = ScipyOdeSimulator(
+            model,
+            integrator=integrator,
+            compiler=compiler,
+            integrator_options=integrator_options,
+        )
+        # Accessing `rhs_fn` compiles the RHS; do it now so the compilation
+        # isn't charged to the first run.
+        _ = self.simulator.rhs_builder.rhs_fn
+
+    def prepare(self, param_matrix, tspan, param_names=None, initials=None):
+        """
+        Resolve per-simulation parameter and initial-condition vectors.
+
+        Parameters
+        ----------
+        param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+            Parameter values keyed by `Parameter` name; see `parameter_matrix`.
+        tspan : array_like
+            Output time points.
+        param_names : list of str, optional
+            Column names for a plain 2D `param_matrix`.
+        initials : array_like or dict, optional
+            Initial conditions, in any form accepted by PySB simulators.
+
+        Returns
+        -------
+        tuple of (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            Time points, (N x P') parameter vectors, and (N x S) initial conditions.
+        """
+        tspan = np.asarray(tspan, dtype=float)
+        params = parameter_matrix(self.model, param_matrix, param_names)
+        self.simulator.tspan = tspan
+        self.simulator.param_values = params
+        self.simulator.initials = initials
+        try:
+            param_values = np.array(self.simulator.param_values, dtype=float)
+            initial_values = np.array(self.simulator.initials, dtype=float)
+        finally:
+            self.simulator.param_values = None
+            self.simulator.initials = None
+        if len(initial_values) == 1 and len(param_values) > 1:
+            initial_values = np.repeat(initial_values, len(param_values), axis=0)
+        return tspan, param_values, initial_values
+
+    def integrate(self, tspan, param_values, initial_values):
+        """
+        Integrate the model for one parameter set.
+
+        Parameters
+        ----------
+        tspan : numpy.ndarray
+            Output time points.
+        param_values : numpy.ndarray
+            Full parameter vector (including derived parameters).
+        initial_values : numpy.ndarray
+            Initial species values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Species trajectory of shape (T, S).
+        """
+        return _integrator_process(
+            initial_values,
+            param_values,
+            tspan=tspan,
+            integrator_name=self.integrator,
+            integrator_opts=self.simulator.opts,
+            rhs_builder=self.simulator.rhs_builder,
+        )
+
+    def cache_options(self, time_chunk=None):
+        """
+        Solver settings that the result-cache key depends on.
+
+        Parameters
+        ----------
+        time_chunk : int, optional
+            Output points per solver segment.
+
+        Returns
+        -------
+        dict
+            Integrator name and options, and the time chunking.
+        """
+        return {
+            "integrator": self.integrator,
+            "integrator_opts": self.simulator.opts,
+            "time_chunk": time_chunk,
+        }
+
+    @log_event()
+    def run(
+        self,
+        param_matrix,
+        tspan,
+        observables=None,
+        param_names=None,
+        initials=None,
+        time_chunk=None,
+        sink=None,
+        cache=None,
+    ):
+        """
+        Simulate every parameter set and return observables as an (N x T x O) array.
+
+        Species trajectories are projected onto the observables with a sparse
+        projection and are never stored; see `integrate_observables`.
+
+        Parameters
+        ----------
+        param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+            Parameter values keyed by `Parameter` name; see `parameter_matrix`.
+        tspan : array_like
+            Output time points.
+        observables : list of str, Observable, or tag query, optional
+            Observables to return, in output order (default: all); see
+            `resolve_outputs`.
+        param_names : list of str, optional
+            Column names for a plain 2D `param_matrix`.
+        initials : array_like or dict, optional
+            Initial conditions, in any form accepted by PySB simulators.
+        time_chunk : int, optional
+            Output points per solver segment; None integrates each run in one go.
+        sink : str or Path, optional
+            ``.npy`` file (relative paths under `RESULTS_DIR`) to stream the
+            result into instead of memory.
+        cache : bool or ResultCache, optional
+            Load previously simulated rows from (and store new rows in) a
+            `qspy.simulation.cache.ResultCache`; True uses the default cache.
+
+        Returns
+        -------
+        numpy.ndarray or SimulationResult
+            Observable trajectories of shape (N, T, O); a lazy
+            `qspy.simulation.results.SimulationResult` when `sink` is given.
+        """
+        tspan, param_values, initial_values = self.prepare(
+            param_matrix, tspan, param_names=param_names, initials=initials
+        )
+        projection, names = observable_projection(self.model, observables)
+        shape = (len(param_values), len(tspan), len(names))
+        writer = None
+        if sink is not None:
+            writer = TrajectoryWriter(sink, shape[0], tspan, names, model=self.model)
+            out = writer.array
+        else:
+            out = np.empty(shape)
+        cache = _result_cache(cache)
+        rows = range(shape[0])
+        if cache is not None:
+            run_key = cache.run_key(self.model, tspan, names, self.cache_options(time_chunk))
+            keys, rows = cache.lookup(run_key, param_values, initial_values, out)
+        for i in rows:
+            integrate_observables(
+                initial_values[i],
+                param_values[i],
+                tspan,
+                projection,
+                self.integrator,
+                self.simulator.opts,
+                self.simulator.rhs_builder,
+                time_chunk=time_chunk,
+                out=out[i],
+            )
+        if cache is not None:
+            cache.store(run_key, keys, out, rows)
+        self.logger.info(
+            f"[QSPy] Batch simulation complete: {len(param_values)} parameter sets, "
+            f"observables {names}"
+        )
+        return writer.close() if writer is not None else out
+
+
+def simulate_batch(model, param_matrix, tspan, observables=None, **kwargs):
+    """
+    Simulate a model for every row of a parameter matrix.
+
+    Convenience wrapper that builds a one-off `BatchSimulator`. Use
+    `Model.simulate_batch` to reuse the compiled simulator across calls.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to simulate.
+    param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+        Parameter values keyed by `Parameter` name; see `parameter_matrix`.
+    tspan : array_like
+        Output time points.
+    observables : list of str, Observable, or tag query, optional
+        Observables to return, in output order (default: all); see
+        `resolve_outputs`.
+    **kwargs
+        `param_names`, `initials`, `time_chunk`, `sink` and `cache` are passed to
+        `BatchSimulator.run`; all other keyword arguments configure the
+        `BatchSimulator`.
+
+    Returns
+    -------
+    numpy.ndarray or SimulationResult
+        Observable trajectories of shape (N, T, O), or the stored result when
+        `sink` is given.
+    """
+    run_kwargs = {
+        k: kwargs.pop(k)
+        for k in ("param_names", "initials", "time_chunk", "sink", "cache")
+        if k in kwargs
+    }
+    return BatchSimulator(model, **kwargs).run(
+        param_matrix, tspan, observables=observables, **run_kwargs
+    )
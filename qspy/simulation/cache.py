@@ -0,0 +1,422 @@
+"""
+QSPy Simulation Result Cache
+============================
+
+This module provides a persistent, size-bounded cache of simulation results.
+Each batch or population row is keyed by the model's structural hash, the
+observables returned, the time grid, the solver options, and the row's full
+parameter and initial-condition vectors. The rows a run integrates are stored
+together as one block under `RESULT_CACHE_DIR`: an uncompressed (n x T x O)
+``.npy`` array of observable trajectories and a ``.keys`` file listing the row
+keys in the same order. Repeated runs of the same model and parameter sets
+(e.g., re-executed notebooks or CI jobs) load the stored rows instead of
+integrating them again, and sweeps that overlap an earlier one only integrate
+the new rows.
+
+Block files are named after the run key, so a lookup only opens the blocks of
+its own run and copies the matching rows out of a read-only memory map, and the
+number of files grows with the number of runs rather than the number of rows.
+The cache enforces a byte budget with least-recently-used eviction of whole
+blocks. Each hit refreshes the block's modification time, so recency survives
+across processes without a separate index, and blocks are written to temporary
+files and atomically moved into place (as in `qspy.utils.network_cache`).
+
+Classes
+-------
+ResultCache : On-disk, LRU-evicted cache of simulation results, one block per run.
+
+Examples
+--------
+>>> cache = ResultCache(max_bytes=2**30)
+>>> out = model.simulate_batch(sweep, tspan, cache=cache)  # integrates
+>>> out = model.simulate_batch(sweep, tspan, cache=cache)  # loads from disk
+>>> cache.stats()
+{'hits': 1000, 'misses': 1000, 'stores': 1000, 'evictions': 0, 'hit_rate': 0.5}
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import qspy.config
+from qspy.config import LOGGER_NAME
+from qspy.utils.hashing import NETWORK_KINDS, structural_hash
+from qspy.utils.logging import ensure_qspy_logging
+
+
+class ResultCache:
+    """
+    On-disk, LRU-evicted cache of simulation results, one block per run.
+
+    Parameters
+    ----------
+    cache_dir : str or Path, optional
+        Directory holding cached results (default: RESULT_CACHE_DIR at call time).
+    max_bytes : int, optional
+        Size budget; least-recently-used blocks are evicted beyond it
+        (default: RESULT_CACHE_MAX_BYTES at call time).
+
+    Attributes
+    ----------
+    cache_dir : Path
+        Directory holding cached results.
+    max_bytes : int
+        Size budget in bytes.
+    hits, misses, stores, evictions : int
+        Row counters for this cache instance (`evictions` counts blocks).
+
+    Methods
+    -------
+    run_key(model, tspan, names, options)
+        Compute the key shared by every row of one run.
+    key(run_key, param_values, initial_values)
+        Compute the key of one row.
+    lookup(run_key, param_values, initial_values, out)
+        Fill the cached rows of a run and return the rows still to simulate.
+    store(run_key, keys, out, rows=None, evict=True)
+        Atomically write rows of a run as one block and evict beyond the budget.
+    size()
+        Total size of the cached results in bytes.
+    evict()
+        Remove least-recently-used blocks until the cache fits its budget.
+    stats()
+        Hit/miss statistics.
+    clear()
+        Remove all cached results.
+    """
+
+    suffix = ".npy"
+    keys_suffix = ".keys"
+    # Rows copied into a block file per step, bounding the memory a store needs.
+    copy_rows = 256
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        """
+        Initialize the ResultCache.
+
+        Parameters
+        ----------
+        cache_dir : str or Path, optional
+            Directory holding cached results (default: RESULT_CACHE_DIR at call
+            time).
+        max_bytes : int, optional
+            Size budget in bytes (default: RESULT_CACHE_MAX_BYTES at call time).
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        if cache_dir is None:
+            cache_dir = qspy.config.RESULT_CACHE_DIR
+        if max_bytes is None:
+            max_bytes = qspy.config.RESULT_CACHE_MAX_BYTES
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._clock = 0
+
+    @staticmethod
+    def run_key(model, tspan, names, options):
+        """
+        Compute the key shared by every row of one run.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The simulated model.
+        tspan : numpy.ndarray
+            Output time points.
+        names : list of str
+            Observables returned, in column order.
+        options : dict
+            Solver options that affect the result (integrator name and options,
+            time chunking).
+
+        Returns
+        -------
+        str
+            Hex digest identifying the model structure, outputs, and solver setup.
+        """
+        digest = hashlib.sha256()
+        digest.update(structural_hash(model, kinds=NETWORK_KINDS).encode())
+        digest.update(repr(list(names)).encode())
+        digest.update(np.ascontiguousarray(tspan, dtype=float).tobytes())
+        digest.update(repr(sorted(options.items())).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(run_key, param_values, initial_values):
+        """
+        Compute the key of one row.
+
+        Parameters
+        ----------
+        run_key : str
+            Key from `run_key`.
+        param_values : numpy.ndarray
+            Full parameter vector of the row.
+        initial_values : numpy.ndarray
+            Initial species values of the row.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the row's result.
+        """
+        digest = hashlib.sha256(run_key.encode())
+        digest.update(np.ascontiguousarray(param_values, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(initial_values, dtype=float).tobytes())
+        return digest.hexdigest()
+
+    def path(self, run_key, keys):
+        """
+        Path of the block file holding a run's rows.
+
+        Parameters
+        ----------
+        run_key : str
+            Key from `run_key`.
+        keys : list of str
+            Row keys stored in the block, in row order.
+
+        Returns
+        -------
+        Path
+            Location of the block's `.npy` file; its keys file sits next to it.
+        """
+        digest = hashlib.sha256("\n".join(keys).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{run_key}-{digest}{self.suffix}"
+
+    def _keys_path(self, path):
+        """Return the keys file of a block."""
+        return path.with_suffix(self.keys_suffix)
+
+    def _remove(self, path):
+        """Delete a block and its keys file."""
+        path.unlink(missing_ok=True)
+        self._keys_path(path).unlink(missing_ok=True)
+
+    def _touch(self, path):
+        """Mark a block as most recently used."""
+        # Strictly increasing stamps keep the LRU order exact on coarse clocks.
+        self._clock = max(time.time_ns(), self._clock + 1)
+        os.utime(path, ns=(self._clock, self._clock))
+
+    def _blocks(self, run_key):
+        """Return the block files stored for a run."""
+        if not self.cache_dir.exists():
+            return []
+        return sorted(self.cache_dir.glob(f"{run_key}-*{self.suffix}"))
+
+    def _write_tmp(self, prefix, write):
+        """Write a temporary file in the cache directory and return its path."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=prefix, suffix=".tmp")
+        try:
+            os.close(fd)
+            write(tmp_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return tmp_path
+
+    def lookup(self, run_key, param_values, initial_values, out):
+        """
+        Fill the rows of `out` that are cached.
+
+        Only the blocks of this run are opened, and matching rows are copied
+        out of a read-only memory map of each block.
+
+        Parameters
+        ----------
+        run_key : str
+            Key from `run_key`.
+        param_values : numpy.ndarray
+            (N x P') parameter vectors.
+        initial_values : numpy.ndarray
+            (N x S) initial conditions.
+        out : numpy.ndarray
+            (N x T x O) result array; cached rows are written into it.
+
+        Returns
+        -------
+        tuple of (list of str, numpy.ndarray)
+            The row keys and the indices of the rows that still need simulating.
+        """
+        keys, rows = [], {}
+        for i, (p, y0) in enumerate(zip(param_values, initial_values)):
+            keys.append(self.key(run_key, p, y0))
+            rows.setdefault(keys[-1], []).append(i)
+        found = np.zeros(len(keys), dtype=bool)
+        for path in self._blocks(run_key):
+            if not rows:
+                break
+            try:
+                block_keys = self._keys_path(path).read_text(encoding="utf-8").split()
+                values = np.load(path, mmap_mode="r", allow_pickle=False)
+                if len(values) != len(block_keys):
+                    raise ValueError(f"{len(values)} rows for {len(block_keys)} keys")
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                # Treat unreadable blocks as misses and let them be rewritten.
+                self.logger.warning(f"[QSPy] Discarding unreadable cached results {path}: {e}")
+                self._remove(path)
+                continue
+            hit = False
+            for j, key in enumerate(block_keys):
+                for i in rows.pop(key, ()):
+                    out[i] = values[j]
+                    found[i] = True
+                    hit = True
+            del values
+            if hit:
+                self._touch(path)
+        missing = np.flatnonzero(~found)
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        return keys, missing
+
+    def store(self, run_key, keys, out, rows=None, evict=True):
+        """
+        Atomically write rows of a run as one block and evict beyond the budget.
+
+        Parameters
+        ----------
+        run_key : str
+            Key from `run_key`.
+        keys : list of str
+            Row keys of `out`, as returned by `lookup`.
+        out : numpy.ndarray
+            (N x T x O) result array.
+        rows : array_like of int, optional
+            Rows of `out` to store (default: all).
+        evict : bool, optional
+            Enforce the size budget now (default: True).
+
+        Returns
+        -------
+        Path or None
+            Location of the block's `.npy` file (None if there was nothing to store).
+        """
+        rows = np.arange(len(keys)) if rows is None else np.asarray(rows, dtype=int)
+        if not len(rows):
+            return None
+        block_keys = [keys[i] for i in rows]
+        path = self.path(run_key, block_keys)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        prefix = f".{path.stem[:16]}-"
+
+        def write_values(tmp_path):
+            shape = (len(rows),) + tuple(out.shape[1:])
+            values = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=float, shape=shape)
+            for start in range(0, len(rows), self.copy_rows):
+                stop = start + self.copy_rows
+                values[start:stop] = out[rows[start:stop]]
+            values.flush()
+            del values
+
+        def write_keys(tmp_path):
+            Path(tmp_path).write_text("\n".join(block_keys) + "\n", encoding="utf-8")
+
+        # The keys file goes in first, so a visible block always has its keys.
+        keys_tmp = self._write_tmp(prefix, write_keys)
+        try:
+            values_tmp = self._write_tmp(prefix, write_values)
+        except BaseException:
+            Path(keys_tmp).unlink(missing_ok=True)
+            raise
+        os.replace(keys_tmp, self._keys_path(path))
+        os.replace(values_tmp, path)
+        self._touch(path)
+        self.stores += len(rows)
+        if evict:
+            self.evict()
+        return path
+
+    def _entries(self):
+        """Return (mtime_ns, size, path) for every cached block."""
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.suffix):
+                path = Path(entry.path)
+                try:
+                    st = entry.stat()
+                    size = st.st_size + self._keys_path(path).stat().st_size
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime_ns, size, path))
+        return entries
+
+    def size(self):
+        """
+        Total size of the cached results in bytes.
+
+        Returns
+        -------
+        int
+            Bytes used by the cache.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Remove least-recently-used blocks until the cache fits its budget.
+
+        Scans one directory entry per stored run, not per row.
+
+        Returns
+        -------
+        int
+            Number of blocks removed.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        if removed:
+            self.evictions += removed
+            self.logger.debug(f"[QSPy] Evicted {removed} cached simulation result blocks")
+        return removed
+
+    def stats(self):
+        """
+        Hit/miss statistics for this cache instance.
+
+        Returns
+        -------
+        dict
+            Counts of row hits, misses, and stores, block evictions, and the
+            hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """
+        Remove all cached results.
+
+        Returns
+        -------
+        None
+        """
+        for _, _, path in self._entries():
+            self._remove(path)
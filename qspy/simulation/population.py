@@ -0,0 +1,569 @@
+"""
+QSPy Population Simulation
+==========================
+
+This module provides a process-pool runner for virtual-population simulations.
+The model, reaction network, and compiled ODE right-hand side are built once in
+the parent process. Per-subject parameter and initial-condition vectors, the
+species-to-observable weights live in `multiprocessing.shared_memory`, and each
+task gets its own shared (rows x T x O) output block, so tasks only carry a row
+range and workers write observables straight into shared memory instead of
+pickling trajectories back through pipes. The parent copies each block into the
+result as soon as its chunk finishes and frees it, so peak memory stays at one
+result plus the chunks in flight. Each worker projects species trajectories onto
+the observables with a sparse projection (optionally one time chunk at a time,
+see `qspy.simulation.batch.integrate_observables`) and never stores them.
+With ``sink=path`` the result is a memory-mapped ``.npy`` file instead, and
+workers write their rows straight to it. With ``cache=...``
+rows found in the result cache are filled in by the parent and skipped by the
+workers.
+
+On Linux the pool uses the "fork" start method and workers inherit the compiled
+simulator from the parent, so nothing model-related is pickled at all. On other
+platforms the compiled RHS builder is sent once per worker at start-up.
+
+Rows are split into fixed-size, contiguous chunks that depend only on the number
+of subjects and the chunk size, so scheduling (and the result layout) is
+deterministic regardless of which worker finishes first.
+
+Worker log records are sent to the parent over a queue (`parallel_logging`), so
+only the parent writes and rotates the QSPy log file.
+
+Classes
+-------
+PopulationSimulator : Process-pool population runner bound to one model.
+
+Functions
+---------
+chunk_ranges : Split N rows into deterministic contiguous chunks.
+simulate_population : Simulate a virtual population with a one-off runner.
+
+Examples
+--------
+>>> runner = PopulationSimulator(model, max_workers=8)
+>>> out = runner.run({"CL": cl_samples, "V": v_samples}, tspan, observables=["Cp"])
+>>> out.shape
+(100000, 97, 1)
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory, util
+
+import numpy as np
+import scipy.sparse
+
+from qspy.config import LOGGER_NAME
+from qspy.simulation.batch import (
+    BatchSimulator,
+    _result_cache,
+    integrate_observables,
+    observable_matrix,
+)
+from qspy.simulation.results import TrajectoryWriter, _memmap_trajectories
+from qspy.utils.logging import (
+    configure_worker_logging,
+    ensure_qspy_logging,
+    log_event,
+    parallel_logging,
+)
+
+# Compiled RHS builder inherited by forked workers (set only while a run is active).
+_PARENT_RHS_BUILDER = None
+# Per-worker state: shared-memory handles and array views.
+_WORKER = {}
+
+
+def chunk_ranges(n_rows, chunk_size):
+    """
+    Split N rows into deterministic contiguous chunks.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows (subjects).
+    chunk_size : int
+        Maximum number of rows per chunk.
+
+    Returns
+    -------
+    list of tuple of (int, int)
+        Half-open (start, stop) row ranges covering all rows in order.
+    """
+    chunk_size = max(1, int(chunk_size))
+    return [(i, min(i + chunk_size, n_rows)) for i in range(0, n_rows, chunk_size)]
+
+
+def _share(array):
+    """
+    Copy an array into a new shared-memory block.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Array to share.
+
+    Returns
+    -------
+    tuple of (SharedMemory, dict)
+        The shared-memory block and a picklable spec to re-attach to it.
+    """
+    array = np.ascontiguousarray(array, dtype=float)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=float, buffer=shm.buf)[...] = array
+    return shm, {"name": shm.name, "shape": array.shape}
+
+
+def _attach(spec):
+    """
+    Attach to a shared-memory block (or memory-mapped file) described by a spec.
+
+    Parameters
+    ----------
+    spec : dict
+        Spec returned by `_share`, or ``{"path": ...}`` for a ``.npy`` file.
+
+    Returns
+    -------
+    tuple of (SharedMemory or None, numpy.ndarray)
+        The shared-memory handle (None for a file) and an array view onto it.
+    """
+    if "path" in spec:
+        return None, _memmap_trajectories(spec["path"], mode="r+")
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    return shm, np.ndarray(spec["shape"], dtype=float, buffer=shm.buf)
+
+
+def _close_worker():
+    """Drop the worker's array views and close its shared-memory handles."""
+    handles = _WORKER.get("handles", [])
+    _WORKER.clear()
+    for shm in handles:
+        shm.close()
+
+
+def _init_worker(
+    specs, tspan, integrator, integrator_opts, rhs_builder, log_config, time_chunk=None
+):
+    """
+    Initialize a population worker process.
+
+    Parameters
+    ----------
+    specs : dict
+        Shared-memory specs for "params", "initials", and "weights", and
+        optionally a "todo" row mask and an "out" file spec for a sink.
+    tspan : numpy.ndarray
+        Output time points.
+    integrator : str
+        SciPy integrator name.
+    integrator_opts : dict
+        SciPy integrator options.
+    rhs_builder : pysb.simulator.scipyode.RhsBuilder or None
+        Compiled RHS builder; None when inherited from a forked parent.
+    log_config : dict
+        Worker logging config from `parallel_logging`.
+    time_chunk : int, optional
+        Output points per solver segment; None integrates each row in one go.
+    """
+    configure_worker_logging(log_config)
+
+    _WORKER.clear()
+    _WORKER["handles"] = []
+    for key, spec in specs.items():
+        shm, view = _attach(spec)
+        if shm is not None:
+            _WORKER["handles"].append(shm)
+        _WORKER[key] = view
+    _WORKER["tspan"] = tspan
+    _WORKER["integrator"] = integrator
+    _WORKER["integrator_opts"] = integrator_opts
+    _WORKER["rhs_builder"] = rhs_builder if rhs_builder is not None else _PARENT_RHS_BUILDER
+    _WORKER["projection"] = scipy.sparse.csr_matrix(_WORKER["weights"].T)
+    _WORKER["time_chunk"] = time_chunk
+    # Pool workers leave through os._exit, which skips atexit but runs these.
+    util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _run_chunk(start, stop, out_spec=None):
+    """
+    Simulate rows [start, stop) and write their observables to shared memory.
+
+    Parameters
+    ----------
+    start : int
+        First row of the chunk.
+    stop : int
+        One past the last row of the chunk.
+    out_spec : dict, optional
+        Spec of the chunk's own (rows x T x O) output block; None writes into
+        the worker's "out" sink instead.
+
+    Returns
+    -------
+    tuple of (int, int)
+        The processed row range.
+    """
+    params, initials = _WORKER["params"], _WORKER["initials"]
+    todo = _WORKER.get("todo")
+    if out_spec is None:
+        shm, out, offset = None, _WORKER["out"], 0
+    else:
+        (shm, out), offset = _attach(out_spec), start
+    try:
+        for i in range(start, stop):
+            if todo is not None and not todo[i]:
+                continue
+            integrate_observables(
+                initials[i],
+                params[i],
+                _WORKER["tspan"],
+                _WORKER["projection"],
+                _WORKER["integrator"],
+                _WORKER["integrator_opts"],
+                _WORKER["rhs_builder"],
+                time_chunk=_WORKER["time_chunk"],
+                out=out[i - offset],
+            )
+    finally:
+        # Release the view before closing the block it points into.
+        out = None
+        if shm is not None:
+            shm.close()
+    logging.getLogger(LOGGER_NAME).debug("[QSPy] Simulated rows %d-%d", start, stop)
+    return start, stop
+
+
+def _default_mp_context():
+    """
+    Return the preferred multiprocessing context for population runs.
+
+    Returns
+    -------
+    multiprocessing.context.BaseContext
+        The "fork" context on Linux, otherwise the platform default.
+    """
+    if sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+class PopulationSimulator:
+    """
+    Process-pool population runner bound to one model.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to simulate.
+    max_workers : int, optional
+        Number of worker processes (default: `os.cpu_count()`).
+    chunk_size : int, optional
+        Rows per task; None picks about four chunks per worker.
+    mp_context : multiprocessing context, optional
+        Context for the process pool (default: "fork" on Linux).
+    integrator : str, optional
+        SciPy integrator name (default: "lsoda").
+    compiler : str, optional
+        PySB RHS compiler ("cython" or "python"); None selects automatically.
+    **integrator_options
+        Options passed to the SciPy integrator.
+
+    Attributes
+    ----------
+    batch : BatchSimulator
+        Batch simulator holding the compiled RHS.
+    max_workers : int
+        Number of worker processes.
+    chunk_size : int or None
+        Rows per task.
+
+    Methods
+    -------
+    run(param_matrix, tspan, observables=None, param_names=None, initials=None, ...)
+        Simulate every subject and return observables as an (N x T x O) array.
+    """
+
+    def __init__(
+        self,
+        model,
+        max_workers=None,
+        chunk_size=None,
+        mp_context=None,
+        integrator="lsoda",
+        compiler=None,
+        **integrator_options,
+    ):
+        """
+        Initialize the PopulationSimulator.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model to simulate.
+        max_workers : int, optional
+            Number of worker processes (default: `os.cpu_count()`).
+        chunk_size : int, optional
+            Rows per task; None picks about four chunks per worker.
+        mp_context : multiprocessing context, optional
+            Context for the process pool (default: "fork" on Linux).
+        integrator : str, optional
+            SciPy integrator name (default: "lsoda").
+        compiler : str, optional
+            PySB RHS compiler ("cython" or "python"); None selects automatically.
+        **integrator_options
+            Options passed to the SciPy integrator.
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.batch = BatchSimulator(
+            model, integrator=integrator, compiler=compiler, **integrator_options
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.mp_context = mp_context or _default_mp_context()
+
+    @property
+    def model(self):
+        """
+        The model being simulated.
+
+        Returns
+        -------
+        pysb.Model
+            The bound model.
+        """
+        return self.batch.model
+
+    def _dispatch(self, specs, tspan, time_chunk, chunks, forked, out=None, todo=None):
+        """
+        Run the row chunks on the process pool.
+
+        Without `out`, workers write into the "out" sink in `specs`. Otherwise
+        each chunk gets its own shared output block, which is copied into `out`
+        and freed as soon as that chunk finishes.
+
+        Parameters
+        ----------
+        specs : dict
+            Shared-memory specs passed to `_init_worker`.
+        tspan : numpy.ndarray
+            Output time points.
+        time_chunk : int or None
+            Output points per solver segment.
+        chunks : list of tuple of (int, int)
+            Row ranges from `chunk_ranges`.
+        forked : bool
+            Whether workers inherit the compiled RHS from the parent.
+        out : numpy.ndarray, optional
+            (N x T x O) result to copy the chunk blocks into.
+        todo : numpy.ndarray, optional
+            Row mask of the rows to simulate; the other rows of `out` are kept.
+        """
+        blocks = {}
+        with parallel_logging(mp_context=self.mp_context) as log_config:
+            initargs = (
+                specs,
+                tspan,
+                self.batch.integrator,
+                self.batch.simulator.opts,
+                None if forked else self.batch.simulator.rhs_builder,
+                log_config,
+                time_chunk,
+            )
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks)) or 1,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=initargs,
+            ) as executor:
+                futures = []
+                try:
+                    for start, stop in chunks:
+                        spec = None
+                        if out is not None:
+                            # Pages are only committed once a worker writes them.
+                            shape = (stop - start,) + out.shape[1:]
+                            nbytes = max(int(np.prod(shape)) * out.itemsize, 1)
+                            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+                            blocks[start, stop] = shm
+                            spec = {"name": shm.name, "shape": shape}
+                        futures.append(executor.submit(_run_chunk, start, stop, spec))
+                    for future in as_completed(futures):
+                        start, stop = future.result()
+                        if out is None:
+                            continue
+                        shm = blocks.pop((start, stop))
+                        block = np.ndarray(
+                            (stop - start,) + out.shape[1:], dtype=float, buffer=shm.buf
+                        )
+                        rows = slice(None) if todo is None else todo[start:stop] > 0
+                        out[start:stop][rows] = block[rows]
+                        block = None
+                        shm.close()
+                        shm.unlink()
+                finally:
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=True)
+                    for shm in blocks.values():
+                        shm.close()
+                        shm.unlink()
+
+    @log_event()
+    def run(
+        self,
+        param_matrix,
+        tspan,
+        observables=None,
+        param_names=None,
+        initials=None,
+        time_chunk=None,
+        sink=None,
+        cache=None,
+    ):
+        """
+        Simulate every subject and return observables as an (N x T x O) array.
+
+        Parameters
+        ----------
+        param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+            (N x P) parameter values keyed by `Parameter` name.
+        tspan : array_like
+            Output time points.
+        observables : list of str, Observable, or tag query, optional
+            Observables to return, in output order (default: all); see
+            `qspy.simulation.batch.resolve_outputs`.
+        param_names : list of str, optional
+            Column names for a plain 2D `param_matrix`.
+        initials : array_like or dict, optional
+            Initial conditions, in any form accepted by PySB simulators.
+        time_chunk : int, optional
+            Output points per solver segment; None integrates each row in one go.
+        sink : str or Path, optional
+            ``.npy`` file (relative paths under `RESULTS_DIR`) that workers
+            write the result into instead of shared memory.
+        cache : bool or ResultCache, optional
+            Load previously simulated rows from (and store new rows in) a
+            `qspy.simulation.cache.ResultCache`; True uses the default cache.
+
+        Returns
+        -------
+        numpy.ndarray or SimulationResult
+            Observable trajectories of shape (N, T, O); a lazy
+            `qspy.simulation.results.SimulationResult` when `sink` is given.
+        """
+        global _PARENT_RHS_BUILDER
+
+        tspan, params, initial_values = self.batch.prepare(
+            param_matrix, tspan, param_names=param_names, initials=initials
+        )
+        weights, names = observable_matrix(self.model, observables)
+        n_rows = len(params)
+        chunk_size = self.chunk_size or -(-n_rows // (self.max_workers * 4))
+        chunks = chunk_ranges(n_rows, chunk_size)
+        forked = self.mp_context.get_start_method() == "fork"
+
+        shape = (n_rows, len(tspan), len(names))
+        cache = _result_cache(cache)
+        writer = None
+        todo = None
+        blocks = []
+        try:
+            specs = {}
+            shared = [("params", params), ("initials", initial_values), ("weights", weights)]
+            if sink is not None:
+                writer = TrajectoryWriter(sink, n_rows, tspan, names, model=self.model)
+                specs["out"] = {"path": str(writer.path)}
+                result = writer.array
+            else:
+                result = np.zeros(shape)
+            for key, array in shared:
+                shm, specs[key] = _share(array)
+                blocks.append(shm)
+
+            missing = np.arange(n_rows)
+            if cache is not None:
+                run_key = cache.run_key(
+                    self.model, tspan, names, self.batch.cache_options(time_chunk)
+                )
+                keys, missing = cache.lookup(run_key, params, initial_values, result)
+                todo = np.zeros(n_rows)
+                todo[missing] = 1.0
+                shm, specs["todo"] = _share(todo)
+                blocks.append(shm)
+            if writer is not None:
+                writer.flush()
+
+            _PARENT_RHS_BUILDER = self.batch.simulator.rhs_builder if forked else None
+            if len(missing):
+                if todo is not None:
+                    # Chunks served entirely from the cache aren't dispatched.
+                    chunks = [(a, b) for a, b in chunks if todo[a:b].any()]
+                self._dispatch(
+                    specs,
+                    tspan,
+                    time_chunk,
+                    chunks,
+                    forked,
+                    out=None if writer is not None else result,
+                    todo=todo,
+                )
+
+            if cache is not None:
+                cache.store(run_key, keys, result, missing)
+            if writer is not None:
+                result = None
+                out = writer.close()
+            else:
+                out = result
+        finally:
+            _PARENT_RHS_BUILDER = None
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+        self.logger.info(
+            f"[QSPy] Population simulation complete: {n_rows} subjects in "
+            f"{len(chunks)} chunks on {self.max_workers} workers"
+        )
+        return out
+
+
+def simulate_population(model, param_matrix, tspan, observables=None, **kwargs):
+    """
+    Simulate a virtual population with a one-off `PopulationSimulator`.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to simulate.
+    param_matrix : Mapping, numpy.ndarray, or pandas.DataFrame
+        (N x P) parameter values keyed by `Parameter` name.
+    tspan : array_like
+        Output time points.
+    observables : list of str, Observable, or tag query, optional
+        Observables to return, in output order (default: all); see
+        `qspy.simulation.batch.resolve_outputs`.
+    **kwargs
+        `param_names`, `initials`, `time_chunk`, `sink` and `cache` are passed to
+        `PopulationSimulator.run`; all other keyword arguments configure the
+        `PopulationSimulator`.
+
+    Returns
+    -------
+    numpy.ndarray or SimulationResult
+        Observable trajectories of shape (N, T, O), or the stored result when
+        `sink` is given.
+    """
+    run_kwargs = {
+        k: kwargs.pop(k)
+        for k in ("param_names", "initials", "time_chunk", "sink", "cache")
+        if k in kwargs
+    }
+    return PopulationSimulator(model, **kwargs).run(
+        param_matrix, tspan, observables=observables, **run_kwargs
+    )
@@ -0,0 +1,351 @@
+"""
+QSPy Simulation Results on Disk
+===============================
+
+This module provides a file-backed result sink for batch and population
+simulations whose (N x T x O) observable arrays do not fit in memory. The
+result array is preallocated as a ``.npy`` file and memory-mapped, so the
+simulators write each row (and each time chunk of a row) straight to disk. A
+small JSON header next to it records the observable names, their units, and the
+time grid.
+
+The file is stored observable-major, as an (O x N x T) array, so each
+observable's trajectories are one contiguous slab; writers and readers see it
+through an (N x T x O) view. Results are read back lazily: `SimulationResult`
+memory-maps the ``.npy`` file read-only, and ``result["Bound"]`` is a zero-copy
+(N x T) view of that slab, so reading one observable only reads its own pages
+from disk.
+
+Classes
+-------
+TrajectoryWriter : Preallocated, memory-mapped sink for observable trajectories.
+SimulationResult : Lazy, read-only view of a stored simulation result.
+
+Functions
+---------
+open_result : Open a stored simulation result.
+
+Examples
+--------
+>>> result = model.simulate_batch(sweep, tspan, sink="dose_sweep.npy")
+>>> result.names
+['Bound', 'Free']
+>>> result["Bound"].shape  # memmap view, nothing copied
+(100000, 2881)
+>>> final = open_result(".qspy/results/dose_sweep.npy")["Bound"][:, -1]
+"""
+
+import json
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+import qspy.config
+from qspy.config import QSPY_VERSION
+
+RESULT_FORMAT = "qspy-trajectories"
+RESULT_LAYOUT = "observable-major"
+
+
+def _header_path(path):
+    """Return the JSON header path for a ``.npy`` result file."""
+    return Path(path).with_suffix(".json")
+
+
+def _observable_units(model, names):
+    """Return the unit string of each named observable (None if unitless)."""
+    units = {}
+    for name in names:
+        obs = model.observables[name] if model is not None else None
+        unit = getattr(obs, "units", None) if getattr(obs, "has_units", False) else None
+        units[name] = getattr(unit, "value", None)
+    return units
+
+
+def _memmap_trajectories(path, mode="r"):
+    """
+    Memory-map a stored (O x N x T) result file as an (N x T x O) view.
+
+    Parameters
+    ----------
+    path : str or Path
+        The ``.npy`` result file.
+    mode : str, optional
+        Memory-map mode, e.g. "r" or "r+" (default: "r").
+
+    Returns
+    -------
+    numpy.memmap
+        (N x T x O) view of the file.
+    """
+    return np.load(path, mmap_mode=mode).transpose(1, 2, 0)
+
+
+class TrajectoryWriter:
+    """
+    Preallocated, memory-mapped sink for observable trajectories.
+
+    The result is created as an observable-major (O x N x T) ``.npy`` file on
+    construction and exposed as an (N x T x O) view, so rows can be written in
+    any order (e.g., by several worker processes mapping the file with
+    `_memmap_trajectories`) without ever holding the whole result in memory.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path of the ``.npy`` file; relative paths are placed under `results_dir`.
+    n_rows : int
+        Number of simulations (N).
+    tspan : array_like
+        Output time points (T).
+    names : list of str
+        Observable names (O), in column order.
+    model : pysb.Model, optional
+        Model the observables belong to; used for the model name and units.
+    results_dir : str or Path, optional
+        Directory for relative paths (default: `RESULTS_DIR` at call time).
+
+    Attributes
+    ----------
+    path : Path
+        The ``.npy`` result file.
+    header_path : Path
+        The JSON header file.
+    header : dict
+        Observable names, units, time grid, and array layout.
+    array : numpy.memmap
+        Writable (N x T x O) view of the (O x N x T) result file.
+
+    Methods
+    -------
+    write(rows, values, times=slice(None))
+        Write observable values into a block of rows and time points.
+    flush()
+        Flush written data to disk.
+    close()
+        Flush, mark the result complete, and return it as a `SimulationResult`.
+    """
+
+    def __init__(self, path, n_rows, tspan, names, model=None, results_dir=None):
+        """
+        Create the result file and its header.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the ``.npy`` file; relative paths are placed under `results_dir`.
+        n_rows : int
+            Number of simulations (N).
+        tspan : array_like
+            Output time points (T).
+        names : list of str
+            Observable names (O), in column order.
+        model : pysb.Model, optional
+            Model the observables belong to; used for the model name and units.
+        results_dir : str or Path, optional
+            Directory for relative paths (default: `RESULTS_DIR` at call time).
+        """
+        path = Path(path)
+        if not path.is_absolute():
+            if results_dir is None:
+                results_dir = qspy.config.RESULTS_DIR
+            path = Path(results_dir) / path
+        self.path = path.with_suffix(".npy")
+        self.header_path = _header_path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tspan = np.asarray(tspan, dtype=float)
+        names = list(names)
+        sim_units = getattr(model, "simulation_units", None)
+        self.header = {
+            "format": RESULT_FORMAT,
+            "qspy_version": QSPY_VERSION,
+            "model": getattr(model, "name", None),
+            "created_at": datetime.now().isoformat(),
+            "complete": False,
+            "shape": [int(n_rows), len(tspan), len(names)],
+            "layout": RESULT_LAYOUT,
+            "dtype": "float64",
+            "observables": names,
+            "units": _observable_units(model, names),
+            "time_units": getattr(sim_units, "time", None),
+            "tspan": tspan.tolist(),
+        }
+        n_rows, n_times, n_obs = self.header["shape"]
+        self._file = np.lib.format.open_memmap(
+            self.path, mode="w+", dtype=float, shape=(n_obs, n_rows, n_times)
+        )
+        self.array = self._file.transpose(1, 2, 0)
+        self._write_header()
+
+    def _write_header(self):
+        """Write the JSON header next to the result file."""
+        self.header_path.write_text(json.dumps(self.header, indent=2), encoding="utf-8")
+
+    def write(self, rows, values, times=slice(None)):
+        """
+        Write observable values into a block of rows and time points.
+
+        Parameters
+        ----------
+        rows : int or slice
+            Simulation row(s) to write.
+        values : numpy.ndarray
+            Observable values, broadcastable to ``array[rows, times]``.
+        times : int or slice, optional
+            Time points to write (default: all).
+        """
+        self.array[rows, times] = values
+
+    def flush(self):
+        """Flush written data to disk."""
+        self._file.flush()
+
+    def close(self):
+        """
+        Flush the data, mark the result complete, and reopen it read-only.
+
+        Returns
+        -------
+        SimulationResult
+            Lazy view of the stored result.
+        """
+        self.flush()
+        self.header["complete"] = True
+        self._write_header()
+        del self.array, self._file
+        return SimulationResult(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if hasattr(self, "array"):
+            self.flush()
+
+
+class SimulationResult(Mapping):
+    """
+    Lazy, read-only view of a stored simulation result.
+
+    Behaves as a read-only mapping from observable name to a zero-copy
+    (N x T) memory-mapped view of that observable's trajectories, which is
+    contiguous on disk.
+
+    Parameters
+    ----------
+    path : str or Path
+        The ``.npy`` result file (its JSON header is found next to it).
+
+    Attributes
+    ----------
+    path : Path
+        The ``.npy`` result file.
+    header : dict
+        The JSON header.
+    names : list of str
+        Observable names, in column order.
+    units : dict
+        Unit string (or None) of each observable.
+    tspan : numpy.ndarray
+        Output time points.
+    data : numpy.memmap
+        Read-only (N x T x O) view of the (O x N x T) result file.
+    """
+
+    def __init__(self, path):
+        """
+        Open a stored result.
+
+        Parameters
+        ----------
+        path : str or Path
+            The ``.npy`` result file.
+
+        Raises
+        ------
+        ValueError
+            If the header does not describe an observable-major QSPy trajectory file.
+        """
+        self.path = Path(path).with_suffix(".npy")
+        self.header = json.loads(_header_path(self.path).read_text(encoding="utf-8"))
+        if self.header.get("format") != RESULT_FORMAT:
+            raise ValueError(f"{self.path} is not a QSPy trajectory file")
+        if self.header.get("layout") != RESULT_LAYOUT:
+            raise ValueError(f"{self.path} does not use the {RESULT_LAYOUT} layout")
+        self.names = list(self.header["observables"])
+        self.units = dict(self.header["units"])
+        self.tspan = np.asarray(self.header["tspan"], dtype=float)
+        self._columns = {name: j for j, name in enumerate(self.names)}
+        self._data = None
+
+    @property
+    def data(self):
+        """
+        Read-only (N x T x O) memory map of the result, opened on first use.
+
+        Returns
+        -------
+        numpy.memmap
+            The result array (a view of the observable-major file).
+        """
+        if self._data is None:
+            self._data = _memmap_trajectories(self.path)
+        return self._data
+
+    @property
+    def shape(self):
+        """
+        The (N, T, O) shape of the result.
+
+        Returns
+        -------
+        tuple of int
+            The result shape.
+        """
+        return tuple(self.header["shape"])
+
+    @property
+    def complete(self):
+        """
+        Whether the writer finished (False for interrupted runs).
+
+        Returns
+        -------
+        bool
+            True if the writer was closed.
+        """
+        return bool(self.header.get("complete"))
+
+    def __getitem__(self, name):
+        """Return the (N x T) memory-mapped trajectories of one observable."""
+        # `data` is a transposed view; its (O x N x T) base is indexed directly
+        # so the returned view is one contiguous slab of the file.
+        return self.data.base[self._columns[name]]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"SimulationResult('{self.path}', shape={self.shape}, observables={self.names})"
+
+
+def open_result(path):
+    """
+    Open a stored simulation result.
+
+    Parameters
+    ----------
+    path : str or Path
+        The ``.npy`` result file.
+
+    Returns
+    -------
+    SimulationResult
+        Lazy view of the stored result.
+    """
+    return SimulationResult(path)
@@ -0,0 +1,399 @@
+"""
+QSPy Model Dependency Graph
+===========================
+
+This module provides an incrementally maintained dependency graph of a model's
+components. Nodes are components (initials are labeled by their species
+pattern) and an edge ``A -> B`` means that ``A`` references ``B``:
+
+- rules reference the monomers and compartments in their reactant and product
+  patterns and their forward/reverse rate parameters or expressions;
+- initials reference the monomers and compartments in their pattern and their
+  value;
+- observables reference the monomers and compartments in their pattern;
+- expressions reference the parameters, expressions, and observables in their
+  sympy expression;
+- compartments reference their parent compartment and size;
+- energy patterns reference the monomers in their pattern and their energy.
+
+Components are registered as they are added to a `qspy.core.Model` and their
+edges are resolved lazily on the next query (PySB adds some components to the
+model before their constructors finish), so each component's references are
+walked once. The `ModelChecker` usage checks are answered from the graph.
+
+Classes
+-------
+DependencyGraph : Incrementally maintained component dependency graph.
+
+Functions
+---------
+model_graph : Return the dependency graph for a model.
+
+Examples
+--------
+>>> graph = model.dependency_graph
+>>> graph.dependents("kp1")
+['Ab_total', 'bind']
+>>> graph.unreferenced("monomers", by=("initials",))
+['B']
+"""
+
+import threading
+
+import pysb.core
+
+from qspy.utils.hashing import COMPONENT_KINDS, _MUTABLE_KINDS, _kind_of, _leaf_label, _leaf_token
+
+# Kinds whose references can change after they are added (parameters have none).
+_EDITABLE_KINDS = tuple(kind for kind in _MUTABLE_KINDS if kind != "parameters")
+
+
+def _pattern_refs(pattern):
+    """
+    Yield the monomers and compartments referenced by a pattern.
+
+    Parameters
+    ----------
+    pattern : MonomerPattern, ComplexPattern, ReactionPattern, or None
+        The pattern.
+
+    Yields
+    ------
+    pysb.Monomer or pysb.Compartment
+        Referenced components (possibly repeated).
+    """
+    if pattern is None:
+        return
+    if isinstance(pattern, pysb.core.ReactionPattern):
+        complex_patterns = pattern.complex_patterns
+    elif isinstance(pattern, pysb.core.ComplexPattern):
+        complex_patterns = [pattern]
+    elif isinstance(pattern, pysb.core.MonomerPattern):
+        complex_patterns = [pysb.core.as_complex_pattern(pattern)]
+    else:
+        return
+    for cp in complex_patterns:
+        if cp.compartment is not None:
+            yield cp.compartment
+        for mp in cp.monomer_patterns:
+            yield mp.monomer
+            if mp.compartment is not None:
+                yield mp.compartment
+
+
+def _symbol_refs(value):
+    """
+    Yield the components referenced by a rate, value, size, or sympy expression.
+
+    Parameters
+    ----------
+    value : pysb.Component, sympy.Expr, number, or None
+        The referenced value.
+
+    Yields
+    ------
+    pysb.Component
+        Referenced components.
+    """
+    if value is None:
+        return
+    if isinstance(value, pysb.core.Component):
+        yield value
+        return
+    for symbol in getattr(value, "free_symbols", ()):
+        if isinstance(symbol, pysb.core.Component):
+            yield symbol
+
+
+def references(component):
+    """
+    Return the components directly referenced by a component.
+
+    Parameters
+    ----------
+    component : pysb.Component or pysb.Initial
+        The component.
+
+    Returns
+    -------
+    list
+        Referenced components, without duplicates, in first-seen order.
+    """
+    refs = []
+    if isinstance(component, pysb.core.Rule):
+        refs.extend(_pattern_refs(component.rule_expression.reactant_pattern))
+        refs.extend(_pattern_refs(component.rule_expression.product_pattern))
+        refs.extend(_symbol_refs(component.rate_forward))
+        refs.extend(_symbol_refs(component.rate_reverse))
+    elif isinstance(component, pysb.core.Initial):
+        refs.extend(_pattern_refs(component.pattern))
+        refs.extend(_symbol_refs(component.value))
+    elif isinstance(component, pysb.core.Observable):
+        refs.extend(_pattern_refs(component.reaction_pattern))
+    elif isinstance(component, pysb.core.Expression):
+        refs.extend(_symbol_refs(component.expr))
+    elif isinstance(component, pysb.core.Compartment):
+        refs.extend(_symbol_refs(component.parent))
+        refs.extend(_symbol_refs(component.size))
+    elif isinstance(component, pysb.core.EnergyPattern):
+        refs.extend(_pattern_refs(component.pattern))
+        refs.extend(_symbol_refs(component.energy))
+    return list({id(ref): ref for ref in refs}.values())
+
+
+class DependencyGraph:
+    """
+    Incrementally maintained component dependency graph.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model whose components the graph tracks.
+
+    Attributes
+    ----------
+    model : pysb.Model
+        The tracked model.
+
+    Methods
+    -------
+    add(component)
+        Register a new component.
+    invalidate()
+        Rebuild every edge on the next query (after a rename or edit).
+    dependencies(name, recursive=False)
+        Components a component references.
+    dependents(name, recursive=True)
+        Components that reference a component.
+    unreferenced(kind, by=None)
+        Components of one kind that nothing (of the given kinds) references.
+    kind(name)
+        Component kind of a node.
+    edges()
+        All (dependent, dependency) label pairs.
+    """
+
+    def __init__(self, model):
+        """
+        Initialize the graph from the model's current components.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model whose components the graph tracks.
+        """
+        self.model = model
+        self._lock = threading.RLock()
+        self._rebuild()
+
+    def _rebuild(self):
+        """Re-register every component of the model."""
+        # label -> [component, kind, token]
+        self._nodes = {}
+        self._uses = {}
+        self._used_by = {}
+        self._pending = []
+        self._counts = {}
+        for kind in COMPONENT_KINDS:
+            for component in getattr(self.model, kind, []):
+                self.add(component)
+
+    def add(self, component):
+        """
+        Register a new component; its edges are resolved on the next query.
+
+        Parameters
+        ----------
+        component : pysb.Component or pysb.Initial
+            The component added to the model.
+        """
+        kind = _kind_of(component)
+        if kind is None:
+            return
+        with self._lock:
+            self._pending.append((component, kind))
+            self._counts[kind] = self._counts.get(kind, 0) + 1
+
+    def invalidate(self):
+        """
+        Rebuild every edge on the next query.
+
+        Call after renaming a component or editing references in place.
+        """
+        with self._lock:
+            self._counts = {}
+
+    def _link(self, component, kind):
+        """Add a node and the edges to everything it references."""
+        label = _leaf_label(component)
+        self._unlink(label)
+        self._nodes[label] = [component, kind, _leaf_token(component)]
+        uses = self._uses[label] = set()
+        self._used_by.setdefault(label, set())
+        for ref in references(component):
+            ref_label = _leaf_label(ref)
+            uses.add(ref_label)
+            self._used_by.setdefault(ref_label, set()).add(label)
+
+    def _unlink(self, label):
+        """Remove the outgoing edges of a node."""
+        for ref_label in self._uses.pop(label, ()):
+            self._used_by.get(ref_label, set()).discard(label)
+
+    def _refresh(self):
+        """Resolve pending components and re-link edited ones."""
+        with self._lock:
+            for kind in COMPONENT_KINDS:
+                if self._counts.get(kind, 0) != len(getattr(self.model, kind, [])):
+                    # Components were added, removed, or renamed behind our back.
+                    self._rebuild()
+                    break
+            else:
+                # Expressions, compartments, initials, rules, and observables can
+                # be edited in place (which may also relabel an initial); rebuild
+                # if any was.
+                for component, kind, token in self._nodes.values():
+                    if kind in _EDITABLE_KINDS and _leaf_token(component) != token:
+                        self._rebuild()
+                        break
+            pending, self._pending = self._pending, []
+            for component, kind in pending:
+                self._link(component, kind)
+
+    def _label(self, name):
+        """Return the node label for a name or component."""
+        return name if isinstance(name, str) else _leaf_label(name)
+
+    def dependencies(self, name, recursive=False):
+        """
+        List the components a component references.
+
+        Parameters
+        ----------
+        name : str or pysb.Component
+            Component name (species pattern string for initials) or component.
+        recursive : bool, optional
+            If True, include indirect dependencies (default: False).
+
+        Returns
+        -------
+        list of str
+            Sorted labels of the referenced components.
+        """
+        self._refresh()
+        return sorted(self._walk(self._label(name), self._uses, recursive))
+
+    def dependents(self, name, recursive=True):
+        """
+        List the components that reference a component.
+
+        Parameters
+        ----------
+        name : str or pysb.Component
+            Component name or component.
+        recursive : bool, optional
+            If True (default), include indirect dependents, e.g. the rules
+            using an expression that uses the parameter.
+
+        Returns
+        -------
+        list of str
+            Sorted labels of the dependent components.
+        """
+        self._refresh()
+        return sorted(self._walk(self._label(name), self._used_by, recursive))
+
+    def _walk(self, label, adjacency, recursive):
+        """Collect the labels reachable from `label` in O(V + E)."""
+        with self._lock:
+            if label not in self._nodes and label not in adjacency:
+                raise KeyError(f"No component '{label}' in the dependency graph")
+            found = set(adjacency.get(label, ()))
+            if recursive:
+                stack = list(found)
+                while stack:
+                    for nxt in adjacency.get(stack.pop(), ()):
+                        if nxt not in found:
+                            found.add(nxt)
+                            stack.append(nxt)
+            found.discard(label)
+            return found
+
+    def unreferenced(self, kind, by=None):
+        """
+        List the components of one kind that nothing references.
+
+        Parameters
+        ----------
+        kind : str
+            Component kind (e.g. "parameters").
+        by : iterable of str, optional
+            Only count references from these kinds (default: any kind).
+
+        Returns
+        -------
+        list of str
+            Names of unreferenced components, in model order.
+        """
+        self._refresh()
+        by = None if by is None else set(by)
+        with self._lock:
+            unreferenced = []
+            for component in getattr(self.model, kind, []):
+                users = self._used_by.get(_leaf_label(component), ())
+                if by is not None:
+                    users = [u for u in users if u in self._nodes and self._nodes[u][1] in by]
+                if not users:
+                    unreferenced.append(_leaf_label(component))
+            return unreferenced
+
+    def kind(self, name):
+        """
+        Return the component kind of a node.
+
+        Parameters
+        ----------
+        name : str or pysb.Component
+            Component name or component.
+
+        Returns
+        -------
+        str
+            The component kind (e.g. "rules").
+        """
+        self._refresh()
+        return self._nodes[self._label(name)][1]
+
+    def edges(self):
+        """
+        Return every (dependent, dependency) label pair.
+
+        Returns
+        -------
+        list of tuple of (str, str)
+            Sorted edges.
+        """
+        self._refresh()
+        with self._lock:
+            return sorted((a, b) for a, uses in self._uses.items() for b in uses)
+
+
+def model_graph(model):
+    """
+    Return the dependency graph for a model.
+
+    QSPy models keep their graph up to date as components are added; plain PySB
+    models get a freshly built graph.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model.
+
+    Returns
+    -------
+    DependencyGraph
+        The model's dependency graph.
+    """
+    graph = getattr(model, "dependency_graph", None)
+    return graph if isinstance(graph, DependencyGraph) else DependencyGraph(model)
@@ -6,6 +6,23 @@ This module provides utilities for generating flowchart-style diagrams of QSPy/P
 It leverages mergram and pyvipr to visualize model structure, including compartments,
 species, and reactions, and can export diagrams as Mermaid, Markdown, or HTML blocks.
 
+Two diagram modes are available:
+
+- ``"species"`` (default) draws the species graph of the generated reaction
+  network, so it requires network generation.
+- ``"rules"`` draws directly from `model.rules` without generating the network.
+  Each complex pattern in a rule is aggregated into a node by its monomers (or,
+  with ``group_by="tag"``, by their functional tags) and compartment, and each
+  rule adds reactant-to-product links labeled with its rate constants. The
+  diagram is built in one pass over the rules, so it stays small and fast for
+  combinatorial models whose networks have thousands of species.
+
+Diagrams are built on demand: constructing a `ModelMermaidDiagrammer` only
+registers it on the model. The flowchart is built on first access of
+`flowchart`, `markdown_block`, `html_block`, or `file_path` (which writes the
+``.mmd`` file), and is memoized against the model's structural hash, so it is
+rebuilt only after the model changes.
+
 Classes
 -------
 ModelMermaidDiagrammer : Generates and exports flowchart diagrams for a given model.
@@ -15,17 +32,29 @@ Examples
 >>> from qspy.diagrams import ModelDiagram
 >>> diagram = ModelDiagram(model)
 >>> print(diagram.markdown_block)
+>>> diagram.file_path
+PosixPath('.qspy/metadata/model_flowchart.mmd')
 >>> diagram.write_mermaid_file("model_flowchart.mmd")
+>>> ModelMermaidDiagrammer(model, mode="rules", group_by="tag")
 """
 
 from pathlib import Path
 
+from pysb.core import MonomerPattern, ReactionPattern
 from mergram.flowchart import Flowchart, Node, Link, Subgraph, Style
 from pyvipr.pysb_viz.static_viz import PysbStaticViz
 from pysb.core import SelfExporter
 import seaborn as sns
 
 from qspy.config import METADATA_DIR
+from qspy.utils.hashing import NETWORK_KINDS, functional_tag_signature, structural_hash
+from qspy.utils.network_cache import generate_equations
+
+DIAGRAM_MODES = ("species", "rules")
+GROUP_BY = ("monomer", "tag")
+
+# Rate labels shown on one aggregated rule-mode link before eliding the rest.
+MAX_LINK_RATES = 3
 
 
 class ModelMermaidDiagrammer:
@@ -34,6 +63,7 @@ class ModelMermaidDiagrammer:
 
     This class builds a flowchart representation of the model, including compartments,
     species, and reactions, and provides export options for Mermaid, Markdown, and HTML.
+    Nothing is built or written until one of the exports is first accessed.
 
     Parameters
     ----------
@@ -41,15 +71,26 @@ class ModelMermaidDiagrammer:
         The model to visualize. If None, uses the current SelfExporter.default_model.
     output_dir : str or Path, optional
         Directory to write diagram files (default: METADATA_DIR).
+    mode : {"species", "rules"}, optional
+        Draw the generated species graph ("species", default) or a network-free
+        diagram built from the rules ("rules").
+    group_by : {"monomer", "tag"}, optional
+        In "rules" mode, aggregate complexes by their monomers (default) or by
+        the functional tags of their monomers.
 
     Attributes
     ----------
     model : pysb.Model
         The model being visualized.
+    mode : str
+        The diagram mode.
+    group_by : str
+        Node aggregation used in "rules" mode.
     flowchart : Flowchart
-        The generated flowchart object.
-    static_viz : PysbStaticViz
-        Static visualization helper for the model.
+        The generated flowchart object (built on first access and rebuilt when
+        the model changes).
+    static_viz : PysbStaticViz or None
+        Static visualization helper for the model (None in "rules" mode).
     has_compartments : bool
         Whether the model contains compartments.
     output_dir : Path
@@ -63,9 +104,15 @@ class ModelMermaidDiagrammer:
         Return the flowchart as a Markdown block.
     html_block
         Return the flowchart as an HTML block.
+    file_path
+        Write the flowchart to `output_dir` if needed and return the path.
+    model_hash()
+        Hash the flowchart is memoized against.
+    invalidate()
+        Drop the memoized flowchart and exports.
     """
 
-    def __init__(self, model=None, output_dir=METADATA_DIR):
+    def __init__(self, model=None, output_dir=METADATA_DIR, mode="species", group_by="monomer"):
         """
         Initialize the ModelMermaidDiagrammer.
 
@@ -75,21 +122,115 @@ class ModelMermaidDiagrammer:
             The model to visualize. If None, uses the current SelfExporter.default_model.
         output_dir : str or Path, optional
             Directory to write diagram files (default: METADATA_DIR).
+        mode : {"species", "rules"}, optional
+            Diagram mode (default: "species").
+        group_by : {"monomer", "tag"}, optional
+            Node aggregation in "rules" mode (default: "monomer").
+
+        Raises
+        ------
+        ValueError
+            If `mode` or `group_by` is not recognized.
         """
+        if mode not in DIAGRAM_MODES:
+            raise ValueError(f"Unknown diagram mode '{mode}' (expected one of {DIAGRAM_MODES})")
+        if group_by not in GROUP_BY:
+            raise ValueError(f"Unknown group_by '{group_by}' (expected one of {GROUP_BY})")
         self.model = model
         if model is None:
             self.model = SelfExporter.default_model
-        self.flowchart = Flowchart(self.model.name)
-        self.static_viz = PysbStaticViz(self.model)
-        self.has_compartments = len(self.model.compartments) > 0
-        self._build_flowchart()
+        self.mode = mode
+        self.group_by = group_by
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        chart_file = self.output_dir / f"{self.model.name}_flowchart.mmd"
-        self.write_mermaid_file(chart_file.as_posix())
+        self.static_viz = None
+        self.has_compartments = False
+        self._flowchart = None
+        self._hash = None
+        self._blocks = {}
+        self._written = None
         setattr(self.model, "mermaid_diagram", self)
         return
 
+    def model_hash(self):
+        """
+        Return the hash the current flowchart is memoized against.
+
+        Combines the structural hash of the network-determining components
+        (parameter values are not drawn) with the monomers' functional tags
+        (used for node colors and tag grouping).
+
+        Returns
+        -------
+        str
+            Hex SHA-256 digest.
+        """
+        return structural_hash(
+            self.model,
+            kinds=NETWORK_KINDS,
+            extra=f"{self.mode}|{self.group_by}|{functional_tag_signature(self.model)}",
+        )
+
+    def invalidate(self):
+        """
+        Drop the memoized flowchart, blocks, and written file.
+
+        Call after an edit the structural hash does not see; the next access
+        rebuilds the flowchart.
+
+        Returns
+        -------
+        None
+        """
+        self._flowchart = None
+        self._hash = None
+        self._blocks = {}
+        self._written = None
+
+    @property
+    def flowchart(self):
+        """
+        The flowchart, built on first access and rebuilt when the model changes.
+
+        Returns
+        -------
+        Flowchart
+            The generated flowchart object.
+        """
+        model_hash = self.model_hash()
+        if self._flowchart is None or model_hash != self._hash:
+            self._render(stale=self._hash is not None and model_hash != self._hash)
+            self._hash = model_hash
+            self._blocks = {}
+        return self._flowchart
+
+    def _render(self, stale=False):
+        """
+        Build a fresh flowchart of the model.
+
+        Parameters
+        ----------
+        stale : bool, optional
+            Whether the model changed since the last render, so any network
+            already on the model is out of date (default: False).
+        """
+        self._flowchart = Flowchart(self.model.name)
+        if self.mode == "species":
+            if stale:
+                # generate_equations keeps a model's existing reactions.
+                self.model.reset_equations()
+            # Use the cached network so BNG isn't re-run for an unchanged model.
+            generate_equations(self.model)
+            self.static_viz = PysbStaticViz(self.model, generate_eqs=False)
+        self.has_compartments = len(self.model.compartments) > 0
+        self._build_flowchart()
+
+    def _block(self, kind, render):
+        """Return a memoized export of the current flowchart."""
+        flowchart = self.flowchart
+        if kind not in self._blocks:
+            self._blocks[kind] = render(flowchart)
+        return self._blocks[kind]
+
     @staticmethod
     def _sanitize_label(label):
         """
@@ -121,7 +262,17 @@ class ModelMermaidDiagrammer:
 
     def _build_flowchart(self):
         """
-        Build the flowchart representation of the model.
+        Build the flowchart representation of the model in the selected mode.
+        """
+        if self.mode == "rules":
+            self._build_rule_flowchart()
+        else:
+            self._build_species_flowchart()
+        self._style_subgraphs()
+
+    def _build_species_flowchart(self):
+        """
+        Build the flowchart from the model's generated reaction network.
 
         Parses the model's compartments, species, and reactions, and adds them as nodes,
         subgraphs, and links to the flowchart.
@@ -156,8 +307,8 @@ class ModelMermaidDiagrammer:
         flow_nodes = dict()
         for node_id, node_attr in nx_graph.nodes.data():
             if node_attr["NodeType"] == "compartment":
-                if node_id not in self.flowchart.subgraphs:
-                    self.flowchart += Subgraph(node_id)
+                if node_id not in self._flowchart.subgraphs:
+                    self._flowchart += Subgraph(node_id)
             elif node_attr["NodeType"] == "species":
                 flow_node = Node(
                     node_id,
@@ -165,9 +316,9 @@ class ModelMermaidDiagrammer:
                     fill=node_attr.get("background_color", "#fff"),
                 )
                 compartment = node_attr["parent"]
-                if compartment not in self.flowchart.subgraphs:
-                    self.flowchart += Subgraph(compartment)
-                self.flowchart.subgraphs[compartment] += flow_node
+                if compartment not in self._flowchart.subgraphs:
+                    self._flowchart += Subgraph(compartment)
+                self._flowchart.subgraphs[compartment] += flow_node
                 flow_nodes[node_id] = flow_node
             elif node_attr["NodeType"] == "none":
                 flow_node = Node(
@@ -176,7 +327,7 @@ class ModelMermaidDiagrammer:
                     fill=node_attr.get("background_color", "#fff"),
                     shape="fr-circ",
                 )
-                self.flowchart += flow_node
+                self._flowchart += flow_node
                 flow_nodes[node_id] = flow_node
         # Go through the reactions and get the names of rate constants
         # and add them to the networkx edge attributes.
@@ -200,23 +351,166 @@ class ModelMermaidDiagrammer:
 
         for source, target, edge_attr in nx_graph.edges.data():
             if source in flow_nodes and target in flow_nodes:
-                self.flowchart += Link(
+                self._flowchart += Link(
                     flow_nodes[source],
                     flow_nodes[target],
                     text=edge_attr.get("k_f", " "),
                 )
                 if edge_attr.get("source_arrow_shape") == "triangle":
                     # Reaction is reversible
-                    self.flowchart += Link(
+                    self._flowchart += Link(
                         flow_nodes[target],
                         flow_nodes[source],
                         text=edge_attr.get("k_r", " "),
                     )
+        return
+
+    def _group_key(self, pattern):
+        """
+        Return the aggregation key and label of a rule-mode complex pattern.
+
+        Parameters
+        ----------
+        pattern : MonomerPattern or ComplexPattern
+            A reactant or product pattern of a rule.
+
+        Returns
+        -------
+        tuple of (tuple, str, str or None, str or None)
+            Node key, node label, compartment name, and the functional tag
+            used to color the node.
+        """
+        if isinstance(pattern, MonomerPattern):
+            monomer_patterns = [pattern]
+            compartment = pattern.compartment
+        else:
+            monomer_patterns = pattern.monomer_patterns
+            compartment = pattern.compartment
+        parts = []
+        tags = set()
+        for mp in monomer_patterns:
+            if compartment is None:
+                compartment = mp.compartment
+            tag = getattr(mp.monomer, "functional_tag", None)
+            tag_value = getattr(tag, "value", None)
+            if tag_value in (None, "None::None"):
+                tag_value = None
+            else:
+                tags.add(tag_value)
+            if self.group_by == "tag" and tag_value is not None:
+                parts.append(tag_value)
+            else:
+                parts.append(mp.monomer.name)
+        parts = tuple(sorted(parts))
+        compartment_name = compartment.name if compartment is not None else None
+        fill_tag = next(iter(tags)) if len(tags) == 1 else None
+        return (compartment_name, parts), ":".join(parts), compartment_name, fill_tag
+
+    @staticmethod
+    def _complex_patterns(pattern):
+        """
+        Return the complex patterns on one side of a rule.
+
+        Parameters
+        ----------
+        pattern : ReactionPattern, ComplexPattern, MonomerPattern, or None
+            One side of a rule expression.
+
+        Returns
+        -------
+        list
+            The side's complex (or monomer) patterns.
+        """
+        if pattern is None:
+            return []
+        if isinstance(pattern, ReactionPattern):
+            return list(pattern.complex_patterns)
+        return [pattern]
+
+    def _build_rule_flowchart(self):
+        """
+        Build a network-free flowchart from the model's rules.
+
+        Each complex pattern becomes an aggregated node (see `_group_key`) and
+        each rule links its reactant nodes to its product nodes, with a sink or
+        source node for degradation and synthesis rules, and a self-loop for
+        rules whose reactants and products share a node (e.g. state changes).
+        Links between the same pair of nodes are merged and list their rate
+        constants. Runs in time
+        linear in the total size of the rule patterns.
+        """
+        nodes = {}
+        node_tags = {}
+        links = {}
+
+        def node_for(pattern):
+            key, label, compartment, tag = self._group_key(pattern)
+            if key not in nodes:
+                nodes[key] = (f"g{len(nodes)}", label, compartment)
+                node_tags[key] = tag
+            return key
+
+        def add_link(source, target, rate):
+            names = links.setdefault((source, target), {})
+            if rate is not None:
+                names[getattr(rate, "name", str(rate))] = None
+
+        for rule in self.model.rules:
+            reactants = [
+                node_for(cp)
+                for cp in self._complex_patterns(rule.rule_expression.reactant_pattern)
+            ]
+            products = [
+                node_for(cp)
+                for cp in self._complex_patterns(rule.rule_expression.product_pattern)
+            ]
+            reactants = list(dict.fromkeys(reactants)) or ["none"]
+            products = list(dict.fromkeys(products)) or ["none"]
+            for source in reactants:
+                for target in products:
+                    # Rules within one node (state changes, modifications, or
+                    # a tag group) are drawn as self-loops.
+                    add_link(source, target, rule.rate_forward)
+                    if rule.is_reversible:
+                        add_link(target, source, rule.rate_reverse)
+
+        palette_tags = sorted({t for t in node_tags.values() if t is not None})
+        colors = dict(
+            zip(palette_tags, sns.color_palette("pastel", n_colors=len(palette_tags)).as_hex())
+        )
+        flow_nodes = {}
+        for key, (node_id, label, compartment) in nodes.items():
+            flow_node = Node(node_id, label=f'"{label}"', fill=colors.get(node_tags[key], "#fff"))
+            if compartment is None:
+                self._flowchart += flow_node
+            else:
+                if compartment not in self._flowchart.subgraphs:
+                    self._flowchart += Subgraph(compartment)
+                self._flowchart.subgraphs[compartment] += flow_node
+            flow_nodes[key] = flow_node
+        if any("none" in pair for pair in links):
+            flow_nodes["none"] = Node(
+                "none", label='"fa:fa-circle-xmark"', fill="#fff", shape="fr-circ"
+            )
+            self._flowchart += flow_nodes["none"]
+
+        for (source, target), names in links.items():
+            names = list(names)
+            text = ", ".join(names[:MAX_LINK_RATES])
+            if len(names) > MAX_LINK_RATES:
+                text += f" +{len(names) - MAX_LINK_RATES}"
+            self._flowchart += Link(flow_nodes[source], flow_nodes[target], text=text or " ")
+        return
+
+    def _style_subgraphs(self):
+        """
+        Add colors to the compartment subgraphs.
+        """
         # Add colors to subgraphs for compartments
         comp_colors = sns.color_palette(
-            "Set2", n_colors=len(self.flowchart.subgraphs)
+            "Set2", n_colors=len(self._flowchart.subgraphs)
         ).as_hex()
-        for subgraph in self.flowchart.subgraphs.values():
+        for subgraph in self._flowchart.subgraphs.values():
             s_id = subgraph.title
             style = Style(
                 s_id,
@@ -224,7 +518,7 @@ class ModelMermaidDiagrammer:
                 fill=comp_colors.pop(0),
                 color="#000",
             )
-            self.flowchart += style
+            self._flowchart += style
 
         return
 
@@ -238,7 +532,7 @@ class ModelMermaidDiagrammer:
         str
             Markdown representation of the flowchart.
         """
-        return self.flowchart.to_markdown()
+        return self._block("markdown", Flowchart.to_markdown)
 
     @property
     def html_block(self):
@@ -250,7 +544,28 @@ class ModelMermaidDiagrammer:
         str
             HTML representation of the flowchart.
         """
-        return self.flowchart.to_html()
+        return self._block("html", Flowchart.to_html)
+
+    @property
+    def file_path(self):
+        """
+        Path of the diagram's Mermaid file, written on first access.
+
+        The file is `<output_dir>/<model name>_flowchart.mmd` and is rewritten
+        only when the flowchart has changed since it was last written.
+
+        Returns
+        -------
+        Path
+            Location of the Mermaid (.mmd) file.
+        """
+        path = self.output_dir / f"{self.model.name}_flowchart.mmd"
+        flowchart = self.flowchart
+        if self._written != (path, self._hash) or not path.exists():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            flowchart.write(path.as_posix())
+            self._written = (path, self._hash)
+        return path
 
     def write_mermaid_file(self, file_path):
         """
@@ -0,0 +1,612 @@
+"""
+QSPy Structural Model Hashing
+=============================
+
+This module provides canonical, declaration-order independent hashing of
+PySB/QSPy model components. Each component is reduced to a canonical string
+describing its structure and digested with SHA-256. The per-component digests
+are the leaves of a two-level Merkle tree: each component kind (monomers,
+parameters, rules, ...) hashes its sorted leaf digests, and the root hashes the
+kind digests. The root is a single model-level hash that can be used as a cache
+key, and comparing kind digests first narrows a diff down to the subtrees that
+changed.
+
+`qspy.core.Model` keeps a `MerkleTree` up to date as components are added, so
+repeated hashing only digests new components and re-checks the mutable fields
+(values, sizes, expressions, rule rates and patterns, observable patterns) of
+existing ones.
+
+Classes
+-------
+MerkleTree : Incrementally maintained Merkle tree of component digests.
+
+Functions
+---------
+canonical_string : Build the canonical string for a model component.
+component_digest : SHA-256 digest of a component's canonical string.
+model_tree : Return the Merkle tree for a model.
+structural_hash : Combined hash over selected component kinds of a model.
+structural_diff : Report the components that differ between two model versions.
+functional_tag_signature : Canonical string of the monomers' functional tags.
+
+Attributes
+----------
+COMPONENT_KINDS : tuple of str
+    All model component kinds that take part in the structural hash.
+NETWORK_KINDS : tuple of str
+    Component kinds that determine the generated reaction network.
+
+Examples
+--------
+>>> from qspy.utils.hashing import structural_hash, NETWORK_KINDS
+>>> structural_hash(model, kinds=NETWORK_KINDS)
+'3f1c...'
+>>> before = model.structural_tree.snapshot()
+>>> model.parameters["k_deg"].value = 0.2
+>>> structural_diff(before, model)
+{'parameters': {'added': [], 'removed': [], 'changed': ['k_deg']}}
+"""
+
+import hashlib
+
+import pysb.core
+
+COMPONENT_KINDS = (
+    "monomers",
+    "compartments",
+    "parameters",
+    "expressions",
+    "rules",
+    "energypatterns",
+    "initials",
+    "observables",
+)
+
+# Parameter values don't change the species/reactions generated by BioNetGen
+# (rate laws reference parameters by name), so they are left out of the
+# network key.
+NETWORK_KINDS = (
+    "monomers",
+    "compartments",
+    "expressions",
+    "rules",
+    "energypatterns",
+    "initials",
+    "observables",
+)
+
+
+def _name_or_value(obj):
+    """
+    Return the name of a component, or the repr of a non-component value.
+
+    Parameters
+    ----------
+    obj : object
+        A model component, None, or a literal value.
+
+    Returns
+    -------
+    str
+        Canonical reference string.
+    """
+    if obj is None:
+        return "None"
+    return getattr(obj, "name", repr(obj))
+
+
+def canonical_string(component):
+    """
+    Build a canonical string describing the structure of a model component.
+
+    Parameters
+    ----------
+    component : pysb.Component or pysb.Initial
+        The component to describe.
+
+    Returns
+    -------
+    str
+        Canonical string for the component.
+    """
+    if isinstance(component, pysb.core.Monomer):
+        site_states = sorted(
+            (site, tuple(states)) for site, states in component.site_states.items()
+        )
+        return f"Monomer|{component.name}|{list(component.sites)}|{site_states}"
+    if isinstance(component, pysb.core.Parameter):
+        units = getattr(component, "units", None)
+        unit = getattr(units, "value", None) if units is not None else None
+        return f"Parameter|{component.name}|{component.value!r}|{unit}"
+    if isinstance(component, pysb.core.Expression):
+        return f"Expression|{component.name}|{component.expr}"
+    if isinstance(component, pysb.core.Compartment):
+        return (
+            f"Compartment|{component.name}|{_name_or_value(component.parent)}"
+            f"|{component.dimension}|{_name_or_value(component.size)}"
+        )
+    if isinstance(component, pysb.core.Rule):
+        return (
+            f"Rule|{component.name}|{component.rule_expression!r}"
+            f"|{_name_or_value(component.rate_forward)}"
+            f"|{_name_or_value(component.rate_reverse)}"
+            f"|{component.delete_molecules}|{component.move_connected}"
+            f"|{component.energy}|{component.total_rate}"
+        )
+    if isinstance(component, pysb.core.EnergyPattern):
+        return (
+            f"EnergyPattern|{component.name}|{component.pattern!r}"
+            f"|{component.energy}"
+        )
+    if isinstance(component, pysb.core.Observable):
+        return (
+            f"Observable|{component.name}|{component.match}"
+            f"|{component.reaction_pattern!r}"
+        )
+    if isinstance(component, pysb.core.Initial):
+        return (
+            f"Initial|{component.pattern!r}|{_name_or_value(component.value)}"
+            f"|{component.fixed}"
+        )
+    return f"{component.__class__.__name__}|{component!r}"
+
+
+def component_digest(component):
+    """
+    Compute the SHA-256 digest of a component's canonical string.
+
+    Parameters
+    ----------
+    component : pysb.Component or pysb.Initial
+        The component to digest.
+
+    Returns
+    -------
+    str
+        Hex digest of the canonical component string.
+    """
+    return hashlib.sha256(canonical_string(component).encode("utf-8")).hexdigest()
+
+
+# Component class -> kind, checked in order (subclasses before base classes).
+_KIND_TYPES = (
+    (pysb.core.Monomer, "monomers"),
+    (pysb.core.Compartment, "compartments"),
+    (pysb.core.Parameter, "parameters"),
+    (pysb.core.Expression, "expressions"),
+    (pysb.core.Rule, "rules"),
+    (pysb.core.EnergyPattern, "energypatterns"),
+    (pysb.core.Observable, "observables"),
+    (pysb.core.Initial, "initials"),
+)
+
+# Kinds whose components have fields that are commonly reassigned after they are
+# added to a model; their leaves are re-validated with a cheap token on every hash.
+_MUTABLE_KINDS = (
+    "compartments",
+    "parameters",
+    "expressions",
+    "initials",
+    "rules",
+    "energypatterns",
+    "observables",
+)
+
+
+def _kind_of(component):
+    """
+    Return the component kind of a model component.
+
+    Parameters
+    ----------
+    component : pysb.Component or pysb.Initial
+        The component.
+
+    Returns
+    -------
+    str or None
+        The kind (e.g., "parameters"), or None for untracked types such as tags.
+    """
+    for cls, kind in _KIND_TYPES:
+        if isinstance(component, cls):
+            return kind
+    return None
+
+
+def _leaf_label(component):
+    """
+    Return the label identifying a component within its kind.
+
+    Parameters
+    ----------
+    component : pysb.Component or pysb.Initial
+        The component.
+
+    Returns
+    -------
+    str
+        The component name, or the species pattern for initials.
+    """
+    if isinstance(component, pysb.core.Initial):
+        return repr(component.pattern)
+    return component.name
+
+
+def _leaf_token(component):
+    """
+    Return a cheap fingerprint of a component's mutable fields.
+
+    Parameters
+    ----------
+    component : pysb.Component or pysb.Initial
+        The component.
+
+    Returns
+    -------
+    tuple
+        Token that changes whenever the component's canonical string may change.
+    """
+    if isinstance(component, pysb.core.Parameter):
+        units = getattr(component, "units", None)
+        return (component.value, getattr(units, "value", None) if units is not None else None)
+    if isinstance(component, pysb.core.Expression):
+        return (id(component.expr),)
+    if isinstance(component, pysb.core.Compartment):
+        return (id(component.parent), id(component.size), component.dimension)
+    if isinstance(component, pysb.core.Initial):
+        return (id(component.pattern), id(component.value), component.fixed)
+    if isinstance(component, pysb.core.Rule):
+        return (
+            id(component.rule_expression),
+            id(component.rate_forward),
+            id(component.rate_reverse),
+            component.delete_molecules,
+            component.move_connected,
+            component.energy,
+            component.total_rate,
+        )
+    if isinstance(component, pysb.core.EnergyPattern):
+        return (id(component.pattern), id(component.energy))
+    if isinstance(component, pysb.core.Observable):
+        return (id(component.reaction_pattern), component.match)
+    return ()
+
+
+class MerkleTree:
+    """
+    Incrementally maintained Merkle tree of component digests.
+
+    Components are registered with `add` (cheap: no hashing happens until a
+    digest is requested). Leaf digests are computed once per component and only
+    recomputed when its mutable fields change (every kind except monomers) or
+    after a rename, which re-digests everything.
+    Kind digests are cached until one of their leaves changes.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model whose components the tree tracks.
+
+    Attributes
+    ----------
+    model : pysb.Model
+        The tracked model.
+
+    Methods
+    -------
+    add(component)
+        Register a new component.
+    invalidate(component=None)
+        Mark digests as stale after a rename or in-place edit.
+    kind_hash(kind)
+        Merkle digest of one component kind.
+    root(kinds=COMPONENT_KINDS, extra=None)
+        Root digest over the selected kinds.
+    leaves(kind)
+        Leaf digests of one kind, keyed by component label.
+    snapshot(kinds=COMPONENT_KINDS)
+        Plain-dict copy of the tree for later comparison or export.
+    diff(other, kinds=COMPONENT_KINDS)
+        Components that differ from another tree, model, or snapshot.
+    """
+
+    def __init__(self, model):
+        """
+        Initialize the tree from the model's current components.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model whose components the tree tracks.
+        """
+        self.model = model
+        self._leaves = {kind: {} for kind in COMPONENT_KINDS}
+        self._stale = {kind: set() for kind in COMPONENT_KINDS}
+        self._kind_hashes = {}
+        for kind in COMPONENT_KINDS:
+            self._rebuild(kind)
+
+    def _rebuild(self, kind):
+        """Re-register every component of one kind from the model."""
+        self._leaves[kind] = {}
+        self._stale[kind] = set()
+        self._kind_hashes.pop(kind, None)
+        for component in getattr(self.model, kind, []):
+            self.add(component)
+
+    def add(self, component):
+        """
+        Register a new component.
+
+        Parameters
+        ----------
+        component : pysb.Component or pysb.Initial
+            The component added to the model.
+        """
+        kind = _kind_of(component)
+        if kind is None:
+            return
+        # [component, token, label, digest]; digested lazily because PySB adds
+        # some components to the model before their constructors finish.
+        self._leaves[kind][id(component)] = [component, None, None, None]
+        self._stale[kind].add(id(component))
+        self._kind_hashes.pop(kind, None)
+
+    def invalidate(self, component=None):
+        """
+        Mark digests as stale after a component is renamed or edited in place.
+
+        Component names appear in the canonical strings of the rules,
+        observables, and expressions that reference them, so every leaf is
+        re-digested on the next hash. Renames are rare, so this is cheap overall.
+
+        Parameters
+        ----------
+        component : pysb.Component or pysb.Initial, optional
+            The modified component (unused; kept for call-site clarity).
+        """
+        for kind, leaves in self._leaves.items():
+            self._stale[kind].update(leaves)
+        self._kind_hashes.clear()
+
+    def _refresh(self, kind):
+        """Recompute the stale leaf digests of one kind."""
+        leaves = self._leaves[kind]
+        if len(leaves) != len(getattr(self.model, kind, [])):
+            # Components were added or removed behind the tree's back.
+            self._rebuild(kind)
+        stale = self._stale[kind]
+        if kind in _MUTABLE_KINDS:
+            for key, leaf in leaves.items():
+                if leaf[1] != _leaf_token(leaf[0]):
+                    stale.add(key)
+        if not stale:
+            return
+        for key in stale:
+            leaf = leaves[key]
+            component = leaf[0]
+            leaf[1] = _leaf_token(component)
+            leaf[2] = _leaf_label(component)
+            leaf[3] = component_digest(component)
+        stale.clear()
+        self._kind_hashes.pop(kind, None)
+
+    def kind_hash(self, kind):
+        """
+        Compute the Merkle digest of one component kind.
+
+        Parameters
+        ----------
+        kind : str
+            Component kind (e.g., "rules").
+
+        Returns
+        -------
+        str
+            Hex SHA-256 digest of the kind's sorted leaf digests.
+        """
+        self._refresh(kind)
+        digest = self._kind_hashes.get(kind)
+        if digest is None:
+            sha = hashlib.sha256(f"[{kind}]".encode("utf-8"))
+            for leaf_digest in sorted(leaf[3] for leaf in self._leaves[kind].values()):
+                sha.update(leaf_digest.encode("utf-8"))
+            digest = self._kind_hashes[kind] = sha.hexdigest()
+        return digest
+
+    def root(self, kinds=COMPONENT_KINDS, extra=None):
+        """
+        Compute the root digest over the selected kinds.
+
+        Parameters
+        ----------
+        kinds : iterable of str, optional
+            Component kinds to include (default: COMPONENT_KINDS).
+        extra : str, optional
+            Additional string mixed into the hash (e.g., tool versions or options).
+
+        Returns
+        -------
+        str
+            Hex SHA-256 root digest.
+        """
+        sha = hashlib.sha256()
+        for kind in kinds:
+            sha.update(f"[{kind}]{self.kind_hash(kind)}".encode("utf-8"))
+        if extra is not None:
+            sha.update(f"[extra]{extra}".encode("utf-8"))
+        return sha.hexdigest()
+
+    def leaves(self, kind):
+        """
+        Return the leaf digests of one kind, keyed by component label.
+
+        Parameters
+        ----------
+        kind : str
+            Component kind.
+
+        Returns
+        -------
+        dict
+            Mapping of component name (species pattern for initials) to digest.
+        """
+        self._refresh(kind)
+        return {leaf[2]: leaf[3] for leaf in self._leaves[kind].values()}
+
+    def snapshot(self, kinds=COMPONENT_KINDS):
+        """
+        Return a plain-dict copy of the tree for later comparison or export.
+
+        Parameters
+        ----------
+        kinds : iterable of str, optional
+            Component kinds to include (default: COMPONENT_KINDS).
+
+        Returns
+        -------
+        dict
+            Dictionary with "root", "kinds" (kind digests), and "leaves".
+        """
+        kinds = tuple(kinds)
+        return {
+            "root": self.root(kinds),
+            "kinds": {kind: self.kind_hash(kind) for kind in kinds},
+            "leaves": {kind: self.leaves(kind) for kind in kinds},
+        }
+
+    def diff(self, other, kinds=COMPONENT_KINDS):
+        """
+        Report the components that differ from another tree, model, or snapshot.
+
+        Parameters
+        ----------
+        other : MerkleTree, pysb.Model, or dict
+            The version to compare against (a snapshot from `snapshot`).
+        kinds : iterable of str, optional
+            Component kinds to compare (default: COMPONENT_KINDS).
+
+        Returns
+        -------
+        dict
+            Maps each kind whose subtree differs to a dict of sorted "added",
+            "removed", and "changed" labels, relative to `other`.
+        """
+        return structural_diff(other, self, kinds=kinds)
+
+
+def model_tree(model):
+    """
+    Return the Merkle tree for a model.
+
+    QSPy models keep their tree up to date as components are added; plain PySB
+    models get a freshly built tree.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model.
+
+    Returns
+    -------
+    MerkleTree
+        The model's component tree.
+    """
+    tree = getattr(model, "structural_tree", None)
+    return tree if isinstance(tree, MerkleTree) else MerkleTree(model)
+
+
+def _as_snapshot(version, kinds):
+    """Return (kind digests, leaf getter) for a tree, model, or snapshot."""
+    if isinstance(version, dict):
+        return version["kinds"], lambda kind: version["leaves"].get(kind, {})
+    tree = version if isinstance(version, MerkleTree) else model_tree(version)
+    return {kind: tree.kind_hash(kind) for kind in kinds}, tree.leaves
+
+
+def structural_diff(old, new, kinds=COMPONENT_KINDS):
+    """
+    Report the components that differ between two model versions.
+
+    Kind digests are compared first, so only the subtrees that changed are
+    walked leaf by leaf.
+
+    Parameters
+    ----------
+    old, new : MerkleTree, pysb.Model, or dict
+        The versions to compare; dicts are snapshots from `MerkleTree.snapshot`.
+    kinds : iterable of str, optional
+        Component kinds to compare (default: COMPONENT_KINDS).
+
+    Returns
+    -------
+    dict
+        Maps each kind whose subtree differs to a dict of sorted "added",
+        "removed", and "changed" labels.
+    """
+    kinds = tuple(kinds)
+    old_kinds, old_leaves = _as_snapshot(old, kinds)
+    new_kinds, new_leaves = _as_snapshot(new, kinds)
+    changes = {}
+    for kind in kinds:
+        if old_kinds.get(kind) == new_kinds.get(kind):
+            continue
+        before, after = old_leaves(kind), new_leaves(kind)
+        changes[kind] = {
+            "added": sorted(after.keys() - before.keys()),
+            "removed": sorted(before.keys() - after.keys()),
+            "changed": sorted(
+                k for k in before.keys() & after.keys() if before[k] != after[k]
+            ),
+        }
+    return changes
+
+
+def structural_hash(model, kinds=COMPONENT_KINDS, extra=None):
+    """
+    Compute a declaration-order independent structural hash of a model.
+
+    This is the root of the model's Merkle tree (see `MerkleTree`). Component
+    digests are sorted within each kind, so reordering declarations does not
+    change the hash, while any structural edit does.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to hash.
+    kinds : iterable of str, optional
+        Component kinds to include (default: COMPONENT_KINDS).
+    extra : str, optional
+        Additional string mixed into the hash (e.g., tool versions or options).
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest of the selected model structure.
+    """
+    return model_tree(model).root(kinds, extra)
+
+
+def functional_tag_signature(model):
+    """
+    Build a canonical string of the functional tags of a model's monomers.
+
+    Functional tags are annotations rather than structure, so they are not part
+    of the structural hash; pass this as `extra` to key outputs that show them.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model.
+
+    Returns
+    -------
+    str
+        Sorted ``name=tag`` pairs of the monomers, joined by commas.
+    """
+    return ",".join(
+        sorted(
+            f"{m.name}={getattr(getattr(m, 'functional_tag', None), 'value', None)}"
+            for m in model.monomers
+        )
+    )
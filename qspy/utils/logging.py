@@ -6,10 +6,27 @@ This module provides logging utilities for QSPy, including logger setup, event
 decorators, metadata redaction, and context entry/exit logging. It ensures
 consistent, structured, and optionally redacted logging for QSPy workflows.
 
+By default records are handed to a `QueueHandler` and written to the rotating
+log file in batches by a listener thread, so callers never block on file I/O.
+Messages are rendered lazily: `log_event` passes arguments and results as
+%-style arguments and skips them entirely when INFO is disabled. Enabled
+records are rendered to a string in the calling thread, so they show arguments
+as they were at the call, and the listener thread only lays them out and
+writes them.
+
+For process pools, `parallel_logging` (in the parent) and
+`configure_worker_logging` (in each worker's initializer) route worker records
+over a multiprocessing queue to a listener in the parent, which is then the only
+process writing and rotating the log file. Every record carries a run id and a
+worker id (``main`` for the parent process).
+
 Functions
 ---------
 setup_qspy_logger : Set up the QSPy logger with rotating file handler.
 ensure_qspy_logging : Ensure the QSPy logger is initialized.
+flush_qspy_logging : Write out all queued log records.
+parallel_logging : Collect log records from worker processes in the parent.
+configure_worker_logging : Send a worker process's log records to the parent.
 log_event : Decorator for logging function entry, exit, arguments, and results.
 redact_sensitive : Recursively redact sensitive fields in a dictionary.
 log_model_metadata : Log model metadata in a structured, optionally redacted format.
@@ -22,22 +39,277 @@ Examples
 >>> foo(2)
 """
 
+import atexit
 import functools
 import logging
+import os
 import pprint
+import queue
 import time
-from logging.handlers import RotatingFileHandler
+import uuid
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from qspy.config import LOG_PATH, LOGGER_NAME
+from qspy.utils.profiling import REGISTRY, qualified_name
+
+# Identifies one top-level QSPy session in the log; workers inherit it.
+RUN_ID = os.environ.get("QSPY_RUN_ID") or uuid.uuid4().hex[:8]
+
+# Set while a `parallel_logging` block is active so that spawned workers don't
+# open the log file themselves when they import qspy.
+WORKER_ENV_VAR = "QSPY_LOG_WORKER"
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(qspy_run)s/%(qspy_worker)s] %(message)s"
+
+
+class _RecordTagger(logging.Filter):
+    """
+    Filter that tags records with the run id and worker id.
+
+    Tags already present (e.g. set in a worker process) are kept.
+
+    Parameters
+    ----------
+    run_id : str
+        Run id for untagged records.
+    worker_id : str
+        Worker id for untagged records.
+    """
+
+    def __init__(self, run_id, worker_id):
+        super().__init__()
+        self.run_id = run_id
+        self.worker_id = worker_id
+
+    def filter(self, record):
+        """
+        Tag a record.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The record to tag.
+
+        Returns
+        -------
+        bool
+            Always True.
+        """
+        if not hasattr(record, "qspy_run"):
+            record.qspy_run = self.run_id
+        if not hasattr(record, "qspy_worker"):
+            record.qspy_worker = self.worker_id
+        return True
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that can write many records in one call.
+
+    `emit_batch` formats a batch of records, checks for rollover once, and
+    writes and flushes the batch with a single write.
+    """
+
+    def emit_batch(self, records):
+        """
+        Write a batch of records.
+
+        Parameters
+        ----------
+        records : list of logging.LogRecord
+            The records to write.
+
+        Returns
+        -------
+        None
+        """
+        records = [r for r in records if r.levelno >= self.level and self.filter(r)]
+        if not records:
+            return
+        self.acquire()
+        try:
+            text = "".join(self.format(r) + self.terminator for r in records)
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() > 0:
+                if self.stream.tell() + len(text) >= self.maxBytes:
+                    self.doRollover()
+            self.stream.write(text)
+            self.flush()
+        except Exception:
+            self.handleError(records[0])
+        finally:
+            self.release()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that renders messages in the calling thread.
+
+    The stock `QueueHandler.prepare` fully formats every record in the calling
+    thread so it can be pickled. The QSPy queue never leaves the process, so
+    only the message is rendered here, before its arguments can change, and
+    the timestamp and layout are left to the listener.
+    """
+
+    def prepare(self, record):
+        """
+        Render the record's message and drop its arguments.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The record to enqueue.
+
+        Returns
+        -------
+        logging.LogRecord
+            The same record, with `msg` rendered and `args` cleared.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BatchQueueListener(QueueListener):
+    """
+    Queue listener that drains up to `batch_size` records per wake-up.
+
+    Handlers with an `emit_batch` method receive the whole batch at once;
+    other handlers get one `handle` call per record.
+    """
+
+    batch_size = 256
+
+    def _monitor(self):
+        """Dequeue and handle record batches until the sentinel arrives."""
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size and batch[-1] is not self._sentinel:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            done = batch[-1] is self._sentinel
+            if done:
+                batch.pop()
+            if batch:
+                self.handle_batch(batch)
+            if done:
+                break
+
+    def handle_batch(self, records):
+        """
+        Pass a batch of records to every handler.
+
+        Parameters
+        ----------
+        records : list of logging.LogRecord
+            The records to handle.
+
+        Returns
+        -------
+        None
+        """
+        records = [self.prepare(r) for r in records]
+        for handler in self.handlers:
+            if hasattr(handler, "emit_batch"):
+                handler.emit_batch(records)
+                continue
+            for record in records:
+                if not self.respect_handler_level or record.levelno >= handler.level:
+                    handler.handle(record)
+
+
+# Background writer state: the listener owning the file handler, if any.
+_LISTENER = None
+# The handler that owns the log file (and its rotation) in this process.
+_FILE_HANDLER = None
+
+
+def _start_listener(log_queue, *handlers):
+    """
+    Start (or restart) the background listener that writes queued records.
+
+    Parameters
+    ----------
+    log_queue : queue.SimpleQueue
+        Queue fed by the QSPy logger's queue handler.
+    *handlers : logging.Handler
+        Handlers that write the records.
+
+    Returns
+    -------
+    logging.handlers.QueueListener
+        The running listener.
+    """
+    global _LISTENER
+    _LISTENER = _BatchQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    return _LISTENER
+
+
+def _discard_listener_after_fork():
+    """
+    Drop the inherited queue and listener in a forked child.
+
+    The child's copy of the queue holds records the parent's listener will
+    still write, and the log file belongs to the parent, so the child's QSPy
+    logger is silenced until `configure_worker_logging` routes it to the parent.
+    """
+    global _LISTENER, _FILE_HANDLER
+    if _LISTENER is None:
+        return
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            logger.removeHandler(handler)
+    logger.addHandler(logging.NullHandler())
+    _LISTENER = None
+    _FILE_HANDLER = None
+
+
+def flush_qspy_logging():
+    """
+    Write out all queued log records.
+
+    Stops the background listener (which drains the queue and flushes the file
+    handler) and starts a new one on the same queue.
+
+    Returns
+    -------
+    None
+    """
+    if _LISTENER is not None and _LISTENER._thread is not None:
+        _LISTENER.stop()
+        _start_listener(_LISTENER.queue, *_LISTENER.handlers)
+
+
+def _stop_listener():
+    """Drain the queue and stop the listener at interpreter exit."""
+    if _LISTENER is not None and _LISTENER._thread is not None:
+        _LISTENER.stop()
+
+
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_listener_after_fork)
 
 
 def setup_qspy_logger(
-    log_path=LOG_PATH, max_bytes=1_000_000, backup_count=5, level=logging.INFO
+    log_path=LOG_PATH,
+    max_bytes=1_000_000,
+    backup_count=5,
+    level=logging.INFO,
+    background=True,
 ):
     """
     Set up the QSPy logger with a rotating file handler.
 
+    Records are tagged with `RUN_ID` and worker id ``main``.
+
     Parameters
     ----------
     log_path : str or Path, optional
@@ -48,6 +320,9 @@ def setup_qspy_logger(
         Number of backup log files to keep (default: 5).
     level : int, optional
         Logging level (default: logging.INFO).
+    background : bool, optional
+        If True, write records from a background `QueueListener` thread instead
+        of the calling thread (default: True).
 
     Returns
     -------
@@ -57,23 +332,30 @@ def setup_qspy_logger(
     log_file = Path(log_path)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    handler = RotatingFileHandler(
+    global _FILE_HANDLER
+
+    handler = BatchRotatingFileHandler(
         filename=log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
         encoding="utf-8",
     )
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
     handler.setFormatter(formatter)
+    handler.addFilter(_RecordTagger(RUN_ID, "main"))
 
     logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(level)
 
     if not logger.hasHandlers():  # Prevent duplicate handlers on reload
-        logger.addHandler(handler)
+        _FILE_HANDLER = handler
+        if background:
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(_DeferredQueueHandler(log_queue))
+            _start_listener(log_queue, handler)
+        else:
+            logger.addHandler(handler)
 
     logger.info("QSPy logging initialized.")
     return logger
@@ -92,16 +374,108 @@ def ensure_qspy_logging():
     """
     global _LOGGER_INITIALIZED
     if not _LOGGER_INITIALIZED:
-        setup_qspy_logger()
+        if not os.environ.get(WORKER_ENV_VAR):
+            # Pool workers get their handler from `configure_worker_logging`.
+            setup_qspy_logger()
         _LOGGER_INITIALIZED = True
 
 
+@contextmanager
+def parallel_logging(run_id=None, mp_context=None, level=None):
+    """
+    Collect log records from worker processes in the parent.
+
+    Starts a listener thread in this process that reads worker records from a
+    multiprocessing queue and writes them, batched, through this process's log
+    file handler, so the parent is the only process writing and rotating the
+    log file. Pass the yielded config to `configure_worker_logging` in each
+    worker's initializer.
+
+    Parameters
+    ----------
+    run_id : str, optional
+        Run id to tag worker records with (default: RUN_ID).
+    mp_context : multiprocessing context, optional
+        Context used to create the queue (default: the platform default).
+    level : int, optional
+        Level for worker loggers (default: this process's QSPy logger level).
+
+    Yields
+    ------
+    dict
+        Worker logging config with keys "queue", "run_id", and "level".
+    """
+    import multiprocessing
+
+    ensure_qspy_logging()
+    logger = logging.getLogger(LOGGER_NAME)
+    ctx = mp_context or multiprocessing.get_context()
+    log_queue = ctx.Queue()
+    handlers = [_FILE_HANDLER] if _FILE_HANDLER is not None else list(logger.handlers)
+    listener = _BatchQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    previous = os.environ.get(WORKER_ENV_VAR)
+    os.environ[WORKER_ENV_VAR] = "1"
+    try:
+        yield {
+            "queue": log_queue,
+            "run_id": run_id or RUN_ID,
+            "level": level if level is not None else logger.getEffectiveLevel(),
+        }
+    finally:
+        if previous is None:
+            os.environ.pop(WORKER_ENV_VAR, None)
+        else:
+            os.environ[WORKER_ENV_VAR] = previous
+        listener.stop()
+        log_queue.close()
+        log_queue.join_thread()
+
+
+def configure_worker_logging(config, worker_id=None):
+    """
+    Send a worker process's log records to the parent.
+
+    Replaces the QSPy logger's handlers in this process with a `QueueHandler`
+    on the queue from `parallel_logging`, so the worker never touches the log
+    file.
+
+    Parameters
+    ----------
+    config : dict
+        Config yielded by `parallel_logging`.
+    worker_id : str, optional
+        Worker id for this process's records (default: process name and pid).
+
+    Returns
+    -------
+    logging.Logger
+        The reconfigured QSPy logger.
+    """
+    global _LOGGER_INITIALIZED
+    import multiprocessing
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    worker_id = worker_id or f"{multiprocessing.current_process().name}:{os.getpid()}"
+    handler = QueueHandler(config["queue"])
+    handler.addFilter(_RecordTagger(config["run_id"], worker_id))
+    logger.addHandler(handler)
+    logger.setLevel(config["level"])
+    _LOGGER_INITIALIZED = True
+    return logger
+
+
 def log_event(
     logger_name=LOGGER_NAME, log_args=False, log_result=False, static_method=False
 ):
     """
     Decorator for logging function entry, exit, arguments, and results.
 
+    Every call is also timed into the `qspy.utils.profiling` registry under the
+    function's qualified name, whether or not INFO logging is enabled.
+
     Parameters
     ----------
     logger_name : str, optional
@@ -122,20 +496,38 @@ def log_event(
     logger = logging.getLogger(logger_name)
 
     def decorator(func):
+        fname = func.__qualname__
+        key = qualified_name(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if static_method:
                 args = args[1:]
-            fname = func.__qualname__
-            logger.info(f">>> Entering `{fname}`")
+            if not logger.isEnabledFor(logging.INFO):
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    REGISTRY.record(key, time.perf_counter_ns() - start)
+            # %-style arguments: repr() only runs when the record is handled.
+            logger.info(">>> Entering `%s`", fname, extra={"qspy_event": "enter"})
             if log_args:
-                logger.info(f"    Args: {args}, Kwargs: {kwargs}")
-            start = time.time()
-            result = func(*args, **kwargs)
-            duration = time.time() - start
-            logger.info(f"<<< Exiting `{fname}` ({duration:.3f}s)")
+                logger.info("    Args: %s, Kwargs: %s", args, kwargs)
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed_ns = time.perf_counter_ns() - start
+                REGISTRY.record(key, elapsed_ns)
+            duration = elapsed_ns / 1e9
+            logger.info(
+                "<<< Exiting `%s` (%.3fs)",
+                fname,
+                duration,
+                extra={"qspy_event": "exit", "qspy_duration": duration},
+            )
             if log_result:
-                logger.info(f"    Result: {result}")
+                logger.info("    Result: %s", result)
             return result
 
         return wrapper
@@ -234,28 +626,28 @@ def log_context_entry_exit(logger_name=LOGGER_NAME, log_duration=True, track_att
             is_exit = method.__name__ == "__exit__"
 
             if is_enter:
-                self._qspy_context_start = time.time()
+                self._qspy_context_start = time.perf_counter()
                 self._qspy_pre_ids = set()
                 if track_attr:
                     tracked = getattr(self.model, track_attr, [])
                     self._qspy_pre_ids = set(id(x) for x in tracked)
-                logger.info(f">>> Entering context: `{context_name}`")
+                logger.info(">>> Entering context: `%s`", context_name)
 
             result = method(self, *args, **kwargs)
 
             if is_exit:
                 duration = ""
                 if log_duration and hasattr(self, "_qspy_context_start"):
-                    elapsed = time.time() - self._qspy_context_start
+                    elapsed = time.perf_counter() - self._qspy_context_start
                     duration = f" (duration: {elapsed:.3f}s)"
-                logger.info(f"<<< Exiting context: `{context_name}`{duration}")
+                logger.info("<<< Exiting context: `%s`%s", context_name, duration)
 
-                if track_attr:
+                if track_attr and logger.isEnabledFor(logging.INFO):
                     tracked = getattr(self.model, track_attr, [])
                     added = [x for x in tracked if id(x) not in self._qspy_pre_ids]
-                    logger.info(f"    ↳ Added {len(added)} new `{track_attr}`:")
+                    logger.info("    ↳ Added %d new `%s`:", len(added), track_attr)
                     for obj in added:
-                        logger.info(f"       - {getattr(obj, 'name', repr(obj))}")
+                        logger.info("       - %s", getattr(obj, "name", obj))
 
             return result
 
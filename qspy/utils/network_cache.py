@@ -0,0 +1,330 @@
+"""
+QSPy Reaction-Network Cache
+===========================
+
+This module provides a persistent, content-addressed cache of BioNetGen reaction
+networks. Networks are keyed by the structural hash of the model (monomers,
+compartments, expressions, rules, initials, and observables) together with the
+PySB and BioNetGen versions, and stored as BNG `.net` files under the QSPy
+output directory. When a cached network exists, the
+model's `species`, `reactions`, `reactions_bidirectional`, and observable species
+are rehydrated from it without running BioNetGen, using PySB's (private)
+netfile parser `pysb.bng._parse_netfile`.
+
+Entries are written to a temporary file and atomically moved into place, so the
+cache can be shared between concurrent worker processes: readers only ever see
+complete files, and concurrent writers of the same key produce identical content.
+
+Classes
+-------
+NetworkCache : On-disk cache of generated reaction networks.
+
+Functions
+---------
+generate_equations : Cache-aware drop-in for `pysb.bng.generate_equations`.
+
+Examples
+--------
+>>> from qspy.utils.network_cache import generate_equations
+>>> generate_equations(model)  # runs BNG once, then reuses the cached network
+"""
+
+import functools
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pysb
+import pysb.bng
+import pysb.pathfinder
+
+try:
+    from pysb.bng import _parse_netfile as _pysb_parse_netfile
+except ImportError:  # private PySB API; see `_parse_netfile`
+    _pysb_parse_netfile = None
+
+import qspy.config
+from qspy.config import LOGGER_NAME
+from qspy.utils.hashing import structural_hash, NETWORK_KINDS
+from qspy.utils.logging import ensure_qspy_logging
+from qspy.utils.profiling import timed, timer
+
+
+@functools.lru_cache(maxsize=None)
+def _bng_version():
+    """
+    Return the installed BioNetGen version, resolved once per process.
+
+    Returns
+    -------
+    str
+        Contents of the ``VERSION`` file next to ``BNG2.pl``, or "unknown"
+        if BioNetGen (or its version file) can't be found.
+    """
+    try:
+        version_file = Path(pysb.pathfinder.get_path("bng")).with_name("VERSION")
+        return version_file.read_text(encoding="utf-8").strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def _parse_netfile(model, netfile):
+    """
+    Load a BNG `.net` file into the model with PySB's netfile parser.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to populate.
+    netfile : str
+        Contents of the BNG `.net` file.
+
+    Raises
+    ------
+    ImportError
+        If the installed PySB no longer provides `pysb.bng._parse_netfile`.
+    """
+    if _pysb_parse_netfile is None:
+        raise ImportError(
+            f"The QSPy network cache needs pysb.bng._parse_netfile, which PySB "
+            f"{pysb.__version__} does not provide. Install a PySB release that has "
+            f"it, or pass cache=False to run BioNetGen without the cache."
+        )
+    _pysb_parse_netfile(model, iter(netfile.split("\n")))
+
+
+class NetworkCache:
+    """
+    Persistent, content-addressed cache of BioNetGen reaction networks.
+
+    Parameters
+    ----------
+    cache_dir : str or Path, optional
+        Directory holding cached `.net` files (default: the current
+        `qspy.config.NETWORK_CACHE_DIR`).
+
+    Attributes
+    ----------
+    cache_dir : Path
+        Directory holding cached `.net` files.
+
+    Methods
+    -------
+    key(model, **kwargs)
+        Compute the cache key for a model and network generation options.
+    path(key)
+        Path of the cached network file for a key.
+    load(model, key)
+        Rehydrate the model's network from the cache, if present.
+    store(key, netfile)
+        Atomically write a network file into the cache.
+    generate_equations(model, cleanup=True, verbose=False, **kwargs)
+        Populate the model's network, using the cache when possible.
+    clear()
+        Remove all cached networks.
+    """
+
+    suffix = ".net"
+
+    def __init__(self, cache_dir=None):
+        """
+        Initialize the NetworkCache.
+
+        Parameters
+        ----------
+        cache_dir : str or Path, optional
+            Directory holding cached `.net` files (default: the current
+            `qspy.config.NETWORK_CACHE_DIR`, so `set_output_dir` applies).
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        if cache_dir is None:
+            cache_dir = qspy.config.NETWORK_CACHE_DIR
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(model, **kwargs):
+        """
+        Compute the cache key for a model and network generation options.
+
+        The key covers the model structure, the options, and the PySB and
+        BioNetGen versions, so upgrading either regenerates the network.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model whose network is cached.
+        **kwargs
+            Options passed to BNG's `generate_network` action.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the network.
+        """
+        options = ",".join(f"{k}={kwargs[k]!r}" for k in sorted(kwargs))
+        extra = f"pysb={pysb.__version__};bng={_bng_version()};{options}"
+        return structural_hash(model, kinds=NETWORK_KINDS, extra=extra)
+
+    def path(self, key):
+        """
+        Path of the cached network file for a key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `NetworkCache.key`.
+
+        Returns
+        -------
+        Path
+            Location of the cached `.net` file.
+        """
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def load(self, model, key):
+        """
+        Rehydrate the model's network from the cache, if present.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model to populate.
+        key : str
+            Cache key from `NetworkCache.key`.
+
+        Returns
+        -------
+        bool
+            True if the network was loaded from the cache, else False.
+        """
+        path = self.path(key)
+        try:
+            netfile = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return False
+        try:
+            model.reset_equations()
+            _parse_netfile(model, netfile)
+        except ImportError:
+            model.reset_equations()
+            raise
+        except Exception as e:
+            # Treat unreadable entries as misses and let them be regenerated.
+            self.logger.warning(f"[QSPy] Discarding unreadable cached network {path}: {e}")
+            model.reset_equations()
+            path.unlink(missing_ok=True)
+            return False
+        if not model.reactions:
+            model.reset_equations()
+            return False
+        return True
+
+    def store(self, key, netfile):
+        """
+        Atomically write a network file into the cache.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `NetworkCache.key`.
+        netfile : str
+            Contents of the BNG `.net` file.
+
+        Returns
+        -------
+        Path
+            Location of the cached `.net` file.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.cache_dir, prefix=f".{key[:16]}-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(netfile)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return path
+
+    @timed()
+    def generate_equations(self, model, cleanup=True, verbose=False, **kwargs):
+        """
+        Populate the model's network, using the cache when possible.
+
+        Mirrors `pysb.bng.generate_equations`: does nothing if the model already
+        has reactions, otherwise loads the network from the cache or runs BNG and
+        stores the result.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model to populate.
+        cleanup : bool, optional
+            Delete BNG temporary files after running (default: True).
+        verbose : bool or int, optional
+            BNG logging verbosity (default: False).
+        **kwargs
+            Options passed to BNG's `generate_network` action.
+
+        Returns
+        -------
+        None
+        """
+        if model.reactions:
+            return
+        key = self.key(model, **kwargs)
+        if self.load(model, key):
+            self.logger.info(f"[QSPy] Loaded reaction network from cache: {key[:12]}")
+            return
+        with timer("pysb.bng.generate_network"):
+            netfile = pysb.bng.generate_network(
+                model, cleanup=cleanup, verbose=verbose, **kwargs
+            )
+        model.reset_equations()
+        _parse_netfile(model, netfile)
+        self.store(key, netfile)
+        self.logger.info(f"[QSPy] Cached generated reaction network: {key[:12]}")
+
+    def clear(self):
+        """
+        Remove all cached networks.
+
+        Returns
+        -------
+        None
+        """
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+
+def generate_equations(model, cache=True, cache_dir=None, **kwargs):
+    """
+    Cache-aware drop-in for `pysb.bng.generate_equations`.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to populate.
+    cache : bool, optional
+        If False, bypass the cache and call BNG directly (default: True).
+    cache_dir : str or Path, optional
+        Directory holding cached networks (default: the current
+        `qspy.config.NETWORK_CACHE_DIR`).
+    **kwargs
+        Passed to `NetworkCache.generate_equations`.
+
+    Returns
+    -------
+    None
+    """
+    if not cache:
+        pysb.bng.generate_equations(model, **kwargs)
+        return
+    NetworkCache(cache_dir).generate_equations(model, **kwargs)
@@ -0,0 +1,365 @@
+"""
+QSPy Timing Registry
+====================
+
+This module provides a process-wide registry of wall-clock timings for QSPy hot
+paths, so model build and validation time can be broken down without attaching an
+external profiler. Timings are recorded with `time.perf_counter_ns` and keyed by
+qualified function name (``module.Class.method``).
+
+The registry is fed automatically by `qspy.utils.logging.log_event`, by
+`ComponentContext.__enter__`/`__exit__`, by each `ModelChecker` check, and by
+reaction-network generation. Recording costs a lock and a few counter updates
+per call, and memory is bounded: each name keeps an exact count, total, and
+maximum plus a fixed-size uniform sample of durations for the percentiles. Set
+``REGISTRY.enabled = False`` to turn recording off.
+
+Classes
+-------
+TimingRegistry : Thread-safe store of call durations keyed by name.
+
+Functions
+---------
+qualified_name : Return the ``module.qualname`` key for a function.
+timed : Decorator recording each call of a function in the registry.
+timer : Context manager recording the duration of a block in the registry.
+timing_stats : Summary statistics for the recorded timings.
+reset_timings : Clear the recorded timings.
+export_timings : Write the timings as JSON or a Markdown table.
+
+Examples
+--------
+>>> from qspy.utils.profiling import export_timings, timing_stats
+>>> timing_stats()["qspy.validation.modelchecker.ModelChecker.check_units"]["p95_ms"]
+>>> export_timings("timings.md", fmt="markdown")
+"""
+
+import functools
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+# Columns reported by `TimingRegistry.stats`, in Markdown table order.
+STAT_FIELDS = ("count", "total_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+# Durations kept per name for percentiles; beyond this they are reservoir-sampled.
+RESERVOIR_SIZE = 1024
+
+
+def qualified_name(func):
+    """
+    Return the ``module.qualname`` key for a function.
+
+    Parameters
+    ----------
+    func : callable
+        The function.
+
+    Returns
+    -------
+    str
+        The qualified name used as a registry key.
+    """
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+class TimingRegistry:
+    """
+    Thread-safe store of call durations keyed by name.
+
+    Counts, totals, and maxima are exact. Percentiles come from a uniform
+    reservoir sample of at most `max_samples` durations per name (Vitter's
+    Algorithm R), so they are exact until a name has been recorded more than
+    `max_samples` times and memory stays bounded for long-running processes.
+
+    Parameters
+    ----------
+    max_samples : int, optional
+        Durations kept per name for percentiles (default: RESERVOIR_SIZE).
+
+    Attributes
+    ----------
+    enabled : bool
+        If False, `record` does nothing.
+    max_samples : int
+        Durations kept per name for percentiles.
+
+    Methods
+    -------
+    record(name, duration_ns)
+        Record one call duration.
+    stats(name=None)
+        Summary statistics per name.
+    reset()
+        Clear all timings.
+    to_json(path=None)
+        Serialize the statistics as JSON.
+    to_markdown(path=None)
+        Render the statistics as a Markdown table.
+    """
+
+    def __init__(self, max_samples=RESERVOIR_SIZE):
+        """
+        Initialize an empty TimingRegistry.
+
+        Parameters
+        ----------
+        max_samples : int, optional
+            Durations kept per name for percentiles (default: RESERVOIR_SIZE).
+        """
+        self.enabled = True
+        self.max_samples = int(max_samples)
+        # name -> [count, total_ns, max_ns, reservoir]
+        self._timings = {}
+        self._random = random.Random()
+        self._lock = threading.Lock()
+
+    def record(self, name, duration_ns):
+        """
+        Record one call duration.
+
+        Parameters
+        ----------
+        name : str
+            Timing key (qualified function name).
+        duration_ns : int
+            Duration in nanoseconds.
+
+        Returns
+        -------
+        None
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = [0, 0, 0, []]
+            timing[0] += 1
+            timing[1] += duration_ns
+            if duration_ns > timing[2]:
+                timing[2] = duration_ns
+            reservoir = timing[3]
+            if len(reservoir) < self.max_samples:
+                reservoir.append(duration_ns)
+            else:
+                slot = self._random.randrange(timing[0])
+                if slot < self.max_samples:
+                    reservoir[slot] = duration_ns
+
+    def stats(self, name=None):
+        """
+        Summary statistics per name.
+
+        Parameters
+        ----------
+        name : str, optional
+            If given, return statistics for this name only.
+
+        Returns
+        -------
+        dict
+            Maps each name to a dict with ``count``, ``total_ms``, ``mean_ms``,
+            ``p50_ms``, ``p95_ms``, ``p99_ms``, and ``max_ms``, sorted by total
+            time (descending). With `name`, the single statistics dict.
+        """
+        with self._lock:
+            if name is not None:
+                timing = self._timings.get(name, (0, 0, 0, ()))
+                items = [(name, timing[:3], list(timing[3]))]
+            else:
+                items = [(k, v[:3], list(v[3])) for k, v in self._timings.items()]
+        stats = {}
+        for key, (count, total_ns, max_ns), samples in items:
+            if count == 0:
+                stats[key] = dict.fromkeys(STAT_FIELDS, 0)
+                continue
+            p50, p95, p99 = np.percentile(np.asarray(samples, dtype=float) / 1e6, [50, 95, 99])
+            stats[key] = {
+                "count": count,
+                "total_ms": total_ns / 1e6,
+                "mean_ms": total_ns / count / 1e6,
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "max_ms": max_ns / 1e6,
+            }
+        if name is not None:
+            return stats[name]
+        return dict(sorted(stats.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
+
+    def reset(self):
+        """
+        Clear all timings.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._timings.clear()
+
+    def to_json(self, path=None):
+        """
+        Serialize the statistics as JSON.
+
+        Parameters
+        ----------
+        path : str or Path, optional
+            If given, also write the JSON to this file.
+
+        Returns
+        -------
+        str
+            The JSON document.
+        """
+        text = json.dumps(self.stats(), indent=2)
+        if path is not None:
+            Path(path).write_text(text, encoding="utf-8")
+        return text
+
+    def to_markdown(self, path=None):
+        """
+        Render the statistics as a Markdown table.
+
+        Parameters
+        ----------
+        path : str or Path, optional
+            If given, also write the table to this file.
+
+        Returns
+        -------
+        str
+            The Markdown table.
+        """
+        lines = [
+            "| function | " + " | ".join(STAT_FIELDS) + " |",
+            "|---|" + "---:|" * len(STAT_FIELDS),
+        ]
+        for key, stat in self.stats().items():
+            cells = [str(stat["count"])] + [f"{stat[f]:.3f}" for f in STAT_FIELDS[1:]]
+            lines.append(f"| `{key}` | " + " | ".join(cells) + " |")
+        text = "\n".join(lines) + "\n"
+        if path is not None:
+            Path(path).write_text(text, encoding="utf-8")
+        return text
+
+
+REGISTRY = TimingRegistry()
+
+
+def timed(name=None, registry=REGISTRY):
+    """
+    Decorator recording each call of a function in the registry.
+
+    Parameters
+    ----------
+    name : str, optional
+        Timing key (default: the function's qualified name).
+    registry : TimingRegistry, optional
+        Registry to record into (default: the process-wide REGISTRY).
+
+    Returns
+    -------
+    function
+        Decorator.
+    """
+
+    def decorator(func):
+        key = name or qualified_name(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.record(key, time.perf_counter_ns() - start)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def timer(name, registry=REGISTRY):
+    """
+    Context manager recording the duration of a block in the registry.
+
+    Parameters
+    ----------
+    name : str
+        Timing key.
+    registry : TimingRegistry, optional
+        Registry to record into (default: the process-wide REGISTRY).
+
+    Yields
+    ------
+    None
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        registry.record(name, time.perf_counter_ns() - start)
+
+
+def timing_stats(name=None):
+    """
+    Summary statistics for the recorded timings.
+
+    Parameters
+    ----------
+    name : str, optional
+        If given, return statistics for this name only.
+
+    Returns
+    -------
+    dict
+        See `TimingRegistry.stats`.
+    """
+    return REGISTRY.stats(name)
+
+
+def reset_timings():
+    """
+    Clear the recorded timings.
+
+    Returns
+    -------
+    None
+    """
+    REGISTRY.reset()
+
+
+def export_timings(path=None, fmt="json"):
+    """
+    Write the timings as JSON or a Markdown table.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        File to write; if None, only return the text.
+    fmt : {"json", "markdown"}, optional
+        Output format (default: "json").
+
+    Returns
+    -------
+    str
+        The rendered timings.
+
+    Raises
+    ------
+    ValueError
+        If `fmt` is not recognized.
+    """
+    if fmt == "json":
+        return REGISTRY.to_json(path)
+    if fmt in ("markdown", "md"):
+        return REGISTRY.to_markdown(path)
+    raise ValueError(f"Unknown timing export format '{fmt}' (expected 'json' or 'markdown')")
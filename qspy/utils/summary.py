@@ -0,0 +1,551 @@
+"""
+QSPy Model Summary Generation
+=============================
+
+This module builds the Markdown model summary written by
+`qspy.core.Model.markdown_summary`. The summary is generated on demand: a
+`ModelSummary` renders nothing until `markdown_block` or `file_path` is first
+accessed. Each table is memoized against the structural hash of the component
+kinds it shows (`qspy.utils.hashing`), so re-rendering the summary of an
+unchanged model only rebuilds the metadata header, and editing, e.g., a
+parameter value only rebuilds the parameter and initial-condition tables. The
+summary file is rewritten only when its content changes.
+
+For very large models, `ModelSummary.write` streams the summary to a file
+handle one row at a time, as Markdown or as JSON lines (one record per row, for
+downstream indexing). Each table is declared once as a `SummarySection` that
+yields row records, which are formatted as Markdown rows or written as JSON.
+Expression-valued initial conditions are evaluated together in one vectorized
+pass (`evaluate_expressions`).
+
+Classes
+-------
+SummarySection : Declaration of one summary table.
+ModelSummary : Lazily generated, memoized summary of a model.
+
+Functions
+---------
+evaluate_expressions : Evaluate many expressions in one vectorized pass.
+
+Examples
+--------
+>>> summary = model.summary
+>>> print(summary.markdown_block)
+>>> summary.file_path
+PosixPath('.qspy/model_summary.md')
+>>> summary.write(fmt="jsonl")
+PosixPath('.qspy/model_summary.jsonl')
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+import pysb.core
+import sympy
+from pysb.core import SelfExporter
+
+from qspy.config import SUMMARY_DIR
+from qspy.utils.hashing import functional_tag_signature, structural_hash
+
+
+def _units_lines(model):
+    """Core units table."""
+    lines = ["## Core Units\n| Quantity | Unit |", "|-----------|------|"]
+    units = getattr(model, "simulation_units", None)
+    if units:
+        lines.append(f"| Concentration | {units.concentration} |")
+        lines.append(f"| Time         | {units.time} |")
+        lines.append(f"| Volume       | {units.volume} |")
+    else:
+        lines.append("No core model units defined.")
+        lines.append("    They can added with the `Model.with_units` method.")
+    return lines
+
+
+def evaluate_expressions(expressions):
+    """
+    Evaluate many expressions in one vectorized pass.
+
+    The expressions are expanded down to parameters and compiled together into
+    a single numpy function, which is called once with the parameter values,
+    instead of substituting into each expression separately (`get_value`).
+
+    Parameters
+    ----------
+    expressions : iterable of pysb.Expression
+        Constant expressions (of parameters and other expressions).
+
+    Returns
+    -------
+    dict
+        Maps expression names to float values. Expressions that depend on
+        observables or other non-constant terms map to NaN.
+    """
+    expressions = list(expressions)
+    if not expressions:
+        return {}
+    expanded = [e.expand_expr() for e in expressions]
+    constant = [
+        all(isinstance(sym, pysb.core.Parameter) for sym in x.free_symbols) for x in expanded
+    ]
+    kept = [x for x, ok in zip(expanded, constant) if ok]
+    symbols = sorted(set().union(set(), *(x.free_symbols for x in kept)), key=str)
+    values = iter(())
+    if kept:
+        evaluate = sympy.lambdify([symbols], kept, modules="numpy")
+        values = iter(np.asarray(evaluate([sym.value for sym in symbols]), dtype=float))
+    return {
+        e.name: float(next(values)) if ok else float("nan")
+        for e, ok in zip(expressions, constant)
+    }
+
+
+def _counts_records(model):
+    """Component counts."""
+    for label, kind in (
+        ("Monomers", "monomers"),
+        ("Parameters", "parameters"),
+        ("Expressions", "expressions"),
+        ("Compartments", "compartments"),
+        ("Rules", "rules"),
+        ("Initial Conditions", "initial_conditions"),
+        ("Observables", "observables"),
+    ):
+        yield {"component_type": label, "count": len(getattr(model, kind, []))}
+
+
+def _compartments_records(model):
+    """Compartment names and sizes."""
+    for cpt in getattr(model, "compartments", []):
+        size = cpt.size.name if hasattr(cpt.size, "name") else str(cpt.size)
+        yield {"name": cpt.name, "size": size}
+
+
+def _monomers_records(model):
+    """Monomer sites, states, and functional tags."""
+    for m in model.monomers:
+        yield {
+            "name": m.name,
+            "sites": list(m.sites),
+            "site_states": dict(m.site_states),
+            "functional_tag": getattr(m.functional_tag, "value", m.functional_tag),
+        }
+
+
+def _parameters_records(model):
+    """Parameter values and units."""
+    for p in model.parameters:
+        yield {"name": p.name, "value": p.value, "units": p.unit.to_string()}
+
+
+def _expressions_records(model):
+    """Expression definitions."""
+    for e in getattr(model, "expressions", []):
+        yield {"name": e.name, "expression": str(e.expr)}
+
+
+def _initials_records(model):
+    """Initial condition values and units, with expressions evaluated in one pass."""
+    initials = model.initial_conditions
+    values = evaluate_expressions(
+        value for _, value in initials if isinstance(value, pysb.core.Expression)
+    )
+    for pattern, value in initials:
+        yield {
+            "species": str(pattern),
+            "value": value.value if isinstance(value, pysb.core.Parameter) else values[value.name],
+            "units": value.units.value,
+        }
+
+
+def _rules_records(model):
+    """Rule expressions and rate constants."""
+    for r in model.rules:
+        yield {
+            "name": r.name,
+            "rule_expression": repr(r.rule_expression),
+            "k_f": r.rate_forward.name,
+            "k_r": r.rate_reverse.name if r.rate_reverse is not None else None,
+            "reversible": r.is_reversible,
+        }
+
+
+def _observables_records(model):
+    """Observable patterns."""
+    for o in model.observables:
+        yield {"name": o.name, "reaction_pattern": str(o.reaction_pattern)}
+
+
+def _sanitize_rule_expression(expr):
+    """
+    Sanitize rule expression for Markdown rendering.
+    Replaces ' | ' with ' \\| ' to avoid Markdown table formatting issues.
+    """
+    return expr.replace(" | ", " \\| ")
+
+
+class SummarySection(NamedTuple):
+    """
+    Declaration of one summary table.
+
+    Attributes
+    ----------
+    name : str
+        Section name (the ``section`` field of its JSON-lines records).
+    kinds : tuple of str or None
+        Component kinds the table shows; its memo key hashes only these
+        (None: all kinds).
+    heading : tuple of str
+        Markdown heading and table header lines.
+    records : callable
+        Function of the model yielding one dict per table row.
+    row : callable
+        Function formatting a record as a Markdown table row.
+    empty : str
+        Markdown row written when the table has no records.
+    """
+
+    name: str
+    kinds: Optional[tuple]
+    heading: tuple
+    records: Callable
+    row: Callable
+    empty: str
+
+
+SUMMARY_SECTIONS = (
+    SummarySection(
+        "counts",
+        None,
+        ("## Numbers of Model Component\n| Component Type | Count |", "|---------------|-------|"),
+        _counts_records,
+        lambda r: f"| {r['component_type']} | {r['count']} |",
+        "",
+    ),
+    SummarySection(
+        "compartments",
+        ("compartments",),
+        ("\n## Compartments\n| Name | Size |", "|------|------|"),
+        _compartments_records,
+        lambda r: f"| {r['name']} | {r['size']} |",
+        "| _None_ | _N/A_ |",
+    ),
+    SummarySection(
+        "monomers",
+        ("monomers",),
+        (
+            "## Monomers\n| Name | Sites | States | Functional Tag |",
+            "|------|-------|--------|---------------|",
+        ),
+        _monomers_records,
+        lambda r: f"| {r['name']} | {r['sites']} | {r['site_states']} | {r['functional_tag']} |",
+        "| _None_ | _N/A_ | _N/A_ | _N/A_ |",
+    ),
+    SummarySection(
+        "parameters",
+        ("parameters",),
+        ("\n## Parameters\n| Name | Value | Units |", "|------|--------|--------|"),
+        _parameters_records,
+        lambda r: f"| {r['name']} | {r['value']} | {r['units']} |",
+        "| _None_ | _N/A_ |",
+    ),
+    SummarySection(
+        "expressions",
+        ("expressions",),
+        ("\n## Expressions\n| Name | Expression |", "|------|------------|"),
+        _expressions_records,
+        lambda r: f"| {r['name']} | `{r['expression']}` |",
+        "| _None_ | _N/A_ |",
+    ),
+    SummarySection(
+        "initials",
+        ("initials", "parameters", "expressions"),
+        ("\n## Initial Conditions\n| Species | Value | Units |", "|---------|--------|--------|"),
+        _initials_records,
+        lambda r: f"| {r['species']} | {r['value']:.2f} | {r['units']}",
+        "| _None_ | _N/A_ |",
+    ),
+    SummarySection(
+        "rules",
+        ("rules",),
+        (
+            "\n## Rules\n| Name | Rule Expression | k_f | k_r | reversible |",
+            "|------|-----------------|-----|-----|------------|",
+        ),
+        _rules_records,
+        lambda r: (
+            f"| {r['name']} | `{_sanitize_rule_expression(r['rule_expression'])}` "
+            f"| {r['k_f']} | {r['k_r']} | {r['reversible']} |"
+        ),
+        "| _None_ | _N/A_ | _N/A_ | _N/A_ | _N/A_ |",
+    ),
+    SummarySection(
+        "observables",
+        ("observables",),
+        ("\n## Observables\n| Name | Reaction Pattern |", "|------|------------------|"),
+        _observables_records,
+        lambda r: f"| {r['name']} | `{r['reaction_pattern']}` |",
+        "| _None_ | _N/A_ |",
+    ),
+)
+SUMMARY_FORMATS = ("markdown", "jsonl")
+
+
+class ModelSummary:
+    """
+    Lazily generated, memoized summary of a model.
+
+    Parameters
+    ----------
+    model : pysb.Model, optional
+        The model to summarize. If None, uses the current SelfExporter.default_model.
+    path : str or Path, optional
+        Output path for the summary file (default: SUMMARY_DIR).
+    include_diagram : bool, optional
+        Whether to include the model's `ModelMermaidDiagrammer` diagram, if it
+        has one (default: True).
+
+    Attributes
+    ----------
+    model : pysb.Model
+        The model being summarized.
+    path : Path
+        Output path for the summary file.
+    include_diagram : bool
+        Whether the diagram is included.
+    created_at : str
+        Timestamp shown for models without QSPy metadata.
+
+    Methods
+    -------
+    markdown_block
+        Return the summary as Markdown.
+    file_path
+        Write the summary to `path` if needed and return the path.
+    write(file=None, fmt="markdown")
+        Stream the summary to a file, section by section.
+    records()
+        Yield the summary as JSON-serializable records.
+    invalidate()
+        Drop the memoized sections.
+    """
+
+    def __init__(self, model=None, path=SUMMARY_DIR, include_diagram=True):
+        """
+        Initialize the ModelSummary.
+
+        Parameters
+        ----------
+        model : pysb.Model, optional
+            The model to summarize. If None, uses the current SelfExporter.default_model.
+        path : str or Path, optional
+            Output path for the summary file (default: SUMMARY_DIR).
+        include_diagram : bool, optional
+            Whether to include the model diagram (default: True).
+        """
+        self.model = model if model is not None else SelfExporter.default_model
+        self.path = Path(path)
+        self.include_diagram = include_diagram
+        # Timestamp for models without metadata, fixed so unchanged summaries
+        # aren't rewritten.
+        self.created_at = datetime.now().isoformat()
+        # section name -> (key, records)
+        self._sections = {}
+        self._written = None
+
+    def invalidate(self):
+        """
+        Drop the memoized sections and written file.
+
+        Call after an edit the structural hash does not see; the next access
+        re-renders every section.
+
+        Returns
+        -------
+        None
+        """
+        self._sections = {}
+        self._written = None
+
+    def _section_key(self, section):
+        """Return the memo key of a section for the current model."""
+        extra = f"summary:{section.name}"
+        if section.name == "monomers":
+            extra += f"|{functional_tag_signature(self.model)}"
+        if section.kinds is None:
+            return structural_hash(self.model, extra=extra)
+        return structural_hash(self.model, kinds=section.kinds, extra=extra)
+
+    def _section_records(self, section, memoize=True):
+        """
+        Return the records of one section.
+
+        Fresh memoized records are reused. Otherwise the records are rebuilt and,
+        with `memoize`, kept; without it they are returned as a generator so a
+        streaming writer never holds a whole table.
+        """
+        key = self._section_key(section)
+        cached = self._sections.get(section.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if not memoize:
+            return section.records(self.model)
+        records = list(section.records(self.model))
+        self._sections[section.name] = (key, records)
+        return records
+
+    def _metadata_record(self):
+        """Model name and metadata."""
+        metadata = getattr(self.model, "qspy_metadata", None) or {}
+        return {
+            "model": self.model.name,
+            "hash": metadata.get("hash", "N/A"),
+            "version": metadata.get("version", "N/A"),
+            "author": metadata.get("author", "N/A"),
+            "current_user": metadata.get("current_user", "N/A"),
+            "created_at": metadata.get("created_at", self.created_at),
+        }
+
+    def _markdown_lines(self, memoize=True):
+        """Yield the Markdown lines of the summary, section by section."""
+        header = self._metadata_record()
+        yield f"# QSPy Model Summary: `{header['model']}`\n"
+        yield f"**Model name**: `{header['model']}` \n"
+        yield f"**Hash**: \n`{header['hash']}` \n"
+        yield f"**Version**: {header['version']} \n"
+        yield f"**Author**: {header['author']} \n"
+        yield f"**Executed by**: {header['current_user']} \n"
+        yield f"**Timestamp**: {header['created_at']}\n"
+        diagram = getattr(self.model, "mermaid_diagram", None)
+        if self.include_diagram and diagram is not None:
+            yield "## 🖼️ Model Diagram\n"
+            yield f"{diagram.markdown_block}\n"
+        yield from _units_lines(self.model)
+        for section in SUMMARY_SECTIONS:
+            yield from section.heading
+            empty = True
+            for record in self._section_records(section, memoize):
+                empty = False
+                yield section.row(record)
+            if empty and section.empty:
+                yield section.empty
+
+    def records(self, memoize=True):
+        """
+        Yield the summary as JSON-serializable records.
+
+        The first record (``"section": "metadata"``) holds the model name and
+        metadata, followed by a ``"units"`` record and one record per table row
+        with the table's name in its ``"section"`` field.
+
+        Parameters
+        ----------
+        memoize : bool, optional
+            Keep rebuilt tables for later summaries (default: True).
+
+        Yields
+        ------
+        dict
+            Summary records.
+        """
+        yield {"section": "metadata", **self._metadata_record()}
+        units = getattr(self.model, "simulation_units", None)
+        yield {
+            "section": "units",
+            "concentration": str(units.concentration) if units else None,
+            "time": str(units.time) if units else None,
+            "volume": str(units.volume) if units else None,
+        }
+        for section in SUMMARY_SECTIONS:
+            for record in self._section_records(section, memoize):
+                yield {"section": section.name, **record}
+
+    @property
+    def markdown_block(self):
+        """
+        Return the summary as Markdown.
+
+        The metadata header and units table are re-rendered on every access;
+        the component tables come from the memo unless their components changed.
+
+        Returns
+        -------
+        str
+            Markdown summary of the model.
+        """
+        return "".join(f"{line}\n" for line in self._markdown_lines())
+
+    @property
+    def file_path(self):
+        """
+        Path of the summary file, written on first access.
+
+        The file is rewritten only when the summary content has changed since
+        it was last written.
+
+        Returns
+        -------
+        Path
+            Location of the Markdown summary file.
+        """
+        text = self.markdown_block
+        if self._written != (self.path, text) or not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(text)
+            self._written = (self.path, text)
+        return self.path
+
+    def write(self, file=None, fmt="markdown"):
+        """
+        Stream the summary to a file, section by section.
+
+        Each line is written to the file as soon as it is rendered, and tables
+        that are not already memoized are streamed without being kept, so
+        summarizing a very large model never holds the whole document.
+
+        Parameters
+        ----------
+        file : str, Path, or file-like, optional
+            Output path or open text handle (default: `path`, with a
+            ``.jsonl`` suffix for JSON lines).
+        fmt : {"markdown", "jsonl"}, optional
+            Markdown document (default) or one JSON record per line (see
+            `records`).
+
+        Returns
+        -------
+        Path or None
+            The written path, or None when writing to a handle.
+
+        Raises
+        ------
+        ValueError
+            If `fmt` is not recognized.
+        """
+        if fmt not in SUMMARY_FORMATS:
+            raise ValueError(f"Unknown summary format '{fmt}' (expected one of {SUMMARY_FORMATS})")
+        if hasattr(file, "write"):
+            self._write_lines(file, fmt)
+            return None
+        path = Path(file) if file is not None else self.path
+        if file is None and fmt == "jsonl":
+            path = path.with_suffix(".jsonl")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            self._write_lines(f, fmt)
+        return path
+
+    def _write_lines(self, f, fmt):
+        """Write the summary lines of one format to an open handle."""
+        if fmt == "jsonl":
+            for record in self.records(memoize=False):
+                f.write(json.dumps(record, default=str))
+                f.write("\n")
+        else:
+            for line in self._markdown_lines(memoize=False):
+                f.write(line)
+                f.write("\n")
@@ -0,0 +1,224 @@
+"""
+QSPy Parameter Table Utilities
+==============================
+
+This module reads parameter tables (name, value, unit) from CSV/TSV and TOML files
+or in-memory tables, and validates them in one vectorized pass. It backs
+`qspy.contexts.parameters.from_table`.
+
+Supported inputs
+----------------
+- ``.csv`` / ``.tsv`` files with a header row.
+- ``.toml`` files, either as an array of tables::
+
+      [[parameters]]
+      name = "k_deg"
+      value = 0.1
+      unit = "1/h"
+
+  or as a table keyed by parameter name::
+
+      [parameters]
+      k_deg = { value = 0.1, unit = "1/h" }
+      V_1 = 10.0  # no units
+
+  The ``parameters`` key is optional; without it the whole document is used.
+- pandas DataFrames, mappings of columns, and NumPy structured arrays (by column
+  name); plain 2D arrays and row sequences are read positionally as
+  (name, value[, unit]).
+
+Functions
+---------
+read_parameter_table : Read name, value, and unit columns from a parameter table.
+validate_parameter_table : Validate parameter table columns in one pass.
+
+Examples
+--------
+>>> names, values, units = read_parameter_table("params.csv")
+"""
+
+import csv
+import os
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import toml
+
+
+def _toml_rows(document, name_col, value_col):
+    """
+    Flatten a TOML parameter document into a list of row dictionaries.
+
+    Parameters
+    ----------
+    document : dict
+        Parsed TOML document.
+    name_col, value_col : str
+        Name and value column names.
+
+    Returns
+    -------
+    list of dict
+        One dictionary per parameter.
+    """
+    data = document.get("parameters", document)
+    if isinstance(data, list):
+        return data
+    rows = []
+    for name, entry in data.items():
+        if isinstance(entry, Mapping):
+            row = dict(entry)
+        else:
+            row = {value_col: entry}
+        row.setdefault(name_col, name)
+        rows.append(row)
+    return rows
+
+
+def read_parameter_table(table, name_col="name", value_col="value", unit_col="unit"):
+    """
+    Read name, value, and unit columns from a parameter table.
+
+    Parameters
+    ----------
+    table : str, Path, pandas.DataFrame, Mapping, or array_like
+        The table, or the path to a ``.csv``, ``.tsv``, or ``.toml`` file.
+    name_col : str, optional
+        Column holding parameter names (default: "name").
+    value_col : str, optional
+        Column holding parameter values (default: "value").
+    unit_col : str or None, optional
+        Column holding unit strings (default: "unit"). None, or a column that is
+        absent from the table, leaves every parameter without units.
+
+    Returns
+    -------
+    tuple of (list, list, list)
+        Names, raw values, and units (None where a unit is missing).
+
+    Raises
+    ------
+    ValueError
+        If the file format is unsupported or a required column is missing.
+    """
+    if isinstance(table, (str, os.PathLike)):
+        path = Path(table)
+        suffix = path.suffix.lower()
+        if suffix == ".toml":
+            rows = _toml_rows(toml.load(path), name_col, value_col)
+        elif suffix in (".csv", ".tsv"):
+            with open(path, newline="") as f:
+                delimiter = "\t" if suffix == ".tsv" else ","
+                rows = list(csv.DictReader(f, delimiter=delimiter))
+        else:
+            raise ValueError(
+                f"Unsupported parameter table format '{path.suffix}' "
+                "(expected .csv, .tsv, or .toml)"
+            )
+        keys = set().union(*rows) if rows else set()
+        columns = {c: [row.get(c) for row in rows] for c in keys}
+    elif hasattr(table, "columns") and hasattr(table, "to_numpy"):
+        # pandas.DataFrame
+        columns = {str(c): table[c].to_numpy() for c in table.columns}
+    elif isinstance(table, Mapping):
+        columns = dict(table)
+    else:
+        array = table if isinstance(table, np.ndarray) else np.asarray(table, dtype=object)
+        if array.dtype.names is not None:
+            columns = {k: array[k] for k in array.dtype.names}
+        else:
+            array = np.atleast_2d(array)
+            columns = {name_col: array[:, 0], value_col: array[:, 1]}
+            if unit_col is not None and array.shape[1] > 2:
+                columns[unit_col] = array[:, 2]
+
+    for col in (name_col, value_col):
+        if col not in columns:
+            raise ValueError(f"Parameter table has no '{col}' column")
+    names = [str(n).strip() for n in columns[name_col]]
+    values = list(columns[value_col])
+    if unit_col is None or unit_col not in columns:
+        units = [None] * len(names)
+    else:
+        units = [
+            None if u is None or (isinstance(u, float) and np.isnan(u)) or not str(u).strip()
+            else str(u).strip()
+            for u in columns[unit_col]
+        ]
+    return names, values, units
+
+
+def validate_parameter_table(names, values, units, model=None):
+    """
+    Validate parameter table columns in one pass.
+
+    Values are converted to a float array at once; unit strings are de-duplicated
+    and each distinct unit is parsed only once.
+
+    Parameters
+    ----------
+    names : list of str
+        Parameter names.
+    values : list
+        Raw parameter values.
+    units : list of str or None
+        Unit strings (None for no units).
+    model : pysb.Model, optional
+        If given, names already used by a model component are rejected.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, dict)
+        The values as floats, and the distinct unit strings mapped to their
+        parsed `astropy.units.Unit`.
+
+    Raises
+    ------
+    ValueError
+        Listing every invalid name, value, or unit found.
+    """
+    import astropy.units as u
+
+    errors = []
+    names_array = np.asarray(names, dtype=str)
+    bad_names = [n for n in names if not n.isidentifier()]
+    if bad_names:
+        errors.append(f"invalid names {bad_names}")
+    unique_names, counts = np.unique(names_array, return_counts=True)
+    if np.any(counts > 1):
+        errors.append(f"duplicate names {unique_names[counts > 1].tolist()}")
+    if model is not None:
+        existing = [n for n in names if model.has_component(n)]
+        if existing:
+            errors.append(f"names already in the model {existing}")
+
+    try:
+        value_array = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        value_array = np.array([_as_float(v) for v in values], dtype=float)
+    bad = ~np.isfinite(value_array)
+    if np.any(bad):
+        errors.append(f"missing or non-numeric values for {names_array[bad].tolist()}")
+
+    parsed = {}
+    bad_units = []
+    for unit in dict.fromkeys(unit for unit in units if unit is not None):
+        try:
+            parsed[unit] = u.Unit(unit)
+        except (TypeError, ValueError):
+            bad_units.append(unit)
+    if bad_units:
+        errors.append(f"unrecognized units {bad_units}")
+
+    if errors:
+        raise ValueError("Invalid parameter table: " + "; ".join(errors))
+    return value_array, parsed
+
+
+def _as_float(value):
+    """Convert a value to float, returning NaN if it isn't numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,307 @@
+"""
+QSPy Functional-Tag Index
+=========================
+
+This module provides an index of a model's monomers by functional tag and by
+tag class. `qspy.core.Model` keeps the index up to date as monomers are added,
+renamed, or retagged with ``@``/``@=``, so queries such as "all ``protein``
+monomers" or "all ``PROTEIN.RECEPTOR`` monomers" are dictionary lookups instead
+of scans over `model.monomers`. The index also resolves the observables
+(through the model's dependency graph) and the generated species that involve
+the tagged monomers.
+
+Tag queries accept a tag Enum member (``PROTEIN.RECEPTOR``), a tag Enum class
+(``PROTEIN``, meaning its tag class), a `FunctionalTag`, or a string: a
+canonical tag (``"protein::receptor"``) or a tag class (``"protein"``).
+
+Classes
+-------
+TagIndex : Incrementally maintained index of monomers by functional tag.
+
+Functions
+---------
+model_tag_index : Return the functional-tag index for a model.
+
+Examples
+--------
+>>> index = model.tag_index
+>>> index.monomers(PROTEIN)
+[Monomer('L', ['r']) @ protein::ligand, Monomer('R', ['l']) @ protein::receptor]
+>>> index.observables(PROTEIN.RECEPTOR)
+[Observable('R_free', R(l=None))]
+"""
+
+import threading
+from enum import Enum
+
+import pysb.core
+
+from qspy.functionaltags import NO_TAG, TAG_SEP, FunctionalTag
+from qspy.utils.dependencies import model_graph
+
+
+def _tag_of(monomer):
+    """Return a monomer's functional tag (NO_TAG for untagged PySB monomers)."""
+    tag = getattr(monomer, "functional_tag", None)
+    return tag if isinstance(tag, FunctionalTag) else NO_TAG
+
+
+class TagIndex:
+    """
+    Incrementally maintained index of monomers by functional tag.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model whose monomers the index tracks.
+
+    Attributes
+    ----------
+    model : pysb.Model
+        The tracked model.
+
+    Methods
+    -------
+    add(component)
+        Index a new monomer (other components are ignored).
+    retag(monomer)
+        Move a monomer to the bucket of its new tag.
+    invalidate()
+        Rebuild the index on the next query.
+    monomers(key)
+        Monomers with a tag or tag class.
+    observables(key)
+        Observables whose patterns involve those monomers.
+    species(key)
+        Indices of generated species that contain those monomers.
+    tags()
+        Tags in use and their monomer counts.
+    """
+
+    def __init__(self, model):
+        """
+        Initialize the index from the model's current monomers.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model whose monomers the index tracks.
+        """
+        self.model = model
+        self._lock = threading.RLock()
+        self._species_key = None
+        self._species_map = {}
+        self._rebuild()
+
+    def _rebuild(self):
+        """Re-index every monomer of the model."""
+        # monomer name -> indexed tag
+        self._tags = {}
+        # FunctionalTag -> {name: monomer}; tag class -> {name: monomer}
+        self._by_tag = {}
+        self._by_class = {}
+        self._stale = False
+        for monomer in self.model.monomers:
+            self.add(monomer)
+
+    def add(self, component):
+        """
+        Index a new monomer; other components are ignored.
+
+        Parameters
+        ----------
+        component : pysb.Component
+            The component added to the model.
+        """
+        if not isinstance(component, pysb.core.Monomer):
+            return
+        with self._lock:
+            self._insert(component, _tag_of(component))
+
+    def _insert(self, monomer, tag):
+        """Add a monomer to the buckets of a tag."""
+        self._tags[monomer.name] = tag
+        self._by_tag.setdefault(tag, {})[monomer.name] = monomer
+        self._by_class.setdefault(tag.class_, {})[monomer.name] = monomer
+
+    def _remove(self, name, tag):
+        """Remove a monomer name from the buckets of a tag."""
+        for buckets, key in ((self._by_tag, tag), (self._by_class, tag.class_)):
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.pop(name, None)
+                if not bucket:
+                    del buckets[key]
+
+    def retag(self, monomer):
+        """
+        Move a monomer from the bucket it was indexed under to that of its tag.
+
+        Parameters
+        ----------
+        monomer : pysb.Monomer
+            The retagged monomer.
+        """
+        with self._lock:
+            indexed = self._tags.get(monomer.name)
+            if indexed is None:
+                return
+            self._remove(monomer.name, indexed)
+            self._insert(monomer, _tag_of(monomer))
+
+    def invalidate(self):
+        """
+        Rebuild the index on the next query.
+
+        Call after renaming a monomer.
+        """
+        with self._lock:
+            self._stale = True
+
+    def _refresh(self):
+        """Rebuild if the index is stale or missed a monomer."""
+        with self._lock:
+            if self._stale or len(self._tags) != len(self.model.monomers):
+                self._rebuild()
+
+    def _bucket(self, key):
+        """
+        Return the {name: monomer} bucket for a tag query.
+
+        Parameters
+        ----------
+        key : Enum, type, FunctionalTag, or str
+            Tag member, tag Enum class, tag, canonical tag string, or tag class.
+
+        Returns
+        -------
+        dict
+            The matching monomers by name (empty if none).
+
+        Raises
+        ------
+        TypeError
+            If the key is not a recognized tag query.
+        """
+        if isinstance(key, FunctionalTag):
+            return self._by_tag.get(key, {})
+        if isinstance(key, Enum):
+            return self._by_tag.get(FunctionalTag.of(key), {})
+        if isinstance(key, type) and issubclass(key, Enum):
+            members = list(key)
+            if not members:
+                return {}
+            return self._by_class.get(FunctionalTag.of(members[0]).class_, {})
+        if isinstance(key, str):
+            if TAG_SEP in key:
+                return self._by_tag.get(FunctionalTag(*FunctionalTag.parse(key)), {})
+            return self._by_class.get(key, {})
+        raise TypeError(f"Cannot query the tag index with {key!r}")
+
+    def monomers(self, key):
+        """
+        List the monomers with a tag or tag class.
+
+        Parameters
+        ----------
+        key : Enum, type, FunctionalTag, or str
+            E.g. ``PROTEIN.RECEPTOR``, ``PROTEIN``, ``"protein::receptor"``,
+            or ``"protein"``.
+
+        Returns
+        -------
+        list of pysb.Monomer
+            The matching monomers, in the order they were indexed.
+        """
+        self._refresh()
+        with self._lock:
+            return list(self._bucket(key).values())
+
+    def observables(self, key):
+        """
+        List the observables whose patterns involve monomers with a tag.
+
+        Parameters
+        ----------
+        key : Enum, type, FunctionalTag, or str
+            Tag query (see `monomers`).
+
+        Returns
+        -------
+        list of pysb.Observable
+            The matching observables, in model order.
+        """
+        names = [m.name for m in self.monomers(key)]
+        if not names:
+            return []
+        graph = model_graph(self.model)
+        found = set()
+        for name in names:
+            found.update(graph.dependents(name, recursive=False))
+        return [obs for obs in self.model.observables if obs.name in found]
+
+    def species(self, key):
+        """
+        List the generated species that contain monomers with a tag.
+
+        Requires a generated reaction network (`model.species`); the
+        monomer-to-species map is rebuilt only when the network changes.
+
+        Parameters
+        ----------
+        key : Enum, type, FunctionalTag, or str
+            Tag query (see `monomers`).
+
+        Returns
+        -------
+        list of int
+            Sorted indices into `model.species` (empty if no network).
+        """
+        names = [m.name for m in self.monomers(key)]
+        species = self.model.species
+        with self._lock:
+            species_key = (id(species), len(species))
+            if species_key != self._species_key:
+                species_map = {}
+                for i, cp in enumerate(species):
+                    for mp in cp.monomer_patterns:
+                        species_map.setdefault(mp.monomer.name, set()).add(i)
+                self._species_map, self._species_key = species_map, species_key
+            found = set()
+            for name in names:
+                found.update(self._species_map.get(name, ()))
+        return sorted(found)
+
+    def tags(self):
+        """
+        Return the tags in use and their monomer counts.
+
+        Returns
+        -------
+        dict
+            Maps canonical tag strings to the number of monomers with the tag.
+        """
+        self._refresh()
+        with self._lock:
+            return {tag.value: len(bucket) for tag, bucket in self._by_tag.items()}
+
+
+def model_tag_index(model):
+    """
+    Return the functional-tag index for a model.
+
+    QSPy models keep their index up to date as monomers are added and retagged;
+    plain PySB models get a freshly built index.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model.
+
+    Returns
+    -------
+    TagIndex
+        The model's tag index.
+    """
+    index = getattr(model, "tag_index", None)
+    return index if isinstance(index, TagIndex) else TagIndex(model)
@@ -8,12 +8,55 @@ Modules
 -------
 - metadata : Model metadata tracking and export utilities.
 - modelchecker : Automated model validation and consistency checks.
+- scheduler : Concurrent, cached scheduling of model checks.
+- units : Incremental unit checking for model construction.
 
 Classes
 -------
 - ModelMetadataTracker
 - ModelChecker
+
+Both classes are imported lazily on first access, so importing a submodule such
+as `qspy.validation.units` doesn't pull in the metadata tracker's dependencies.
 """
 
-from qspy.validation.metadata import ModelMetadataTracker
-from qspy.validation.modelchecker import ModelChecker
+import importlib
+
+_LAZY_ATTRS = {
+    "ModelMetadataTracker": "qspy.validation.metadata",
+    "ModelChecker": "qspy.validation.modelchecker",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """
+    Import lazily loaded public attributes on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name.
+
+    Returns
+    -------
+    object
+        The requested attribute.
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a lazily loaded attribute.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily loaded attributes in `dir(qspy.validation)`."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
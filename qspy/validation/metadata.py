@@ -6,11 +6,22 @@ This module provides utilities for capturing, tracking, and exporting model meta
 in QSPy workflows. It includes environment capture, model hashing, and TOML export
 for reproducibility and provenance tracking.
 
+Host information and package versions don't change within a process, so the
+environment snapshot is captured once per process and shared by every tracker.
+It can also be persisted under ENV_CACHE_DIR, keyed by the host, the interpreter,
+and an installed-package fingerprint, so later runs on the same node skip the
+capture.
+
 Classes
 -------
 QSPyBench : MicroBench-based class for capturing Python and host environment info.
 ModelMetadataTracker : Tracks model metadata, environment, and provides export/load utilities.
 
+Functions
+---------
+environment_fingerprint : Fingerprint the interpreter and its installed packages.
+clear_environment_snapshot : Forget the memoized environment snapshot.
+
 Examples
 --------
 >>> tracker = ModelMetadataTracker(version="1.0", author="Alice", export_toml=True)
@@ -19,6 +30,7 @@ Examples
 >>> ModelMetadataTracker.load_metadata_toml("MyModel__Alice__abcd1234__2024-07-01.toml")
 """
 
+import copy
 import getpass
 import hashlib
 import io
@@ -26,6 +38,8 @@ import json
 import logging
 import os
 import platform
+import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -41,7 +55,9 @@ from microbench import MicroBench, MBHostInfo, MBPythonVersion
 from pysb.core import SelfExporter
 
 import qspy
+import qspy.config
 from qspy.config import METADATA_DIR, LOGGER_NAME
+from qspy.utils.hashing import COMPONENT_KINDS, model_tree, structural_hash
 from qspy.utils.logging import ensure_qspy_logging
 
 
@@ -59,6 +75,56 @@ class QSPyBench(MicroBench, MBPythonVersion, MBHostInfo):
     capture_versions = (qspy, numpy, scipy, sympy, pysb, pysb.pkpd, pysb.units, mergram)
 
 
+# Environment snapshot shared by every tracker in this process.
+_ENV_SNAPSHOT = None
+
+
+def environment_fingerprint():
+    """
+    Fingerprint the host, the interpreter, and its installed packages.
+
+    Combines the host name and machine type, the interpreter path and version,
+    and the QSPy version with the modification times of the site-packages
+    directories on `sys.path`. The host is included because the snapshot holds
+    host information, and cache directories may be shared between nodes (e.g.,
+    on a network home directory).
+    Installing, upgrading, or removing a package changes its site-packages
+    directory, and so changes the fingerprint. Only `stat` calls are needed, so
+    this is much cheaper than enumerating distributions.
+
+    Returns
+    -------
+    str
+        SHA256 hex digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{platform.node()}\n{platform.machine()}\n".encode())
+    digest.update(f"{sys.executable}\n{sys.version}\n{qspy.__version__}\n".encode())
+    for entry in sys.path:
+        if os.path.basename(entry) not in ("site-packages", "dist-packages"):
+            continue
+        try:
+            mtime = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{entry}:{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+def clear_environment_snapshot():
+    """
+    Forget the memoized environment snapshot.
+
+    The next tracker recaptures the environment (or reloads it from disk).
+
+    Returns
+    -------
+    None
+    """
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = None
+
+
 class ModelMetadataTracker:
     """
     Tracks and exports QSPy model metadata, including environment and hash.
@@ -76,6 +142,9 @@ class ModelMetadataTracker:
         If True, export metadata to TOML on creation (default: False).
     capture_conda_env : bool, optional
         If True, capture the active conda environment name (default: False).
+    persist_environment : bool, optional
+        If True, reuse (or write) an environment snapshot persisted under
+        ENV_CACHE_DIR for this host, interpreter and package set (default: False).
 
     Attributes
     ----------
@@ -90,7 +159,9 @@ class ModelMetadataTracker:
     timestamp : str
         ISO timestamp of metadata creation.
     hash : str
-        SHA256 hash of model rules and parameters.
+        SHA256 structural (Merkle root) hash of the model.
+    component_hashes : dict
+        Merkle digests of each component kind, for diffing exported versions.
     env_metadata : dict
         Captured environment metadata.
     metadata : dict
@@ -99,9 +170,9 @@ class ModelMetadataTracker:
     Methods
     -------
     compute_model_hash()
-        Compute a hash from model rules and parameters.
-    capture_environment()
-        Capture execution environment metadata.
+        Compute the structural (Merkle root) hash of the model.
+    capture_environment(persist=False, cache_dir=None)
+        Return the memoized execution environment metadata.
     export_metadata_toml(path=None, use_metadata_dir=True)
         Export metadata to a TOML file.
     load_metadata_toml(path)
@@ -115,7 +186,12 @@ class ModelMetadataTracker:
     """
 
     def __init__(
-        self, version="0.1.0", author=None, export_toml=False, capture_conda_env=False
+        self,
+        version="0.1.0",
+        author=None,
+        export_toml=False,
+        capture_conda_env=False,
+        persist_environment=False,
     ):
         """
         Initialize the ModelMetadataTracker.
@@ -130,6 +206,9 @@ class ModelMetadataTracker:
             If True, export metadata to TOML on creation (default: False).
         capture_conda_env : bool, optional
             If True, capture the active conda environment name (default: False).
+        persist_environment : bool, optional
+            If True, reuse (or write) an environment snapshot persisted under
+            ENV_CACHE_DIR for this host, interpreter and package set (default: False).
 
         Raises
         ------
@@ -148,7 +227,10 @@ class ModelMetadataTracker:
             self.current_user = getpass.getuser()
             self.timestamp = datetime.now().isoformat()
             self.hash = self.compute_model_hash()
-            self.env_metadata = self.capture_environment()
+            self.component_hashes = {
+                kind: model_tree(self.model).kind_hash(kind) for kind in COMPONENT_KINDS
+            }
+            self.env_metadata = self.capture_environment(persist=persist_environment)
 
             if capture_conda_env:
                 conda_env = os.environ.get("CONDA_DEFAULT_ENV", None)
@@ -161,6 +243,7 @@ class ModelMetadataTracker:
                 "current_user": self.current_user,
                 "created_at": self.timestamp,
                 "hash": self.hash,
+                "component_hashes": self.component_hashes,
                 "model_name": self.model.name or "unnamed_model",
                 "env": self.env_metadata,
             }
@@ -176,49 +259,139 @@ class ModelMetadataTracker:
 
     def compute_model_hash(self):
         """
-        Create a hash from model definition (rules + parameters).
+        Compute the structural hash of the model definition.
+
+        This is the root of the model's Merkle tree over all component kinds
+        (see `qspy.utils.hashing`): it is independent of declaration order and is
+        the same hash used to key the network cache.
 
         Returns
         -------
         str
-            SHA256 hash of the model's rules and parameters.
+            SHA256 structural hash of the model.
         """
         try:
-            s = repr(self.model.rules) + repr(self.model.parameters)
-            return hashlib.sha256(s.encode()).hexdigest()
+            return structural_hash(self.model)
         except Exception as e:
             logger = logging.getLogger(LOGGER_NAME)
             logger.error(f"[QSPy][ERROR] Exception in compute_model_hash: {e}")
             raise
 
-    def capture_environment(self):
+    def capture_environment(self, persist=False, cache_dir=None):
         """
-        Capture execution environment via microbench.
+        Return the execution environment metadata, capturing it once per process.
+
+        The first call captures the environment via microbench (or, with
+        `persist`, loads a snapshot saved for the same interpreter and package
+        fingerprint); later calls return a copy of the memoized snapshot. The
+        snapshot's timing fields therefore describe the original capture.
+
+        Parameters
+        ----------
+        persist : bool, optional
+            If True, load the snapshot from `cache_dir` if present, and save a
+            newly captured one there (default: False).
+        cache_dir : str or Path, optional
+            Directory for persisted snapshots (default: the current
+            `qspy.config.ENV_CACHE_DIR`).
 
         Returns
         -------
         dict
             Dictionary of captured environment metadata.
         """
+        global _ENV_SNAPSHOT
         try:
-            bench = QSPyBench()
-
-            @bench
-            def noop():
-                pass
-
-            noop()
-            bench.outfile.seek(0)
-            metadata = bench.outfile.read()
-            if metadata == "":
-                return {"microbench": "No metadata captured."}
-            else:
-                return json.loads(metadata)
+            if _ENV_SNAPSHOT is None:
+                path = None
+                snapshot = None
+                if persist:
+                    if cache_dir is None:
+                        cache_dir = qspy.config.ENV_CACHE_DIR
+                    path = Path(cache_dir) / f"{environment_fingerprint()}.json"
+                    snapshot = self._load_environment(path)
+                if snapshot is None:
+                    snapshot = self._run_bench()
+                    if path is not None:
+                        self._store_environment(path, snapshot)
+                _ENV_SNAPSHOT = snapshot
+            return copy.deepcopy(_ENV_SNAPSHOT)
         except Exception as e:
             logger = logging.getLogger(LOGGER_NAME)
             logger.error(f"[QSPy][ERROR] Exception in capture_environment: {e}")
             return {"microbench": f"Error capturing metadata: {e}"}
 
+    @staticmethod
+    def _run_bench():
+        """
+        Capture execution environment via microbench.
+
+        Returns
+        -------
+        dict
+            Dictionary of captured environment metadata.
+        """
+        bench = QSPyBench()
+
+        @bench
+        def noop():
+            pass
+
+        noop()
+        bench.outfile.seek(0)
+        metadata = bench.outfile.read()
+        if metadata == "":
+            return {"microbench": "No metadata captured."}
+        else:
+            return json.loads(metadata)
+
+    @staticmethod
+    def _load_environment(path):
+        """
+        Load a persisted environment snapshot.
+
+        Parameters
+        ----------
+        path : Path
+            Snapshot file.
+
+        Returns
+        -------
+        dict or None
+            The snapshot, or None if it is missing or unreadable.
+        """
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _store_environment(path, snapshot):
+        """
+        Persist an environment snapshot atomically.
+
+        Parameters
+        ----------
+        path : Path
+            Snapshot file.
+        snapshot : dict
+            Environment metadata to save.
+
+        Returns
+        -------
+        None
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
     def export_metadata_toml(self, path=None, use_metadata_dir=True):
         """
         Export metadata to a TOML file with autogenerated filename if none is provided.
@@ -7,6 +7,16 @@ It checks for unused or zero-valued parameters, unused monomers, missing initial
 conditions, dangling bonds, unit consistency, and other common modeling issues.
 Warnings are logged and also issued as Python warnings for user visibility.
 
+`ModelChecker.check` runs the default checks through a `CheckScheduler`
+(`qspy.validation.scheduler`): independent checks run concurrently, and each
+check's findings are cached by the structural hash of the components it reads,
+so re-checking an unchanged model replays the cached findings. By default the
+findings live in one bounded in-memory cache shared by every checker in the
+process; pass ``persist=True`` to keep them on disk under `CHECK_CACHE_DIR`
+instead, across processes. Findings are always reported in the order of `MODEL_CHECKS`. The usage checks (unused
+monomers and parameters, missing initial conditions, unreferenced expressions)
+are answered from the model's dependency graph (`qspy.utils.dependencies`).
+
 Classes
 -------
 ModelChecker : Performs a suite of checks on a PySB/QSPy model for common issues.
@@ -18,27 +28,91 @@ Examples
 """
 
 import logging
+import threading
 import warnings
 
+import qspy.config
+
 import numpy as np
 
 from pysb.core import SelfExporter, MonomerPattern
 from pysb.pattern import (
     check_dangling_bonds,
-    monomers_from_pattern,
     SpeciesPatternMatcher,
     RulePatternMatcher,
     ReactionPatternMatcher,
 )
-from pysb.bng import generate_equations
-from pysb.units.core import check as units_check
+from pysb.units.core import Unit, UnitsWarning, check as units_check
 
-from qspy.core import Monomer, Parameter
+from qspy.core import Monomer
 from qspy.utils.logging import ensure_qspy_logging, log_event
+from qspy.utils.network_cache import generate_equations
+from qspy.utils.profiling import timed
+from qspy.validation.scheduler import CheckResultCache, CheckScheduler, CheckSpec
+from qspy.validation.units import IncrementalUnitChecker
 from qspy.config import LOGGER_NAME
+from qspy.utils.dependencies import model_graph
+from qspy.utils.hashing import NETWORK_KINDS
 
 warnings.simplefilter("always", UserWarning)  # Always show UserWarnings
 
+# Warning categories a cached finding may be replayed with.
+_CATEGORIES = {"UserWarning": UserWarning, "UnitsWarning": UnitsWarning}
+
+
+def _unit_annotations(model):
+    """Return a stable string of the model's unit annotations (for cache keys)."""
+    return repr(
+        sorted(
+            (a.subject.name, str(a.value))
+            for a in model.annotations
+            if isinstance(a, Unit)
+        )
+    )
+
+
+# In-memory findings shared by every checker that doesn't persist its cache.
+_SHARED_CACHE = None
+
+
+def _shared_cache():
+    """Return the process-wide in-memory CheckResultCache, creating it on first use."""
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = CheckResultCache()
+    return _SHARED_CACHE
+
+
+# Default checks run by `ModelChecker.check`, in reporting order.
+MODEL_CHECKS = (
+    CheckSpec("check_unused_monomers", reads=("monomers", "rules")),
+    CheckSpec(
+        "check_unused_parameters",
+        reads=(
+            "parameters", "rules", "initials", "expressions", "compartments", "energypatterns"
+        ),
+    ),
+    CheckSpec("check_zero_valued_parameters", reads=("parameters",)),
+    CheckSpec("check_missing_initial_conditions", reads=("monomers", "initials")),
+    CheckSpec("check_dangling_reused_bonds", reads=("rules",)),
+    # pysb's unit check warns through the global warnings machinery, which
+    # can't be captured per thread, so it runs in the calling thread.
+    CheckSpec(
+        "check_units",
+        reads=("parameters", "expressions", "compartments", "observables"),
+        threaded=False,
+        extra=_unit_annotations,
+    ),
+    # Populates the model's network (from the network cache when possible), so
+    # it always runs; structurally broken rules are reported first.
+    CheckSpec(
+        "check_equations_generation",
+        reads=NETWORK_KINDS,
+        after=("check_dangling_reused_bonds",),
+        cache=False,
+    ),
+)
+
 
 class ModelChecker:
     """
@@ -59,6 +133,15 @@ class ModelChecker:
         The model to check. If None, uses the current SelfExporter.default_model.
     logger_name : str, optional
         Name of the logger to use (default: LOGGER_NAME).
+    max_workers : int, optional
+        Threads for concurrent checks (default: one per independent check).
+    cache : bool, optional
+        Whether to cache check findings by structural hash (default: True).
+    persist : bool, optional
+        Keep cached findings on disk, across processes, instead of in the
+        shared in-memory cache (default: False).
+    cache_dir : str or Path, optional
+        Directory for persisted findings (default: CHECK_CACHE_DIR at call time).
 
     Attributes
     ----------
@@ -66,9 +149,21 @@ class ModelChecker:
         The model being checked.
     logger : logging.Logger
         Logger for outputting warnings and info.
+    scheduler : CheckScheduler
+        Scheduler running the default checks.
+    results : dict
+        `CheckResult` of each check from the last `check` call.
     """
 
-    def __init__(self, model=None, logger_name=LOGGER_NAME):
+    def __init__(
+        self,
+        model=None,
+        logger_name=LOGGER_NAME,
+        max_workers=None,
+        cache=True,
+        persist=False,
+        cache_dir=None,
+    ):
         """
         Initialize the ModelChecker.
 
@@ -78,12 +173,30 @@ class ModelChecker:
             The model to check. If None, uses the current SelfExporter.default_model.
         logger_name : str, optional
             Name of the logger to use.
+        max_workers : int, optional
+            Threads for concurrent checks (default: one per independent check).
+        cache : bool, optional
+            Whether to cache check findings by structural hash (default: True).
+        persist : bool, optional
+            Keep cached findings on disk, across processes, instead of in the
+            shared in-memory cache (default: False).
+        cache_dir : str or Path, optional
+            Directory for persisted findings (default: CHECK_CACHE_DIR at call time).
         """
         self.model = model
         if model is None:
             self.model = SelfExporter.default_model
         ensure_qspy_logging()
         self.logger = logging.getLogger(logger_name)
+        self._local = threading.local()
+        if persist and cache_dir is None:
+            cache_dir = qspy.config.CHECK_CACHE_DIR
+        self.scheduler = CheckScheduler(
+            MODEL_CHECKS,
+            max_workers=max_workers,
+            cache=(CheckResultCache(cache_dir) if persist else _shared_cache()) if cache else None,
+        )
+        self.results = {}
         self.check()
 
     @log_event()
@@ -96,20 +209,91 @@ class ModelChecker:
         None
         """
         self.logger.info("🔍 Running ModelChecker...")
-        self.check_unused_monomers()
-        self.check_unused_parameters()
-        self.check_zero_valued_parameters()
-        self.check_missing_initial_conditions()
-        # self.check_unconnected_species()
-        # self.check_unbound_sites()
-        # self.check_overdefined_rules()
-        # self.check_unreferenced_expressions()
-        # units_check(self.model)
-        self.check_dangling_reused_bonds()
-        self.check_units()
-        self.check_equations_generation()
+        # Optional checks (not scheduled by default): check_unbound_sites,
+        # check_overdefined_rules, check_unreferenced_expressions.
+        self.results = self.scheduler.run(self.model, self.collect)
+        for result in self.results.values():
+            for finding in result.findings:
+                self._emit(finding)
+        # A cached check_units result skips the call that marks units checked.
+        IncrementalUnitChecker.for_model(self.model).mark_checked()
         self.logger.info("✅ ModelChecker checks completed.")
 
+    def collect(self, name):
+        """
+        Run one check and return its findings instead of reporting them.
+
+        Parameters
+        ----------
+        name : str
+            Name of the check method (e.g. "check_unused_monomers").
+
+        Returns
+        -------
+        list of dict
+            The findings reported by the check.
+        """
+        self._local.findings = []
+        try:
+            getattr(self, name)()
+            return self._local.findings
+        finally:
+            self._local.findings = None
+
+    def _report(self, msg, level=logging.WARNING, category=UserWarning, prefix="⚠️ ", console=True):
+        """
+        Report a finding, or record it if the check runs under `collect`.
+
+        Parameters
+        ----------
+        msg : str
+            The finding.
+        level : int, optional
+            Logging level (default: logging.WARNING).
+        category : type, optional
+            Warning category (default: UserWarning).
+        prefix : str, optional
+            Prefix for the log and console message (default: "⚠️ ").
+        console : bool, optional
+            Whether to print the finding (default: True).
+
+        Returns
+        -------
+        None
+        """
+        finding = {
+            "message": msg,
+            "level": level,
+            "category": category.__name__,
+            "prefix": prefix,
+            "console": console,
+        }
+        findings = getattr(self._local, "findings", None)
+        if findings is not None:
+            findings.append(finding)
+        else:
+            self._emit(finding)
+
+    def _emit(self, finding):
+        """
+        Log, warn, and optionally print a finding.
+
+        Parameters
+        ----------
+        finding : dict
+            Finding recorded by `_report`.
+
+        Returns
+        -------
+        None
+        """
+        msg = finding["message"]
+        self.logger.log(finding["level"], f"{finding['prefix']}{msg}")
+        warnings.warn(msg, category=_CATEGORIES.get(finding["category"], UserWarning))
+        if finding["console"]:
+            print(f"{finding['prefix']}{msg}")  # Print to console for visibility
+
+    @timed()
     def check_unused_monomers(self):
         """
         Check for monomers that are not used in any rules.
@@ -120,27 +304,12 @@ class ModelChecker:
         -------
         None
         """
-        used = set()
-        for rule in self.model.rules:
-            used.update(
-                m.name
-                for m in monomers_from_pattern(rule.rule_expression.reactant_pattern)
-            )
-            # monomers_from_pattern doesn't handle None, so we need to
-            # check here or it will cause a problem with the set.union method.
-            if rule.is_reversible:
-                used.update(
-                    m.name
-                    for m in monomers_from_pattern(rule.rule_expression.product_pattern)
-                )
-
-        unused = [m.name for m in self.model.monomers if m.name not in used]
+        unused = model_graph(self.model).unreferenced("monomers", by=("rules",))
         if len(unused) > 0:
             msg = f"Unused Monomers (not included in any Rules): {[m for m in unused]}"
-            self.logger.warning(f"⚠️ {msg}")
-            warnings.warn(msg, category=UserWarning)
-            print(f"⚠️ {msg}")  # Print to console for visibility
+            self._report(msg)
 
+    @timed()
     def check_unused_parameters(self):
         """
         Check for parameters that are not used in rules, initials, or expressions.
@@ -151,29 +320,12 @@ class ModelChecker:
         -------
         None
         """
-        used = set()
-        for rule in self.model.rules:
-            if isinstance(rule.rate_forward, Parameter):
-                used.add(rule.rate_forward.name)
-            if rule.is_reversible:
-                if isinstance(rule.rate_reverse, Parameter):
-                    used.add(rule.rate_reverse.name)
-        for ic in self.model.initials:
-            if isinstance(ic.value, Parameter):
-                used.add(ic.value.name)
-        for expr in self.model.expressions:
-            used.update(p.name for p in expr.expr.atoms(Parameter))
-        for compartment in self.model.compartments:
-            if isinstance(compartment.size, Parameter):
-                used.add(compartment.size.name)
-
-        unused = [p.name for p in self.model.parameters if p.name not in used]
+        unused = model_graph(self.model).unreferenced("parameters")
         if unused:
             msg = f"Unused Parameters: {[p for p in unused]}"
-            self.logger.warning(f"⚠️ {msg}")
-            warnings.warn(msg, category=UserWarning)
-            print(f"⚠️ {msg}")  # Print to console for visibility
+            self._report(msg)
 
+    @timed()
     def check_zero_valued_parameters(self):
         """
         Check for parameters with a value of zero.
@@ -187,10 +339,9 @@ class ModelChecker:
         zeros = [p for p in self.model.parameters if np.isclose(p.value, 0.0)]
         if zeros:
             msg = f"Zero-valued Parameters: {[p.name for p in zeros]}"
-            self.logger.warning(f"⚠️ {msg}")
-            warnings.warn(msg, category=UserWarning)
-            print(f"⚠️ {msg}")  # Print to console for visibility
+            self._report(msg)
 
+    @timed()
     def check_missing_initial_conditions(self):
         """
         Check for monomers missing initial conditions.
@@ -201,19 +352,12 @@ class ModelChecker:
         -------
         None
         """
-        defined = list()
-        for initial in self.model.initials:
-            for m in monomers_from_pattern(initial.pattern):
-                defined.append(m.name)
-        defined = set(defined)
-        all_monomers = set(m.name for m in self.model.monomers)
-        missing = all_monomers - defined
+        missing = model_graph(self.model).unreferenced("monomers", by=("initials",))
         if missing:
-            msg = f"Monomers missing initial conditions: {list(missing)}"
-            self.logger.warning(f"⚠️ {msg}")
-            warnings.warn(msg, category=UserWarning)
-            print(f"⚠️ {msg}")  # Print to console for visibility
+            msg = f"Monomers missing initial conditions: {missing}"
+            self._report(msg)
 
+    @timed()
     def check_dangling_reused_bonds(self):
         """
         Check for dangling or reused bonds in all rules.
@@ -227,22 +371,22 @@ class ModelChecker:
                 check_dangling_bonds(rule.rule_expression.reactant_pattern)
             except Exception as e:
                 msg = f"Error checking reactant pattern in rule '{rule.name}': {e}"
-                self.logger.error(msg)
-                warnings.warn(msg, category=UserWarning)
-                print(msg)  # Print to console for visibility
+                self._report(msg, level=logging.ERROR, prefix="")
             if rule.is_reversible:
                 try:
                     check_dangling_bonds(rule.rule_expression.product_pattern)
                 except Exception as e:
                     msg = f"Error checking product pattern in rule '{rule.name}': {e}"
-                    self.logger.error(msg)
-                    warnings.warn(msg, category=UserWarning)
-                    print(msg)  # Print to console for visibility
+                    self._report(msg, level=logging.ERROR, prefix="")
 
+    @timed()
     def check_equations_generation(self):
         """
         Run the `generate_equations` function on the model and capture and report any errors.
 
+        The reaction network is loaded from the QSPy network cache when the model
+        structure is unchanged, so BioNetGen only runs on a cache miss.
+
         Returns
         -------
         None
@@ -252,21 +396,28 @@ class ModelChecker:
             self.logger.info("Model equations generated successfully.")
         except Exception as e:
             msg = f"Error generating model equations: {e}"
-            self.logger.error(msg)
-            warnings.warn(msg, category=UserWarning)
-            print(msg)  # Print to console for visibility
+            self._report(msg, level=logging.ERROR, prefix="")
 
     @log_event()
     def check_units(self):
         """
         Check for unit consistency in the model.
 
+        Runs the full-model check and then marks every unit as checked for the
+        incremental checker used by the `parameters` context.
+
         Returns
         -------
         None
         """
-        units_check(self.model)
-
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            units_check(self.model)
+        IncrementalUnitChecker.for_model(self.model).mark_checked()
+        for w in caught:
+            self._report(str(w.message), category=w.category, prefix="", console=False)
+
+    @timed()
     def check_unbound_sites(self):
         """
         Check for sites that never participate in bonds.
@@ -293,9 +444,9 @@ class ModelChecker:
 
         if unbound:
             msg = f"Unbound Sites (never participate in bonds): {unbound}"
-            self.logger.warning(f"⚠️ {msg}")
-            warnings.warn(msg, category=UserWarning)
+            self._report(msg, console=False)
 
+    @timed()
     def check_overdefined_rules(self):
         """
         Check for rules that define the same reaction more than once.
@@ -311,11 +462,11 @@ class ModelChecker:
             rxn = str(r.rule_expression())
             if rxn in seen:
                 msg = f"Overdefined reaction: '{rxn}' in rules `{seen[rxn]}` and `{r.name}`"
-                self.logger.warning(f"⚠️ {msg}")
-                warnings.warn(msg, category=UserWarning)
+                self._report(msg, console=False)
             else:
                 seen[rxn] = r.name
 
+    @timed()
     def check_unreferenced_expressions(self):
         """
         Check for expressions that are not referenced by any rule or observable.
@@ -326,17 +477,7 @@ class ModelChecker:
         -------
         None
         """
-        used = set()
-        for rule in self.model.rules:
-            if rule.rate_forward:
-                used.update(str(p) for p in rule.rate_forward.parameters)
-            if rule.rate_reverse:
-                used.update(str(p) for p in rule.rate_reverse.parameters)
-        for o in self.model.observables:
-            used.update(str(p) for p in o.function.atoms(Parameter))
-
-        exprs = [e.name for e in self.model.expressions if e.name not in used]
+        exprs = model_graph(self.model).unreferenced("expressions")
         if exprs:
             msg = f"Unreferenced Expressions: {exprs}"
-            self.logger.warning(f"⚠️ {msg}")
-            warnings.warn(msg, category=UserWarning)
+            self._report(msg, console=False)
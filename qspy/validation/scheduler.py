@@ -0,0 +1,469 @@
+"""
+QSPy Model Check Scheduler
+==========================
+
+This module schedules `ModelChecker` checks. Each check is declared with the
+component kinds it reads and the checks that must run before it. Each check
+starts as soon as the checks in its `after` list have finished: thread-safe
+checks are submitted to a thread pool and checks that are not thread-safe run
+in the calling thread, so the BioNetGen call (I/O-bound in a subprocess) waits
+only on its own dependencies and overlaps with the pure-Python checks.
+
+Each check's findings are cached under the structural hash of the component
+kinds it reads (`qspy.utils.hashing`), in a bounded per-cache LRU and optionally
+on disk, so re-validating an unchanged model replays the cached findings instead
+of recomputing them.
+
+Classes
+-------
+CheckSpec : Declaration of one model check.
+CheckResult : Findings of one check run.
+CheckResultCache : Cache of check findings keyed by structural hash.
+CheckScheduler : Runs checks in dependency order, concurrently where possible.
+
+Examples
+--------
+>>> scheduler = CheckScheduler(MODEL_CHECKS, max_workers=4)
+>>> results = scheduler.run(model, checker.collect)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from qspy.config import CHECK_CACHE_MAX_ENTRIES, LOGGER_NAME, QSPY_VERSION
+from qspy.utils.hashing import structural_hash
+from qspy.utils.logging import ensure_qspy_logging
+
+
+class CheckSpec(NamedTuple):
+    """
+    Declaration of one model check.
+
+    Attributes
+    ----------
+    name : str
+        Name of the `ModelChecker` method implementing the check.
+    reads : tuple of str
+        Component kinds the check reads; its cache key hashes only these.
+    after : tuple of str
+        Checks that must finish before this one starts.
+    threaded : bool
+        Whether the check may run on a worker thread alongside other checks.
+    cache : bool
+        Whether the check's findings may be cached. Checks with side effects on
+        the model (e.g. network generation) must not be cached.
+    extra : callable or None
+        Optional function of the model returning a string mixed into the cache
+        key, for inputs not covered by `reads` (e.g. unit annotations).
+    """
+
+    name: str
+    reads: tuple
+    after: tuple = ()
+    threaded: bool = True
+    cache: bool = True
+    extra: Optional[Callable] = None
+
+
+class CheckResult(NamedTuple):
+    """
+    Findings of one check run.
+
+    Attributes
+    ----------
+    findings : list of dict
+        The check's findings, in the order they were reported.
+    cached : bool
+        Whether the findings were loaded from the cache.
+    seconds : float
+        Wall time spent running (or loading) the check.
+    """
+
+    findings: list
+    cached: bool
+    seconds: float
+
+
+class CheckResultCache:
+    """
+    Cache of check findings keyed by structural hash.
+
+    Entries are kept in a least-recently-used dictionary of at most
+    `max_entries` findings per cache instance and, if `cache_dir` is given,
+    also written as JSON files under it (atomically, as in `NetworkCache`).
+
+    Parameters
+    ----------
+    cache_dir : str or Path, optional
+        Directory for persisted findings (default: None, memory only).
+    max_entries : int, optional
+        Findings kept in memory (default: CHECK_CACHE_MAX_ENTRIES).
+
+    Attributes
+    ----------
+    cache_dir : Path or None
+        Directory for persisted findings, or None if the cache is memory only.
+    max_entries : int
+        Findings kept in memory.
+
+    Methods
+    -------
+    key(model, spec)
+        Compute the cache key of a check for a model.
+    load(key)
+        Return cached findings, or None.
+    store(key, findings)
+        Cache a check's findings.
+    clear()
+        Remove all cached findings.
+    """
+
+    suffix = ".json"
+
+    def __init__(self, cache_dir=None, max_entries=CHECK_CACHE_MAX_ENTRIES):
+        """
+        Initialize the CheckResultCache.
+
+        Parameters
+        ----------
+        cache_dir : str or Path, optional
+            Directory for persisted findings (default: None, memory only).
+        max_entries : int, optional
+            Findings kept in memory (default: CHECK_CACHE_MAX_ENTRIES).
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_entries = int(max_entries)
+        self._memory = OrderedDict()
+        # Checks in one wave load and store from several threads.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model, spec):
+        """
+        Compute the cache key of a check for a model.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model being checked.
+        spec : CheckSpec
+            The check.
+
+        Returns
+        -------
+        str
+            Hex SHA-256 digest of the components the check reads.
+        """
+        extra = f"{spec.name}|qspy={QSPY_VERSION}"
+        if spec.extra is not None:
+            extra += f"|{spec.extra(model)}"
+        return structural_hash(model, kinds=spec.reads, extra=extra)
+
+    def path(self, key):
+        """
+        Path of the cached findings file for a key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `CheckResultCache.key`.
+
+        Returns
+        -------
+        Path
+            Location of the cached `.json` file.
+        """
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def load(self, key):
+        """
+        Return cached findings, or None.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `CheckResultCache.key`.
+
+        Returns
+        -------
+        list of dict or None
+            The cached findings, or None on a miss.
+        """
+        with self._lock:
+            findings = self._memory.get(key)
+            if findings is not None:
+                self._memory.move_to_end(key)
+                return findings
+        if self.cache_dir is None:
+            return None
+        path = self.path(key)
+        try:
+            findings = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"[QSPy] Discarding unreadable cached check result {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        self._remember(key, findings)
+        return findings
+
+    def _remember(self, key, findings):
+        """Keep findings in memory, evicting the least recently used beyond the limit."""
+        with self._lock:
+            self._memory[key] = findings
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def store(self, key, findings):
+        """
+        Cache a check's findings.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from `CheckResultCache.key`.
+        findings : list of dict
+            JSON-serializable findings.
+
+        Returns
+        -------
+        None
+        """
+        self._remember(key, findings)
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=f".{key[:16]}-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(findings, f)
+                os.replace(tmp_path, self.path(key))
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            self.logger.warning(f"[QSPy] Could not persist check result {key[:12]}: {e}")
+
+    def clear(self):
+        """
+        Remove all cached findings.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+
+class CheckScheduler:
+    """
+    Runs checks in dependency order, concurrently where possible.
+
+    Parameters
+    ----------
+    checks : sequence of CheckSpec
+        The checks, in reporting order.
+    max_workers : int, optional
+        Threads for concurrent checks (default: one per thread-safe check).
+    cache : CheckResultCache or None, optional
+        Cache for check findings; None disables caching.
+
+    Attributes
+    ----------
+    checks : tuple of CheckSpec
+        The checks, in reporting order.
+    waves : list of list of CheckSpec
+        The checks grouped into dependency levels (a topological order).
+
+    Methods
+    -------
+    run(model, runner)
+        Run every check and return its findings.
+    """
+
+    def __init__(self, checks, max_workers=None, cache=None):
+        """
+        Initialize the CheckScheduler.
+
+        Parameters
+        ----------
+        checks : sequence of CheckSpec
+            The checks, in reporting order.
+        max_workers : int, optional
+            Threads for concurrent checks.
+        cache : CheckResultCache or None, optional
+            Cache for check findings; None disables caching.
+
+        Raises
+        ------
+        ValueError
+            If a dependency is unknown or the dependencies are cyclic.
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.checks = tuple(checks)
+        self.max_workers = max_workers
+        self.cache = cache
+        self.waves = self._waves(self.checks)
+
+    @staticmethod
+    def _waves(checks):
+        """
+        Group checks into dependency levels (a topological sort).
+
+        Parameters
+        ----------
+        checks : tuple of CheckSpec
+            The checks.
+
+        Returns
+        -------
+        list of list of CheckSpec
+            Checks whose dependencies are all in earlier levels.
+        """
+        names = {spec.name for spec in checks}
+        for spec in checks:
+            unknown = set(spec.after) - names
+            if unknown:
+                raise ValueError(f"Check '{spec.name}' depends on unknown checks {sorted(unknown)}")
+        done, waves, pending = set(), [], list(checks)
+        while pending:
+            wave = [spec for spec in pending if set(spec.after) <= done]
+            if not wave:
+                raise ValueError(
+                    f"Cyclic check dependencies among {[spec.name for spec in pending]}"
+                )
+            waves.append(wave)
+            done.update(spec.name for spec in wave)
+            pending = [spec for spec in pending if spec.name not in done]
+        return waves
+
+    def _run_one(self, model, spec, runner, key):
+        """Run (or load) one check and return its CheckResult."""
+        start = time.perf_counter()
+        if key is not None:
+            findings = self.cache.load(key)
+            if findings is not None:
+                return CheckResult(findings, True, time.perf_counter() - start)
+        findings = runner(spec.name)
+        if key is not None:
+            self.cache.store(key, findings)
+        return CheckResult(findings, False, time.perf_counter() - start)
+
+    def run(self, model, runner):
+        """
+        Run every check and return its findings.
+
+        Each check starts as soon as the checks it runs after have finished.
+        Cache keys are computed before any check starts, so they reflect the
+        model as the checks see it.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model being checked.
+        runner : callable
+            Function taking a check name, running the check, and returning its
+            findings as a list of JSON-serializable dicts.
+
+        Returns
+        -------
+        dict
+            Maps check names to `CheckResult`, in reporting order.
+        """
+        order = [spec for wave in self.waves for spec in wave]
+        keys = {
+            spec.name: (
+                CheckResultCache.key(model, spec)
+                if self.cache is not None and spec.cache
+                else None
+            )
+            for spec in order
+        }
+        workers = self.max_workers or sum(spec.threaded for spec in order)
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        pooled = {spec.name for spec in order if spec.threaded and executor is not None}
+        futures = {spec.name: Future() for spec in order}
+        waiting = {spec.name: set(spec.after) for spec in order}
+        dependents = {spec.name: [] for spec in order}
+        for spec in order:
+            for name in spec.after:
+                dependents[name].append(spec)
+        lock = threading.Lock()
+
+        def finished(name):
+            # Submit the pooled checks whose last dependency just finished.
+            ready = []
+            with lock:
+                for spec in dependents[name]:
+                    waiting[spec.name].discard(name)
+                    if not waiting[spec.name] and spec.name in pooled:
+                        ready.append(spec)
+            for spec in ready:
+                submit(spec)
+
+        def failed(name, error):
+            # A failed check fails everything that runs after it.
+            futures[name].set_exception(error)
+            for spec in dependents[name]:
+                if not futures[spec.name].done():
+                    failed(spec.name, error)
+
+        def settle(spec, future):
+            error = future.exception()
+            if error is not None:
+                failed(spec.name, error)
+                return
+            futures[spec.name].set_result(future.result())
+            finished(spec.name)
+
+        def submit(spec):
+            future = executor.submit(self._run_one, model, spec, runner, keys[spec.name])
+            future.add_done_callback(lambda f, spec=spec: settle(spec, f))
+
+        try:
+            for spec in order:
+                if spec.name in pooled and not spec.after:
+                    submit(spec)
+            # Checks that aren't thread-safe run here, in dependency order.
+            for spec in order:
+                if spec.name in pooled:
+                    continue
+                for name in spec.after:
+                    futures[name].result()
+                try:
+                    result = self._run_one(model, spec, runner, keys[spec.name])
+                except BaseException as e:
+                    failed(spec.name, e)
+                    raise
+                futures[spec.name].set_result(result)
+                finished(spec.name)
+            results = {spec.name: futures[spec.name].result() for spec in self.checks}
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        cached = sum(result.cached for result in results.values())
+        self.logger.info(
+            f"[QSPy] Ran {len(results)} model checks ({cached} loaded from cache)"
+        )
+        return results
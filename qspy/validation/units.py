@@ -0,0 +1,349 @@
+"""
+QSPy Incremental Unit Checking
+==============================
+
+This module provides incremental dimensional analysis for models built with the
+QSPy contexts. `pysb.units.core.check` re-scans every unit in the model (pairwise)
+each time it is called, so calling it at the end of every `parameters` block makes
+model construction quadratic in the number of blocks. The incremental checker
+instead remembers the canonicalized unit and physical type of every component it
+has already seen and checks only the unit annotations and parameters added since
+its last run: the new parameters plus any expressions defined in between. Rules
+carry no unit annotations of their own; their rates are covered through the
+parameters and expressions they reference, which are always new when the rule is.
+
+An expression's units are composed from its parameters when it is defined, so
+when an existing parameter is given new units the checker also re-checks the
+expressions that depend on it (found through the model's dependency graph) and
+warns if their recorded units no longer match.
+
+The warnings match those of `pysb.units.core.check` (duplicate, inconsistent, and
+missing units, all as `UnitsWarning`) and are attributed to the caller's frame,
+e.g. the ``with parameters():`` statement whose exit ran the check. Within a
+physical type, a new unit is compared with one representative per distinct unit
+already seen rather than with every earlier component, so an inconsistency is
+reported once per distinct conflicting unit. `ModelChecker.check_units` still
+runs the full-model check.
+
+Classes
+-------
+IncrementalUnitChecker : Per-model cache of checked units.
+
+Functions
+---------
+unit_type : Classify a unit by physical type, as `pysb.units.core.check` does.
+check_units_incremental : Check the units added to a model since the last check.
+
+Examples
+--------
+>>> check_units_incremental(model)  # checks only what's new since the last call
+"""
+
+import logging
+import sys
+import warnings
+from pathlib import Path
+
+import astropy.units as u
+from pysb.core import Parameter
+from pysb.units import unitdefs
+from pysb.units.core import Unit, UnitsWarning
+
+from qspy.config import LOGGER_NAME
+from qspy.utils.dependencies import model_graph
+from qspy.utils.logging import ensure_qspy_logging
+from qspy.utils.profiling import timed
+
+_QSPY_DIR = str(Path(__file__).resolve().parents[1])
+
+
+def unit_type(unit):
+    """
+    Classify a unit by physical type, as `pysb.units.core.check` does.
+
+    Parameters
+    ----------
+    unit : pysb.units.Unit
+        The unit annotation to classify.
+
+    Returns
+    -------
+    str
+        The physical type used to group units for consistency checks.
+    """
+    if unitdefs.is_concentration(unit.unit):
+        return "concentration"
+    if unitdefs.is_zero_order_rate_constant(unit.unit):
+        return "reaction rate"
+    if unitdefs.is_second_order_rate_constant(unit.unit):
+        return "second order rate constant"
+    return str(unit.physical_type)
+
+
+def _stacklevel(target=None):
+    """
+    Return the `warnings.warn` stacklevel that points a warning at `target`.
+
+    Parameters
+    ----------
+    target : frame, optional
+        Frame to attribute the warning to; None uses the first frame outside
+        the QSPy package.
+
+    Returns
+    -------
+    int
+        Stacklevel relative to the function calling `_stacklevel`.
+    """
+    frame = sys._getframe(1)
+    level = 1
+    while frame is not None:
+        if frame is target or (
+            target is None and not frame.f_code.co_filename.startswith(_QSPY_DIR)
+        ):
+            return level
+        frame = frame.f_back
+        level += 1
+    return 1
+
+
+class IncrementalUnitChecker:
+    """
+    Per-model cache of checked units.
+
+    Model annotations and parameters are append-only during construction, so
+    the checker keeps a watermark into each and treats everything past it as new.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to check.
+
+    Attributes
+    ----------
+    model : pysb.Model
+        The model being checked.
+    subject_units : dict
+        Maps checked component names to their (physical type, unit) pair.
+    type_units : dict
+        Maps each physical type to one representative unit per distinct unit.
+
+    Methods
+    -------
+    for_model(model)
+        Return the checker attached to a model, creating it if needed.
+    check(frame=None)
+        Check units added since the last check and return the number checked.
+    mark_checked()
+        Record the model's current units as checked without warning.
+    """
+
+    def __init__(self, model):
+        """
+        Initialize the IncrementalUnitChecker.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model to check.
+        """
+        ensure_qspy_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.model = model
+        self._frame = None
+        self._reset()
+
+    def _reset(self):
+        """Forget every checked unit and start again from an empty model."""
+        self.subject_units = {}
+        self.type_units = {}
+        self._unit_types = {}
+        self._n_annotations = 0
+        self._n_parameters = 0
+
+    @classmethod
+    def for_model(cls, model):
+        """
+        Return the checker attached to a model, creating it if needed.
+
+        Parameters
+        ----------
+        model : pysb.Model
+            The model to check.
+
+        Returns
+        -------
+        IncrementalUnitChecker
+            The model's checker.
+        """
+        checker = getattr(model, "_qspy_unit_checker", None)
+        if checker is None or checker.model is not model:
+            checker = cls(model)
+            setattr(model, "_qspy_unit_checker", checker)
+        return checker
+
+    def _pending(self):
+        """
+        Return the unit annotations and parameters added since the last check.
+
+        Returns
+        -------
+        tuple of (list, list)
+            New unit annotations and new parameters.
+        """
+        annotations = self.model.annotations
+        parameters = self.model.parameters
+        if len(annotations) < self._n_annotations or len(parameters) < self._n_parameters:
+            # Components were removed (e.g. the model was reset); start over.
+            self._reset()
+        new_units = [a for a in annotations[self._n_annotations :] if isinstance(a, Unit)]
+        new_parameters = list(parameters[self._n_parameters :])
+        self._n_annotations = len(annotations)
+        self._n_parameters = len(parameters)
+        return new_units, new_parameters
+
+    def _warn(self, message):
+        """Issue a `UnitsWarning` attributed to the frame being checked."""
+        warnings.warn(message, UnitsWarning, stacklevel=_stacklevel(self._frame))
+
+    def _record(self, unit, warn):
+        """
+        Cache a unit annotation, optionally warning about conflicts.
+
+        Parameters
+        ----------
+        unit : pysb.units.Unit
+            The unit annotation to record.
+        warn : bool
+            Whether to warn about duplicate or inconsistent units.
+        """
+        subject = unit.subject
+        kind = type(subject).__name__
+        phys_type = self._unit_types.get(unit.unit)
+        if phys_type is None:
+            phys_type = self._unit_types[unit.unit] = unit_type(unit)
+        if warn and subject.name in self.subject_units:
+            self._warn(f"{kind} '{subject.name}' has been assigned multiple units.")
+        self.subject_units[subject.name] = (phys_type, unit.unit)
+
+        representatives = self.type_units.setdefault(phys_type, [])
+        matched = False
+        for other in representatives:
+            if other.unit == unit.unit:
+                matched = True
+            elif warn:
+                self._warn(
+                    f"Units '{other.value}' for {type(other.subject).__name__} "
+                    f"'{other.subject.name}' and '{unit.value}' for {kind} "
+                    f"'{subject.name}' of unit-type '{phys_type}' do not match. \n "
+                    "Double-check units for consistency."
+                )
+        if not matched:
+            representatives.append(unit)
+
+    def _check_dependents(self, parameters):
+        """
+        Re-check the expressions that use parameters whose units changed.
+
+        Parameters
+        ----------
+        parameters : list of pysb.Parameter
+            Existing parameters that were given new units.
+        """
+        graph = model_graph(self.model)
+        causes = {}
+        for param in parameters:
+            try:
+                dependents = graph.dependents(param.name)
+            except KeyError:
+                continue
+            for name in dependents:
+                causes.setdefault(name, []).append(param.name)
+        for name, param_names in causes.items():
+            expr = self.model.expressions.get(name)
+            if expr is None or not getattr(expr, "has_units", False):
+                continue
+            unit_string, _ = expr._compose_units(expr.expr)
+            try:
+                composed = u.Unit(unit_string)
+            except ValueError:
+                continue
+            if not composed.is_equivalent(expr.units.unit):
+                changed = ", ".join(f"'{p}'" for p in param_names)
+                self._warn(
+                    f"Units '{expr.units.value}' for Expression '{name}' no longer "
+                    f"match the units of the components it uses ('{unit_string}') "
+                    f"after Parameter {changed} was assigned new units."
+                )
+
+    def check(self, frame=None):
+        """
+        Check units added since the last check and return the number checked.
+
+        Parameters
+        ----------
+        frame : frame, optional
+            Frame to attribute warnings to (e.g. the frame of the ``with``
+            block being exited); None uses the first caller outside QSPy.
+
+        Returns
+        -------
+        int
+            Number of unit annotations checked.
+        """
+        self._frame = frame
+        try:
+            new_units, new_parameters = self._pending()
+            new_names = {param.name for param in new_parameters}
+            changed = {}
+            for unit in new_units:
+                self._record(unit, warn=True)
+                subject = unit.subject
+                if isinstance(subject, Parameter) and subject.name not in new_names:
+                    changed[subject.name] = subject
+            for param in new_parameters:
+                if not getattr(param, "has_units", False):
+                    self._warn(
+                        f"Parameter '{param.name}' hasn't been assigned any units."
+                    )
+            if changed:
+                self._check_dependents(list(changed.values()))
+        finally:
+            self._frame = None
+        self.logger.debug(
+            f"[QSPy] Incremental unit check: {len(new_units)} new units, "
+            f"{len(self.subject_units)} cached"
+        )
+        return len(new_units)
+
+    def mark_checked(self):
+        """
+        Record the model's current units as checked without warning.
+
+        Returns
+        -------
+        None
+        """
+        new_units, _ = self._pending()
+        for unit in new_units:
+            self._record(unit, warn=False)
+
+
+@timed()
+def check_units_incremental(model, frame=None):
+    """
+    Check the units added to a model since the last check.
+
+    Parameters
+    ----------
+    model : pysb.Model
+        The model to check.
+    frame : frame, optional
+        Frame to attribute warnings to; None uses the first caller outside QSPy.
+
+    Returns
+    -------
+    int
+        Number of unit annotations checked.
+    """
+    return IncrementalUnitChecker.for_model(model).check(frame=frame)
@@ -0,0 +1,96 @@
+import pytest
+
+from pysb.core import Parameter, Rule, Initial, Observable
+
+import qspy.config
+from qspy.core import Model, Monomer
+from qspy.utils.network_cache import NetworkCache
+
+# Hand-written BioNetGen net file for the reversible A + B <-> A:B binding
+# model below, so network-dependent tests run without BioNetGen installed.
+BINDING_NETFILE = """# Created by BioNetGen 2.9.0
+begin parameters
+    1 kf 1.0 # Constant
+    2 kr 0.1 # Constant
+    3 A_0 100.0 # Constant
+    4 B_0 50.0 # Constant
+end parameters
+begin species
+    1 A(b) A_0
+    2 B(a) B_0
+    3 A(b!1).B(a!1) 0
+end species
+begin reactions
+    1 1,2 3 kf #bind
+    2 3 1,2 kr #_reverse_bind
+end reactions
+begin groups
+    1 AB_obs 3
+    2 A_free 1
+end groups
+"""
+
+
+def _build_binding_model(reverse_order=False):
+    model = Model("binding", _export=False)
+    A = Monomer("A", ["b"], _export=False)
+    B = Monomer("B", ["a"], _export=False)
+    kf = Parameter("kf", 1.0, _export=False)
+    kr = Parameter("kr", 0.1, _export=False)
+    A_0 = Parameter("A_0", 100.0, _export=False)
+    B_0 = Parameter("B_0", 50.0, _export=False)
+    components = [A, B, kf, kr, A_0, B_0]
+    if reverse_order:
+        components.reverse()
+    for component in components:
+        model.add_component(component)
+    model.add_component(
+        Rule("bind", A(b=None) + B(a=None) | A(b=1) % B(a=1), kf, kr, _export=False)
+    )
+    model.add_component(Observable("AB_obs", A(b=1) % B(a=1), _export=False))
+    model.add_component(Observable("A_free", A(b=None), _export=False))
+    model.add_initial(Initial(A(b=None), A_0, _export=False))
+    model.add_initial(Initial(B(a=None), B_0, _export=False))
+    return model
+
+
+def _run_model_source(source, module_name, **names):
+    """Run a model-definition script as a fresh module and return its namespace."""
+    namespace = {"__name__": module_name, **names}
+    exec(compile(source, f"<{module_name}>", "exec"), namespace)
+    return namespace
+
+
+@pytest.fixture
+def binding_netfile():
+    return BINDING_NETFILE
+
+
+@pytest.fixture
+def build_binding_model():
+    return _build_binding_model
+
+
+@pytest.fixture
+def run_model_source():
+    return _run_model_source
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """Point every `qspy.config` output path at a temporary directory."""
+    for name in list(vars(qspy.config)):
+        if name.endswith(("_DIR", "_PATH")):
+            monkeypatch.setattr(qspy.config, name, getattr(qspy.config, name))
+    qspy.config.set_output_dir(tmp_path / "qspy")
+    return qspy.config.OUTPUT_DIR
+
+
+@pytest.fixture
+def binding_model(tmp_path):
+    """Binding model with its network loaded from a seeded network cache."""
+    cache = NetworkCache(tmp_path / "networks")
+    model = _build_binding_model()
+    cache.store(NetworkCache.key(model), BINDING_NETFILE)
+    cache.generate_equations(model)
+    return model
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from qspy.functionaltags import DRUG, PROTEIN
+from qspy.simulation.batch import (
+    observable_matrix,
+    observable_projection,
+    parameter_matrix,
+    resolve_outputs,
+)
+
+
+@pytest.mark.unit
+def test_parameter_matrix_fills_nominal_values(binding_model):
+    full = parameter_matrix(binding_model, {"kf": [1.0, 2.0, 3.0]})
+    assert full.shape == (3, len(binding_model.parameters))
+    np.testing.assert_allclose(full[:, 0], [1.0, 2.0, 3.0])
+    np.testing.assert_allclose(full[:, 1], 0.1)
+    with pytest.raises(ValueError):
+        parameter_matrix(binding_model, {"not_a_parameter": [1.0]})
+
+
+@pytest.mark.unit
+def test_outputs_resolve_by_name_and_functional_tag(binding_model):
+    A = binding_model.monomers["A"]
+    B = binding_model.monomers["B"]
+    A @= DRUG.INHIBITOR
+    B @= PROTEIN.RECEPTOR
+    assert [o.name for o in resolve_outputs(binding_model)] == ["AB_obs", "A_free"]
+    assert [o.name for o in resolve_outputs(binding_model, DRUG)] == ["AB_obs", "A_free"]
+    assert [o.name for o in resolve_outputs(binding_model, ["A_free", PROTEIN.RECEPTOR])] == [
+        "A_free",
+        "AB_obs",
+    ]
+
+    # Only the selected observable columns are allocated.
+    weights, names = observable_matrix(binding_model, [PROTEIN])
+    assert names == ["AB_obs"]
+    assert weights.shape == (len(binding_model.species), 1)
+    with pytest.raises(ValueError):
+        resolve_outputs(binding_model, [PROTEIN.LIGAND])
+
+
+@pytest.mark.integration
+def test_simulate_batch_matches_single_runs(binding_model):
+    from pysb.simulator import ScipyOdeSimulator
+
+    tspan = np.linspace(0, 1, 11)
+    sweep = np.array([[0.01, 100.0], [0.02, 80.0], [0.05, 60.0]])
+    out = binding_model.simulate_batch(
+        sweep, tspan, observables=["AB_obs"], param_names=["kf", "A_0"]
+    )
+    assert out.shape == (3, 11, 1)
+
+    for i, (kf, a0) in enumerate(sweep):
+        single = ScipyOdeSimulator(binding_model, tspan, integrator="lsoda").run(
+            param_values={"kf": kf, "A_0": a0}
+        )
+        np.testing.assert_allclose(out[i, :, 0], single.observables["AB_obs"], rtol=1e-5)
+
+    # The compiled simulator is reused for later calls.
+    simulators = binding_model._qspy_batch_simulators
+    binding_model.simulate_batch({"kr": [0.2]}, tspan)
+    assert binding_model._qspy_batch_simulators is simulators
+    assert len(simulators) == 1
+
+
+@pytest.mark.integration
+def test_time_chunked_projection_matches_full_trajectories(binding_model):
+    projection, names = observable_projection(binding_model)
+    weights, _ = observable_matrix(binding_model)
+    assert projection.shape == (len(names), len(binding_model.species))
+    np.testing.assert_array_equal(projection.T.toarray(), weights)
+
+    tspan = np.linspace(0, 1, 11)
+    sweep = {"kf": [0.01, 0.05]}
+    full = binding_model.simulate_batch(sweep, tspan)
+    chunked = binding_model.simulate_batch(sweep, tspan, time_chunk=3)
+    assert chunked.shape == full.shape == (2, 11, 2)
+    np.testing.assert_allclose(chunked, full, rtol=1e-4)
@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+MODULE_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import parameters
+
+Model()
+big_table = np.zeros(10)
+k_rebound = 3.0
+
+with parameters():
+    k_new = (1.0, "1/s")
+    k_rebound = (2.0, "1/s")
+"""
+
+
+@pytest.mark.unit
+def test_parameters_context_detects_new_and_rebound_names(run_model_source):
+    namespace = run_model_source(MODULE_SOURCE, "context_test_module", np=np)
+    model = namespace["model"]
+    assert model.parameters["k_new"].value == 1.0
+    assert model.parameters["k_rebound"].value == 2.0
+    assert "big_table" not in model.component_names
+
+
+LOOP_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import parameters
+
+Model()
+i = 0
+
+with parameters():
+    for i in range(3):
+        pass
+    k_loop = (1.0, "1/s")
+"""
+
+
+@pytest.mark.unit
+def test_parameters_context_ignores_rebound_script_variables(run_model_source):
+    namespace = run_model_source(LOOP_SOURCE, "loop_context_test_module")
+    model = namespace["model"]
+    assert [p.name for p in model.parameters] == ["k_loop"]
+    assert namespace["i"] == 2
+    assert namespace["k_loop"] is model.parameters["k_loop"]
+
+
+@pytest.mark.unit
+def test_component_index_tracks_adds_and_renames(build_binding_model):
+    from pysb.core import ComponentDuplicateNameError, Parameter
+
+    model = build_binding_model()
+    assert model.has_component("kf")
+    assert model.get_component("A") is model.monomers["A"]
+    model.parameters["kr"].rename("k_rev")
+    assert not model.has_component("kr")
+    assert model.get_component("k_rev") is model.parameters["k_rev"]
+    with pytest.raises(ComponentDuplicateNameError):
+        model.add_component(Parameter("A", 1.0, _export=False))
+
+
+UNITS_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import parameters
+
+Model()
+
+with parameters():
+    k_1 = (1.0, "1/s")
+
+with parameters():
+    k_2 = (2.0, "1/h")
+    k_3 = (3.0, "1/s")
+"""
+
+
+@pytest.mark.unit
+def test_parameters_context_checks_units_incrementally(run_model_source):
+    from pysb.units.core import UnitsWarning
+
+    with pytest.warns(UnitsWarning) as record:
+        namespace = run_model_source(UNITS_SOURCE, "units_test_module")
+    model = namespace["model"]
+    mismatches = [str(w.message) for w in record if "do not match" in str(w.message)]
+    # Only the 1/h unit conflicts: with the cached k_1, then with the new k_3.
+    assert len(mismatches) == 2
+    assert all("'k_2'" in msg for msg in mismatches)
+    # Warnings point at the `with` block in the model script, not into QSPy.
+    assert {w.filename for w in record} == {"<units_test_module>"}
+    checker = model._qspy_unit_checker
+    assert set(checker.subject_units) == {"k_1", "k_2", "k_3"}
+    assert checker.check() == 0
+
+
+DEPENDENT_UNITS_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import expressions, parameters
+from pysb.units.core import Unit
+
+Model()
+with parameters():
+    k_1 = (1.0, "1/s")
+    V = (2.0, "L")
+with expressions():
+    flow = k_1 * V
+Unit(k_1, "nM")
+with parameters():
+    k_2 = (1.0, "1/s")
+"""
+
+
+@pytest.mark.unit
+def test_unit_check_rechecks_dependents_of_changed_parameters(run_model_source):
+    from pysb.units.core import UnitsWarning
+
+    with pytest.warns(UnitsWarning) as record:
+        run_model_source(DEPENDENT_UNITS_SOURCE, "dependent_units_test_module")
+    stale = [w for w in record if "no longer match" in str(w.message)]
+    assert len(stale) == 1
+    assert "Expression 'flow'" in str(stale[0].message)
+    assert "'k_1'" in str(stale[0].message)
+    assert stale[0].filename == "<dependent_units_test_module>"
+    assert stale[0].lineno == 13
+
+
+TABLE_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import parameters
+
+Model().with_units(concentration="mg/L", time="h", volume="L")
+parameters.from_table(TABLE_PATH)
+"""
+
+
+@pytest.mark.unit
+def test_parameters_from_table_registers_and_exports(tmp_path, run_model_source):
+    table = tmp_path / "params.csv"
+    table.write_text("name,value,unit\nk_a,2.0,1/s\nk_b,0.0,1/s\nk_c,3.0,1/s\nV_c,5.0,L\n")
+    namespace = run_model_source(TABLE_SOURCE, "table_test_module", TABLE_PATH=table)
+    model = namespace["model"]
+    assert [p.name for p in model.parameters] == ["k_a", "k_b", "k_c", "V_c"]
+    # 1/s is converted to the model's 1/h once and the factor reused.
+    assert model.parameters["k_c"].value == pytest.approx(3.0 * 3600)
+    assert model.parameters["k_c"].units.subject is model.parameters["k_c"]
+    assert namespace["V_c"] is model.parameters["V_c"]
+    assert len(model.units) == 4
+
+
+@pytest.mark.unit
+def test_parameters_from_table_rejects_whole_table(tmp_path):
+    from qspy.utils.tables import read_parameter_table, validate_parameter_table
+
+    table = tmp_path / "params.toml"
+    table.write_text(
+        '[parameters]\nk_ok = 1.0\nk_nan = { value = "fast", unit = "1/h" }\nk_bad = { value = 1.0, unit = "furlong/fortnite" }\n'
+    )
+    names, values, units = read_parameter_table(table)
+    assert names == ["k_ok", "k_nan", "k_bad"]
+    with pytest.raises(ValueError, match="non-numeric values.*k_nan.*unrecognized units"):
+        validate_parameter_table(names, values, units)
+    # Negative values are accepted, as in `with parameters():`.
+    values, _ = validate_parameter_table(["k_neg"], [-1.0], ["1/h"])
+    assert values.tolist() == [-1.0]
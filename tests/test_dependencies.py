@@ -0,0 +1,37 @@
+import pytest
+
+from pysb.core import Expression, Monomer, Observable, Parameter, Rule
+
+from qspy.utils.dependencies import DependencyGraph
+
+
+@pytest.mark.unit
+def test_dependency_graph_queries_and_incremental_updates(build_binding_model):
+    model = build_binding_model()
+    graph = model.dependency_graph
+    assert graph.dependents("kf") == ["bind"]
+    assert graph.dependencies("bind") == ["A", "B", "kf", "kr"]
+    assert graph.dependents("A") == ["A(b=None)", "AB_obs", "A_free", "bind"]
+    assert graph.unreferenced("parameters") == []
+
+    # Components added after the graph is built are picked up on the next query.
+    kf_scaled = Expression("kf_scaled", 2 * model.parameters["kf"], _export=False)
+    model.add_component(kf_scaled)
+    C = Monomer("C", _export=False)
+    model.add_component(C)
+    model.add_component(Parameter("k_syn", 1.0, _export=False))
+    model.add_component(Rule("syn", None >> C(), kf_scaled, _export=False))
+    model.add_component(Observable("C_obs", C(), _export=False))
+    assert graph.dependents("kf") == ["bind", "kf_scaled", "syn"]
+    assert graph.dependents("kf", recursive=False) == ["bind", "kf_scaled"]
+    assert graph.kind("syn") == "rules"
+    assert graph.unreferenced("parameters") == ["k_syn"]
+    assert graph.unreferenced("monomers", by=("initials",)) == ["C"]
+    assert graph.unreferenced("monomers", by=("rules",)) == []
+    assert graph.unreferenced("expressions") == []
+
+    model.parameters["k_syn"].rename("k_synthesis")
+    assert graph.unreferenced("parameters") == ["k_synthesis"]
+    assert DependencyGraph(model).edges() == graph.edges()
+    with pytest.raises(KeyError):
+        graph.dependents("k_syn")
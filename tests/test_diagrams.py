@@ -0,0 +1,197 @@
+import pytest
+
+MODEL_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import compartments, monomers, parameters, rules
+from qspy.functionaltags import PROTEIN
+
+Model()
+with parameters():
+    V = (1.0, "L")
+    kf = (1.0, "1/(M*s)")
+    kr = (0.1, "1/s")
+    k_deg = (0.1, "1/s")
+with compartments():
+    CENTRAL = V
+with monomers():
+    L = (["r"], None, PROTEIN.LIGAND)
+    R1 = (["l"], None, PROTEIN.RECEPTOR)
+    R2 = (["l"], None, PROTEIN.RECEPTOR)
+with rules():
+    bind_1 = (L(r=None) ** CENTRAL + R1(l=None) ** CENTRAL | L(r=1) ** CENTRAL % R1(l=1) ** CENTRAL, kf, kr)
+    bind_2 = (L(r=None) ** CENTRAL + R2(l=None) ** CENTRAL | L(r=1) ** CENTRAL % R2(l=1) ** CENTRAL, kf, kr)
+    degrade = (L(r=None) ** CENTRAL >> None, k_deg)
+"""
+
+
+@pytest.mark.unit
+def test_rule_mode_diagram_skips_network_generation(
+    tmp_path, monkeypatch, run_model_source
+):
+    from qspy.utils.diagrams import ModelMermaidDiagrammer
+
+    namespace = run_model_source(MODEL_SOURCE, "diagram_test_module")
+    model = namespace["model"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("rule mode must not generate the network")
+
+    monkeypatch.setattr("qspy.utils.diagrams.generate_equations", fail)
+    by_monomer = ModelMermaidDiagrammer(model, output_dir=tmp_path, mode="rules")
+    text = by_monomer.markdown_block
+    for label in ('"L"', '"R1"', '"R2"', '"L:R1"', '"L:R2"'):
+        assert f"label: {label}" in text
+    assert "|k_deg|none" in text
+    assert by_monomer.file_path == tmp_path / f"{model.name}_flowchart.mmd"
+    assert by_monomer.file_path.exists()
+
+    by_tag = ModelMermaidDiagrammer(model, output_dir=tmp_path, mode="rules", group_by="tag")
+    text = by_tag.markdown_block
+    assert '"protein::ligand:protein::receptor"' in text
+    assert "R1" not in text and "R2" not in text
+
+    with pytest.raises(ValueError):
+        ModelMermaidDiagrammer(model, output_dir=tmp_path, mode="network")
+
+
+@pytest.mark.unit
+def test_rule_mode_draws_state_changes_as_self_loops(tmp_path, run_model_source):
+    from qspy.utils.diagrams import ModelMermaidDiagrammer
+
+    source = """
+from qspy.core import Model
+from qspy.contexts import monomers, parameters, rules
+
+Model()
+with parameters():
+    k_phos = (1.0, "1/s")
+    k_dephos = (0.1, "1/s")
+with monomers():
+    S = (["p"], {"p": ["u", "p"]})
+with rules():
+    phosphorylate = (S(p="u") | S(p="p"), k_phos, k_dephos)
+"""
+    namespace = run_model_source(source, "self_loop_diagram_test_module")
+    text = ModelMermaidDiagrammer(
+        namespace["model"], output_dir=tmp_path, mode="rules"
+    ).markdown_block
+    assert 'label: "S"' in text
+    assert "g0-->|k_phos, k_dephos|g0" in text
+
+
+@pytest.mark.unit
+def test_diagram_and_summary_are_built_lazily_and_memoized(tmp_path, run_model_source):
+    from qspy.utils.diagrams import ModelMermaidDiagrammer
+
+    namespace = run_model_source(MODEL_SOURCE, "lazy_diagram_test_module")
+    model = namespace["model"]
+    diagram = ModelMermaidDiagrammer(model, output_dir=tmp_path, mode="rules")
+    assert not (tmp_path / f"{model.name}_flowchart.mmd").exists()
+    assert model.mermaid_diagram is diagram
+
+    text = diagram.markdown_block
+    assert diagram.markdown_block is text
+    path = diagram.file_path
+    mtime = path.stat().st_mtime_ns
+    assert diagram.file_path == path and path.stat().st_mtime_ns == mtime
+
+    summary = model.summary
+    summary.path = tmp_path / "summary.md"
+    assert not summary.path.exists()
+    markdown = summary.markdown_block
+    assert "| kf | 1.0 |" in markdown and "label: \"L:R1\"" in markdown
+    assert summary.file_path.read_text(encoding="utf-8") == markdown
+    sections = dict(summary._sections)
+
+    # Parameter values are not drawn, so the diagram is reused; only the
+    # tables showing parameters are re-rendered.
+    model.parameters["kf"].value = 2.0
+    assert diagram.markdown_block is text
+    markdown = summary.markdown_block
+    assert "| kf | 2.0 |" in markdown
+    assert summary._sections["rules"] is sections["rules"]
+    assert summary._sections["parameters"] is not sections["parameters"]
+
+    model.rules["degrade"].rename("decay")
+    assert "|k_deg|none" in diagram.markdown_block
+    assert diagram.markdown_block is not text
+
+
+
+# Network of a compartmental A + B <-> A:B model, and of the same model after
+# adding the rule A -> C (BioNetGen is not needed to draw either).
+COMPARTMENT_NETFILE = """begin parameters
+    1 V 1.0 # Constant
+    2 kf 1.0 # Constant
+    3 kr 0.1 # Constant
+    4 A_0 100.0 # Constant
+    5 B_0 50.0 # Constant
+end parameters
+begin species
+    1 @CENTRAL::A(b) A_0
+    2 @CENTRAL::B(a) B_0
+    3 @CENTRAL::A(b!1).B(a!1) 0
+end species
+begin reactions
+    1 1,2 3 kf #bind
+    2 3 1,2 kr #_reverse_bind
+end reactions
+"""
+CONVERTED_NETFILE = (
+    COMPARTMENT_NETFILE.replace("end parameters", "    6 k_conv 0.5 # Constant\nend parameters")
+    .replace("end species", "    4 @CENTRAL::C(x) 0\nend species")
+    .replace("end reactions", "    3 1 4 k_conv #convert\nend reactions")
+)
+
+
+@pytest.mark.unit
+def test_species_diagram_regenerates_the_network_after_an_edit(
+    tmp_path, monkeypatch, output_dir
+):
+    from pysb.core import Compartment, Initial, Parameter, Rule
+
+    from qspy.core import Model, Monomer
+    from qspy.utils.diagrams import ModelMermaidDiagrammer
+
+    netfiles = [COMPARTMENT_NETFILE, CONVERTED_NETFILE]
+    monkeypatch.setattr("pysb.bng.generate_network", lambda model, **kwargs: netfiles.pop(0))
+
+    model = Model("compartment_binding", _export=False)
+    V = Parameter("V", 1.0, _export=False)
+    CENTRAL = Compartment("CENTRAL", size=V, dimension=3, _export=False)
+    A = Monomer("A", ["b"], _export=False)
+    B = Monomer("B", ["a"], _export=False)
+    kf = Parameter("kf", 1.0, _export=False)
+    kr = Parameter("kr", 0.1, _export=False)
+    A_0 = Parameter("A_0", 100.0, _export=False)
+    B_0 = Parameter("B_0", 50.0, _export=False)
+    for component in (V, CENTRAL, A, B, kf, kr, A_0, B_0):
+        model.add_component(component)
+    model.add_component(
+        Rule(
+            "bind",
+            A(b=None) ** CENTRAL + B(a=None) ** CENTRAL | A(b=1) ** CENTRAL % B(a=1) ** CENTRAL,
+            kf,
+            kr,
+            _export=False,
+        )
+    )
+    model.add_initial(Initial(A(b=None) ** CENTRAL, A_0, _export=False))
+    model.add_initial(Initial(B(a=None) ** CENTRAL, B_0, _export=False))
+
+    diagram = ModelMermaidDiagrammer(model, output_dir=tmp_path)
+    assert "label: A:B" in diagram.markdown_block
+    assert "label: C" not in diagram.markdown_block
+
+    C = Monomer("C", ["x"], _export=False)
+    k_conv = Parameter("k_conv", 0.5, _export=False)
+    model.add_component(C)
+    model.add_component(k_conv)
+    model.add_component(
+        Rule("convert", A(b=None) ** CENTRAL >> C(x=None) ** CENTRAL, k_conv, _export=False)
+    )
+    text = diagram.markdown_block
+    assert "label: C" in text
+    assert "|k_conv|" in text
+    assert len(model.species) == 4
+    assert not netfiles
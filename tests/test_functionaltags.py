@@ -0,0 +1,34 @@
+import copy
+import pickle
+from enum import Enum
+
+import pytest
+
+from qspy.functionaltags import DRUG, ENUM_TAGS, NO_TAG, PROTEIN, FunctionalTag, prefixer
+
+
+class CUSTOM(Enum):
+    SENSOR = prefixer("sensor", "custom")
+    UNTAGGED = "sensor"
+
+
+@pytest.mark.unit
+def test_functional_tags_are_interned_flyweights():
+    tag = FunctionalTag("protein", "ligand")
+    assert tag is FunctionalTag("protein", "ligand") is FunctionalTag.of(PROTEIN.LIGAND)
+    assert ENUM_TAGS[PROTEIN.LIGAND] is tag and len(ENUM_TAGS) >= len(PROTEIN) + len(DRUG)
+    assert tag == PROTEIN.LIGAND and tag != PROTEIN.RECEPTOR and tag != DRUG.ANTIBODY
+    assert tag != "protein::ligand"
+    assert tag.value == "protein::ligand"
+    assert repr(tag) == "FunctionalTag(class_='protein', function='ligand')"
+    assert {tag, FunctionalTag.of(PROTEIN.LIGAND), NO_TAG} == {tag, NO_TAG}
+
+    assert FunctionalTag.of(CUSTOM.SENSOR) is FunctionalTag("custom", "sensor")
+    assert FunctionalTag("custom", "sensor") == CUSTOM.SENSOR
+    assert tag != CUSTOM.UNTAGGED
+
+    assert not hasattr(tag, "__dict__")
+    with pytest.raises(AttributeError):
+        tag.function = "receptor"
+    assert pickle.loads(pickle.dumps(tag)) is tag
+    assert copy.deepcopy(tag) is tag and copy.copy(tag) is tag
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = ("qspy.validation.metadata", "qspy.utils.diagrams", "microbench", "pysb.pkpd")
+
+
+@pytest.mark.unit
+def test_import_qspy_defers_heavy_modules():
+    code = (
+        "import sys, qspy\n"
+        f"print(sorted(m for m in {LAZY_MODULES!r} if m in sys.modules))\n"
+        "qspy.ModelChecker, qspy.simulate\n"
+        "print('qspy.validation.modelchecker' in sys.modules, 'pysb.pkpd' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    eager, loaded = result.stdout.splitlines()[-2:]
+    assert eager == "[]"
+    assert loaded == "True True"
+
+
+@pytest.mark.unit
+def test_star_import_defers_heavy_modules():
+    code = (
+        "import sys\n"
+        "from qspy import *\n"
+        f"print(sorted(m for m in {LAZY_MODULES!r} if m in sys.modules))\n"
+        "print('Model' in dir(), 'ModelChecker' in dir())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    eager, names = result.stdout.splitlines()[-2:]
+    assert eager == "[]"
+    assert names == "True False"
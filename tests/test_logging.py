@@ -0,0 +1,113 @@
+import logging
+import os
+
+import pytest
+
+from qspy.config import LOGGER_NAME
+from qspy.utils.logging import flush_qspy_logging, log_event
+
+
+class Expensive:
+    def __init__(self):
+        self.reprs = 0
+
+    def __repr__(self):
+        self.reprs += 1
+        return "Expensive()"
+
+
+@pytest.mark.unit
+def test_log_event_renders_arguments_lazily(caplog):
+    logger = logging.getLogger("qspy.test_lazy")
+
+    @log_event("qspy.test_lazy", log_args=True, log_result=True)
+    def identity(obj):
+        return obj
+
+    obj = Expensive()
+    logger.setLevel(logging.WARNING)
+    assert identity(obj) is obj
+    assert obj.reprs == 0
+
+    logger.setLevel(logging.INFO)
+    with caplog.at_level(logging.INFO, logger="qspy.test_lazy"):
+        identity(obj)
+        flush_qspy_logging()
+    messages = [r.getMessage() for r in caplog.records if r.name == "qspy.test_lazy"]
+    assert "    Args: (Expensive(),), Kwargs: {}" in messages
+    assert "    Result: Expensive()" in messages
+    exit_record = next(r for r in caplog.records if getattr(r, "qspy_event", None) == "exit")
+    assert exit_record.qspy_duration >= 0
+
+
+def _log_from_worker(config, token):
+    import multiprocessing
+
+    from qspy.utils.logging import configure_worker_logging
+
+    logger = configure_worker_logging(config)
+    logger.info("worker says %s", token)
+    return multiprocessing.current_process().name
+
+
+@pytest.mark.unit
+def test_worker_records_are_written_by_the_parent():
+    import multiprocessing
+    import uuid
+
+    from qspy.utils import logging as qspy_logging
+
+    token = uuid.uuid4().hex
+    ctx = multiprocessing.get_context("spawn")
+    with qspy_logging.parallel_logging(run_id="run-test", mp_context=ctx) as config:
+        processes = [
+            ctx.Process(target=_log_from_worker, args=(config, token)) for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    log_file = qspy_logging._FILE_HANDLER.baseFilename
+    with open(log_file, encoding="utf-8") as f:
+        lines = [line for line in f if token in line]
+    assert len(lines) == 2
+    workers = {line.split("[run-test/")[1].split("]")[0] for line in lines}
+    assert len(workers) == 2
+
+
+@pytest.mark.unit
+def test_queued_records_show_arguments_as_they_were_logged():
+    from qspy.utils import logging as qspy_logging
+
+    token = []
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.info("mutable state %s", token)
+    token.append("changed")
+    flush_qspy_logging()
+    with open(qspy_logging._FILE_HANDLER.baseFilename, encoding="utf-8") as f:
+        lines = [line for line in f if "mutable state" in line]
+    assert lines[-1].rstrip().endswith("mutable state []")
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_write_the_parent_log():
+    import uuid
+
+    from qspy.utils import logging as qspy_logging
+
+    token = uuid.uuid4().hex
+    logger = logging.getLogger(LOGGER_NAME)
+    flush_qspy_logging()
+    logger.info("pending %s", token)
+    pid = os.fork()
+    if pid == 0:
+        logger.info("child %s", token)
+        os._exit(0 if qspy_logging._LISTENER is None else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    flush_qspy_logging()
+    with open(qspy_logging._FILE_HANDLER.baseFilename, encoding="utf-8") as f:
+        lines = [line for line in f if token in line]
+    assert len(lines) == 1
+    assert "pending" in lines[0]
@@ -0,0 +1,53 @@
+import pytest
+
+from qspy.validation import metadata
+from qspy.validation.metadata import ModelMetadataTracker
+
+
+@pytest.fixture
+def bench_calls(monkeypatch):
+    calls = []
+
+    def fake_run_bench():
+        calls.append(1)
+        return {"hostname": "node-1", "package_versions": {"qspy": "test"}}
+
+    metadata.clear_environment_snapshot()
+    monkeypatch.setattr(ModelMetadataTracker, "_run_bench", staticmethod(fake_run_bench))
+    yield calls
+    metadata.clear_environment_snapshot()
+
+
+@pytest.mark.unit
+def test_environment_snapshot_is_captured_once_per_process(
+    monkeypatch, build_binding_model, bench_calls
+):
+    monkeypatch.setattr("pysb.core.SelfExporter.default_model", build_binding_model())
+    first = ModelMetadataTracker(capture_conda_env=True)
+    second = ModelMetadataTracker()
+    assert len(bench_calls) == 1
+    assert second.env_metadata["hostname"] == "node-1"
+    first.env_metadata["hostname"] = "changed"
+    assert ModelMetadataTracker().env_metadata["hostname"] == "node-1"
+
+
+@pytest.mark.unit
+def test_environment_snapshot_persists_across_processes(tmp_path, bench_calls):
+    tracker = ModelMetadataTracker.__new__(ModelMetadataTracker)
+    tracker.capture_environment(persist=True, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    # A new process starts with an empty in-memory snapshot.
+    metadata.clear_environment_snapshot()
+    assert tracker.capture_environment(persist=True, cache_dir=tmp_path)["hostname"] == "node-1"
+    assert len(bench_calls) == 1
+
+
+@pytest.mark.unit
+def test_environment_fingerprint_includes_the_host(monkeypatch, output_dir, bench_calls):
+    fingerprint = metadata.environment_fingerprint()
+    monkeypatch.setattr("platform.node", lambda: "node-2")
+    assert metadata.environment_fingerprint() != fingerprint
+
+    tracker = ModelMetadataTracker.__new__(ModelMetadataTracker)
+    tracker.capture_environment(persist=True)
+    assert len(list((output_dir / "cache" / "environment").glob("*.json"))) == 1
@@ -0,0 +1,111 @@
+import pytest
+
+from qspy.validation.modelchecker import MODEL_CHECKS, ModelChecker
+from qspy.validation.scheduler import CheckResultCache, CheckScheduler, CheckSpec
+
+MODEL_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import monomers, parameters, rules
+
+Model()
+with parameters():
+    k_deg = (0.1, "1/s")
+    k_unused = (0.0, "1/s")
+with monomers():
+    A = (None, None)
+with rules():
+    degrade = (A() >> None, k_deg)
+"""
+
+
+@pytest.mark.unit
+def test_scheduler_orders_checks_into_dependency_waves():
+    waves = CheckScheduler(MODEL_CHECKS).waves
+    assert [spec.name for spec in waves[1]] == ["check_equations_generation"]
+    assert len(waves[0]) == len(MODEL_CHECKS) - 1
+    with pytest.raises(ValueError, match="Cyclic"):
+        CheckScheduler([CheckSpec("a", (), after=("b",)), CheckSpec("b", (), after=("a",))])
+
+
+
+@pytest.mark.unit
+def test_network_check_overlaps_with_the_pure_python_checks():
+    import threading
+
+    network_started = threading.Event()
+
+    def runner(name):
+        if name == "check_equations_generation":
+            network_started.set()
+        elif name == "check_units":
+            # Runs in the calling thread; only finishes early if the network
+            # check started without waiting for it.
+            return [{"overlapped": network_started.wait(timeout=5)}]
+        return []
+
+    results = CheckScheduler(MODEL_CHECKS).run(None, runner)
+    assert results["check_units"].findings == [{"overlapped": True}]
+    assert list(results) == [spec.name for spec in MODEL_CHECKS]
+
+    def broken(name):
+        if name == "check_dangling_reused_bonds":
+            raise RuntimeError("broken rule")
+        return []
+
+    with pytest.raises(RuntimeError, match="broken rule"):
+        CheckScheduler(MODEL_CHECKS).run(None, broken)
+
+@pytest.mark.unit
+def test_check_results_are_cached_by_structural_hash(
+    tmp_path, monkeypatch, run_model_source
+):
+    namespace = run_model_source(MODEL_SOURCE, "checker_test_module")
+    model = namespace["model"]
+    first = ModelChecker(model, persist=True, cache_dir=tmp_path)
+    assert not any(result.cached for result in first.results.values())
+
+    def fail():
+        raise AssertionError("cached checks should not run again")
+
+    # A new checker starts with an empty memory cache, so this loads from disk.
+    monkeypatch.setattr(ModelChecker, "check_zero_valued_parameters", lambda self: fail())
+    second = ModelChecker(model, persist=True, cache_dir=tmp_path)
+    assert second.results["check_zero_valued_parameters"].cached
+    assert not second.results["check_equations_generation"].cached
+    for name, result in first.results.items():
+        assert second.results[name].findings == result.findings
+    zero = second.results["check_zero_valued_parameters"].findings
+    assert zero[0]["message"] == "Zero-valued Parameters: ['k_unused']"
+
+    monkeypatch.undo()
+    model.parameters["k_unused"].value = 1.0
+    third = ModelChecker(model, persist=True, cache_dir=tmp_path)
+    assert not third.results["check_zero_valued_parameters"].cached
+    assert third.results["check_zero_valued_parameters"].findings == []
+    assert third.results["check_unused_monomers"].cached
+
+
+@pytest.mark.unit
+def test_check_cache_is_bounded_shared_and_memory_only_by_default(
+    output_dir, run_model_source
+):
+    cache = CheckResultCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.store(key, [{"message": key}])
+    assert cache.load("a") is None
+    assert cache.load("c") == [{"message": "c"}]
+    assert CheckResultCache().load("c") is None
+
+    namespace = run_model_source(MODEL_SOURCE, "checker_cache_test_module")
+    checker = ModelChecker(namespace["model"])
+    assert checker.scheduler.cache.cache_dir is None
+    checker.check()
+    assert checker.results["check_zero_valued_parameters"].cached
+    # Checkers share the in-memory cache, so a new checker replays it too.
+    again = ModelChecker(namespace["model"])
+    assert again.scheduler.cache is checker.scheduler.cache
+    assert again.results["check_zero_valued_parameters"].cached
+    assert not (output_dir / "cache" / "checks").exists()
+
+    ModelChecker(namespace["model"], persist=True)
+    assert list((output_dir / "cache" / "checks").glob("*.json"))
@@ -0,0 +1,143 @@
+import pytest
+
+from qspy.utils.hashing import structural_hash, NETWORK_KINDS
+from qspy.utils.network_cache import NetworkCache
+
+
+@pytest.mark.unit
+def test_structural_hash_is_declaration_order_independent(build_binding_model):
+    assert structural_hash(build_binding_model()) == structural_hash(
+        build_binding_model(reverse_order=True)
+    )
+
+
+@pytest.mark.unit
+def test_network_key_ignores_parameter_values(build_binding_model):
+    model = build_binding_model()
+    other = build_binding_model()
+    other.parameters["kf"].value = 2.0
+    assert structural_hash(model) != structural_hash(other)
+    assert NetworkCache.key(model) == NetworkCache.key(other)
+    assert structural_hash(model, kinds=NETWORK_KINDS) == structural_hash(
+        other, kinds=NETWORK_KINDS
+    )
+
+
+@pytest.mark.unit
+def test_network_key_covers_bng_version(monkeypatch, tmp_path, build_binding_model):
+    from qspy.utils import network_cache
+
+    model = build_binding_model()
+    bng = tmp_path / "BioNetGen"
+    bng.mkdir()
+    (bng / "BNG2.pl").touch()
+    monkeypatch.setattr("pysb.pathfinder.get_path", lambda prog: str(bng / "BNG2.pl"))
+    keys = []
+    for version in ("2.8.5", "2.9.2"):
+        (bng / "VERSION").write_text(version + "\n")
+        network_cache._bng_version.cache_clear()
+        keys.append(NetworkCache.key(model))
+    network_cache._bng_version.cache_clear()
+    assert network_cache._bng_version() == "2.9.2"
+    network_cache._bng_version.cache_clear()
+    assert keys[0] != keys[1]
+
+
+@pytest.mark.unit
+def test_missing_netfile_parser_raises_clear_error(
+    tmp_path, monkeypatch, build_binding_model, binding_netfile
+):
+    from qspy.utils import network_cache
+
+    model = build_binding_model()
+    cache = NetworkCache(tmp_path)
+    key = NetworkCache.key(model)
+    cache.store(key, binding_netfile)
+    monkeypatch.setattr(network_cache, "_pysb_parse_netfile", None)
+    with pytest.raises(ImportError, match="cache=False"):
+        cache.load(model, key)
+    # The entry is kept: the parser is missing, not the file unreadable.
+    assert cache.path(key).exists()
+
+
+@pytest.mark.unit
+def test_network_cache_follows_set_output_dir(output_dir):
+    assert NetworkCache().cache_dir == output_dir / "cache" / "networks"
+
+
+@pytest.mark.unit
+def test_network_cache_rehydrates_without_bng(
+    tmp_path, monkeypatch, build_binding_model, binding_netfile
+):
+    cache = NetworkCache(tmp_path)
+    model = build_binding_model()
+    cache.store(NetworkCache.key(model), binding_netfile)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("BioNetGen should not run on a cache hit")
+
+    monkeypatch.setattr("pysb.bng.generate_network", fail)
+    cache.generate_equations(model)
+    assert len(model.species) == 3
+    assert len(model.reactions) == 2
+    assert len(model.reactions_bidirectional) == 1
+    assert model.observables["AB_obs"].species == [2]
+
+
+@pytest.mark.unit
+def test_network_cache_miss_runs_bng_once(
+    tmp_path, monkeypatch, build_binding_model, binding_netfile
+):
+    calls = []
+
+    def fake_generate_network(model, **kwargs):
+        calls.append(model)
+        return binding_netfile
+
+    monkeypatch.setattr("pysb.bng.generate_network", fake_generate_network)
+    cache = NetworkCache(tmp_path)
+    cache.generate_equations(build_binding_model())
+    cache.generate_equations(build_binding_model(reverse_order=True))
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob("*.net"))) == 1
+
+
+@pytest.mark.unit
+def test_structural_tree_updates_incrementally_and_diffs(build_binding_model):
+    from pysb.core import Parameter
+
+    model = build_binding_model()
+    before = model.structural_tree.snapshot()
+    assert before["root"] == structural_hash(build_binding_model(reverse_order=True))
+
+    model.parameters["kf"].value = 2.0
+    model.add_component(Parameter("k_new", 1.0, _export=False))
+    model.monomers["B"].rename("C")
+    assert model.structural_hash() != before["root"]
+    diff = model.structural_diff(before)
+    assert diff["parameters"] == {"added": ["k_new"], "removed": [], "changed": ["kf"]}
+    assert diff["monomers"] == {"added": ["C"], "removed": ["B"], "changed": []}
+    # Components that reference the renamed monomer change too.
+    assert diff["observables"]["changed"] == ["AB_obs"]
+    assert "compartments" not in diff
+    # The incrementally updated tree agrees with one built from scratch.
+    del model._structural_tree
+    assert model.structural_hash() == structural_hash(model)
+
+
+@pytest.mark.unit
+def test_structural_hash_sees_in_place_rule_and_observable_edits(build_binding_model):
+    from pysb.core import ANY, as_reaction_pattern
+
+    model = build_binding_model()
+    A = model.monomers["A"]
+    before = model.structural_tree.snapshot()
+
+    model.rules["bind"].rate_forward = model.parameters["kr"]
+    model.observables["A_free"].reaction_pattern = as_reaction_pattern(A(b=ANY))
+    assert model.structural_hash() != before["root"]
+    diff = model.structural_diff(before)
+    assert diff["rules"]["changed"] == ["bind"]
+    assert diff["observables"]["changed"] == ["A_free"]
+    assert model.dependency_graph.dependents("kf") == []
+    assert model.structural_hash() == structural_hash(model)
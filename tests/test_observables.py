@@ -0,0 +1,54 @@
+import pytest
+
+from pysb.core import ComponentDuplicateNameError, MultiState
+
+MODEL_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import compartments, monomers, parameters
+
+Model()
+with parameters():
+    V = (1.0, "L")
+with compartments():
+    CENTRAL = V
+with monomers():
+    A = (["b", "s"], {"s": ["u", "p"]})
+    B = (["a", "c"], None)
+    C = (["b", "b"], None)
+"""
+
+
+@pytest.mark.unit
+def test_observable_names_follow_pattern_structure(run_model_source):
+    from qspy.core import _make_mono_string, auto_observables, observable_name
+
+    namespace = run_model_source(MODEL_SOURCE, "observables_test_module")
+    model = namespace["model"]
+    A, B, C, CENTRAL = (namespace[n] for n in ("A", "B", "C", "CENTRAL"))
+
+    # Names of the one- and two-site patterns the string-based naming handled.
+    assert observable_name(A()) == "A"
+    assert observable_name(A(b=None)) == "A_None"
+    assert observable_name(A(s="u") ** CENTRAL) == "A_u_CENTRAL"
+    assert observable_name(A(b=None, s="p") ** CENTRAL) == "A_p_CENTRAL"
+    assert observable_name(A(b=1) % B(a=1)) == "A_1_B_1"
+    # Site order, multi-site and n-mer patterns.
+    assert observable_name(A(s="p", b=1)) == "A_1_p"
+    assert observable_name(A(b=1) % B(a=1, c=2) % C(b=MultiState(2, None))) == (
+        "A_1_B_1_2_C_2_None"
+    )
+    assert observable_name((A(b=1) % B(a=1)) ** CENTRAL) == "A_1_B_1_CENTRAL"
+    pattern = A(b=None, s="u")
+    assert observable_name(pattern) is observable_name(pattern)
+    assert _make_mono_string("A_custom") == "A_custom"
+    with pytest.raises(ValueError):
+        _make_mono_string(1)
+
+    obs = ~(A(b=1) % B(a=1, c=2) % C(b=MultiState(2, None)))
+    assert obs.name == "A_1_B_1_2_C_2_None" and model.observables[obs.name] is obs
+    created = auto_observables(A(b=None, s=s) for s in ("u", "p"))
+    assert [o.name for o in created] == ["A_u", "A_p"]
+    assert namespace["A_p"] is created[1]
+    with pytest.raises(ComponentDuplicateNameError):
+        auto_observables([B(a=None), B(a=None)])
+    assert "B_None" not in model.component_names
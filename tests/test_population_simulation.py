@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+import pytest
+
+from qspy.simulation.population import PopulationSimulator, chunk_ranges
+
+
+@pytest.mark.unit
+def test_chunk_ranges_are_deterministic_and_cover_all_rows():
+    assert chunk_ranges(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert chunk_ranges(0, 4) == []
+
+
+@pytest.mark.integration
+def test_population_matches_batch(binding_model):
+    tspan = np.linspace(0, 1, 11)
+    sweep = {"kf": np.linspace(0.01, 0.05, 7), "B_0": np.linspace(10, 70, 7)}
+    runner = PopulationSimulator(binding_model, max_workers=2, chunk_size=3)
+    out = runner.run(sweep, tspan, observables=["AB_obs", "A_free"])
+    expected = binding_model.simulate_batch(sweep, tspan, observables=["AB_obs", "A_free"])
+    assert out.shape == (7, 11, 2)
+    np.testing.assert_allclose(out, expected)
+
+    chunked = runner.run(sweep, tspan, observables=["AB_obs", "A_free"], time_chunk=4)
+    np.testing.assert_allclose(chunked, expected, rtol=1e-4)
+
+
+@pytest.mark.integration
+def test_population_result_is_private_and_frees_shared_memory(binding_model):
+    shm_dir = "/dev/shm"
+    if not os.path.isdir(shm_dir):
+        pytest.skip("no /dev/shm to inspect")
+    before = set(os.listdir(shm_dir))
+    tspan = np.linspace(0, 1, 5)
+    sweep = {"kf": np.linspace(0.01, 0.05, 5)}
+    runner = PopulationSimulator(binding_model, max_workers=2, chunk_size=2)
+    out = runner.run(sweep, tspan, observables=["AB_obs"])
+    # The result is a plain array, not a view onto (or a copy of) a shared block.
+    assert out.flags.owndata and out.base is None
+    assert set(os.listdir(shm_dir)) <= before
+    expected = binding_model.simulate_batch(sweep, tspan, observables=["AB_obs"])
+    np.testing.assert_allclose(out, expected)
@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pytest
+
+from qspy.utils.profiling import TimingRegistry, reset_timings, timed, timing_stats
+
+MODULE_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import parameters
+
+Model()
+with parameters():
+    k_f = (1.0, "1/s")
+"""
+
+
+@pytest.mark.unit
+def test_timing_registry_stats_and_exports():
+    registry = TimingRegistry()
+
+    @timed("work", registry=registry)
+    def work():
+        return 1
+
+    for _ in range(3):
+        work()
+    for ms in range(1, 101):
+        registry.record("sampled", ms * 1_000_000)
+
+    stats = registry.stats()
+    assert stats["work"]["count"] == 3
+    sampled = stats["sampled"]
+    assert sampled["total_ms"] == pytest.approx(5050.0)
+    assert sampled["mean_ms"] == pytest.approx(50.5)
+    assert sampled["p50_ms"] == pytest.approx(np.percentile(np.arange(1, 101), 50))
+    assert sampled["p99_ms"] > sampled["p95_ms"] > sampled["p50_ms"]
+    assert list(stats)[0] == "sampled"  # sorted by total time
+
+    assert json.loads(registry.to_json())["work"]["count"] == 3
+    table = registry.to_markdown().splitlines()
+    assert table[0].startswith("| function | count | total_ms")
+    assert any(line.startswith("| `sampled` | 100 |") for line in table)
+
+
+@pytest.mark.unit
+def test_timing_registry_memory_is_bounded():
+    registry = TimingRegistry(max_samples=50)
+    for ms in range(1, 1001):
+        registry.record("hot", ms * 1_000_000)
+    assert len(registry._timings["hot"][3]) == 50
+    stats = registry.stats("hot")
+    assert stats["count"] == 1000
+    assert stats["total_ms"] == pytest.approx(500500.0)
+    assert stats["max_ms"] == pytest.approx(1000.0)
+    assert 1 <= stats["p50_ms"] <= 1000
+
+
+@pytest.mark.unit
+def test_contexts_record_enter_and_exit_timings(run_model_source):
+    reset_timings()
+    run_model_source(MODULE_SOURCE, "profiling_test_module")
+    stats = timing_stats()
+    assert stats["qspy.contexts.contexts.parameters.__enter__"]["count"] == 1
+    assert stats["qspy.contexts.contexts.parameters.__exit__"]["count"] == 1
+    assert stats["qspy.validation.units.check_units_incremental"]["count"] == 1
+    # log_event feeds the registry too (parameters.create_component is decorated).
+    assert stats["qspy.contexts.contexts.parameters.create_component"]["count"] == 1
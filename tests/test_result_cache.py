@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import qspy.config
+from qspy.simulation.cache import ResultCache
+
+
+@pytest.mark.unit
+def test_result_cache_stores_one_block_per_run_and_evicts_least_recently_used(tmp_path):
+    params, initials = np.arange(3.0)[:, None], np.zeros((3, 1))
+    values = {run: np.arange(60.0).reshape(3, 10, 2) + ord(run) for run in "abc"}
+    cache = ResultCache(tmp_path)
+    for run in "abc":
+        keys, missing = cache.lookup(run, params, initials, np.empty((3, 10, 2)))
+        assert missing.tolist() == [0, 1, 2]
+        cache.store(run, keys, values[run])
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+
+    cache.max_bytes = cache.size()
+    out = np.empty((3, 10, 2))
+    _, missing = cache.lookup("a", params, initials, out)  # "a" is now the most recently used
+    assert len(missing) == 0
+    np.testing.assert_array_equal(out, values["a"])
+
+    keys, _ = cache.lookup("d", params, initials, out)
+    cache.store("d", keys, values["a"], rows=[0, 2])
+    _, missing = cache.lookup("b", params, initials, out)
+    assert missing.tolist() == [0, 1, 2]
+    _, missing = cache.lookup("d", params, initials, out)
+    assert missing.tolist() == [1]
+    assert cache.size() <= cache.max_bytes
+    assert cache.stats() == {
+        "hits": 5,
+        "misses": 16,
+        "stores": 11,
+        "evictions": 1,
+        "hit_rate": pytest.approx(5 / 21),
+    }
+
+
+@pytest.mark.unit
+def test_result_cache_follows_set_output_dir(output_dir, monkeypatch):
+    monkeypatch.setattr(qspy.config, "RESULT_CACHE_MAX_BYTES", 1024)
+    cache = ResultCache()
+    assert cache.cache_dir == output_dir / "cache" / "results"
+    assert cache.max_bytes == 1024
+
+
+@pytest.mark.integration
+def test_repeated_runs_are_served_from_the_cache(binding_model, tmp_path):
+    from qspy.simulation.population import PopulationSimulator
+
+    cache = ResultCache(tmp_path / "results")
+    tspan = np.linspace(0, 1, 11)
+    first = binding_model.simulate_batch({"kf": [0.01, 0.02]}, tspan, cache=cache)
+    assert cache.stats()["misses"] == 2 and cache.stats()["stores"] == 2
+
+    # Overlapping sweep: only the new row is integrated.
+    second = binding_model.simulate_batch({"kf": [0.01, 0.02, 0.05]}, tspan, cache=cache)
+    np.testing.assert_array_equal(second[:2], first)
+    assert cache.stats()["hits"] == 2 and cache.stats()["stores"] == 3
+
+    runner = PopulationSimulator(binding_model, max_workers=2, chunk_size=1)
+    population = runner.run({"kf": [0.01, 0.02, 0.05, 0.1]}, tspan, cache=cache)
+    np.testing.assert_array_equal(population[:3], second)
+    assert cache.stats()["hits"] == 5 and cache.stats()["stores"] == 4
+    expected = binding_model.simulate_batch({"kf": [0.1]}, tspan)
+    np.testing.assert_allclose(population[3:], expected)
+
+    # Different solver options key different entries.
+    binding_model.simulate_batch({"kf": [0.01]}, tspan, cache=cache, time_chunk=5)
+    assert cache.stats()["stores"] == 5
+    assert len(list((tmp_path / "results").glob("*.npy"))) == 4
@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pytest
+
+from qspy.simulation.results import SimulationResult, TrajectoryWriter, open_result
+
+
+@pytest.mark.unit
+def test_trajectory_writer_streams_to_memmap_and_reads_back_lazily(tmp_path):
+    tspan = np.linspace(0, 1, 5)
+    writer = TrajectoryWriter("sweep", 3, tspan, ["Bound", "Free"], results_dir=tmp_path)
+    assert writer.path == tmp_path / "sweep.npy"
+    header = json.loads(writer.header_path.read_text())
+    assert header["complete"] is False and header["shape"] == [3, 5, 2]
+
+    block = np.arange(30, dtype=float).reshape(3, 5, 2)
+    for i in range(3):
+        writer.write(i, block[i, :2], times=slice(0, 2))
+        writer.write(i, block[i, 2:], times=slice(2, None))
+    result = writer.close()
+    assert isinstance(result, SimulationResult) and result.complete
+    assert list(result) == ["Bound", "Free"]
+    np.testing.assert_array_equal(result.tspan, tspan)
+
+    bound = open_result(tmp_path / "sweep.npy")["Bound"]
+    assert isinstance(bound, np.memmap) and not bound.flags.writeable
+    np.testing.assert_array_equal(bound, block[..., 0])
+    np.testing.assert_array_equal(result.data, block)
+
+
+@pytest.mark.unit
+def test_results_are_stored_observable_major(tmp_path):
+    tspan = np.linspace(0, 1, 3)
+    writer = TrajectoryWriter("sweep", 4, tspan, ["Bound", "Free"], results_dir=tmp_path)
+    writer.write(slice(None), np.arange(24, dtype=float).reshape(4, 3, 2))
+    result = writer.close()
+    assert result.header["layout"] == "observable-major"
+    # Each observable is one contiguous (N x T) slab of the file.
+    assert np.load(result.path, mmap_mode="r").shape == (2, 4, 3)
+    assert result["Free"].flags.c_contiguous
+    np.testing.assert_array_equal(result["Free"], np.arange(1, 24, 2).reshape(4, 3))
+
+    header_path = writer.header_path
+    header = json.loads(header_path.read_text())
+    del header["layout"]
+    header_path.write_text(json.dumps(header))
+    with pytest.raises(ValueError, match="observable-major"):
+        open_result(result.path)
+
+
+
+@pytest.mark.unit
+def test_trajectory_writer_follows_set_output_dir(output_dir):
+    writer = TrajectoryWriter("sweep", 1, [0.0, 1.0], ["Bound"])
+    assert writer.path == output_dir / "results" / "sweep.npy"
+    writer.close()
+
+@pytest.mark.integration
+def test_batch_and_population_write_to_sink(binding_model, tmp_path):
+    from qspy.simulation.population import PopulationSimulator
+
+    tspan = np.linspace(0, 1, 11)
+    sweep = {"kf": [0.01, 0.02, 0.05]}
+    expected = binding_model.simulate_batch(sweep, tspan)
+    stored = binding_model.simulate_batch(sweep, tspan, sink=tmp_path / "batch.npy")
+    assert stored.shape == expected.shape
+    np.testing.assert_allclose(stored["AB_obs"], expected[..., 0])
+
+    runner = PopulationSimulator(binding_model, max_workers=2, chunk_size=2)
+    stored = runner.run(sweep, tspan, time_chunk=4, sink=tmp_path / "population.npy")
+    np.testing.assert_allclose(stored.data, expected, rtol=1e-4)
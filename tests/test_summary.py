@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from qspy.utils.summary import evaluate_expressions
+
+MODEL_SOURCE = """
+from qspy.core import Model
+from qspy.contexts import compartments, expressions, initials, monomers, parameters, rules
+
+Model().with_units(concentration="mg/L", time="h", volume="L")
+with parameters():
+    V_1 = (10.0, "L")
+    A_0 = (100.0, "mg")
+    k_deg = (1e-3, "1/s")
+with expressions():
+    C_0 = A_0 / V_1
+    C_1 = 2.0 * C_0
+with compartments():
+    CENTRAL = V_1
+with monomers():
+    A = (None, None)
+    B = (None, None)
+with initials():
+    A() ** CENTRAL << C_0
+    B() ** CENTRAL << C_1
+with rules():
+    degrade = (A() ** CENTRAL >> None, k_deg)
+"""
+
+
+@pytest.mark.unit
+def test_summary_streams_markdown_and_json_lines(tmp_path, run_model_source):
+    namespace = run_model_source(MODEL_SOURCE, "summary_test_module")
+    model = namespace["model"]
+    expressions = list(model.expressions)
+    values = evaluate_expressions(expressions)
+    assert values == {e.name: float(e.get_value()) for e in expressions}
+    assert values["C_1"] == pytest.approx(20.0)
+
+    summary = model.summary
+    summary.path = tmp_path / "summary.md"
+    handle = io.StringIO()
+    assert summary.write(handle) is None
+    assert summary._sections == {}  # streaming keeps no tables
+    assert handle.getvalue() == summary.markdown_block
+    assert "| B() ** CENTRAL | 20.00 |" in handle.getvalue()
+    assert summary.write().read_text(encoding="utf-8") == handle.getvalue()
+
+    path = summary.write(fmt="jsonl")
+    assert path == tmp_path / "summary.jsonl"
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert records[0]["section"] == "metadata" and records[0]["model"] == model.name
+    initial_values = {r["species"]: r["value"] for r in records if r["section"] == "initials"}
+    assert initial_values == {"A() ** CENTRAL": 10.0, "B() ** CENTRAL": 20.0}
+    counts = {r["component_type"]: r["count"] for r in records if r["section"] == "counts"}
+    assert counts["Rules"] == 1 and counts["Expressions"] == 2
+    with pytest.raises(ValueError):
+        summary.write(fmt="html")
@@ -0,0 +1,61 @@
+import pytest
+
+from pysb.core import as_complex_pattern
+
+from qspy.functionaltags import DRUG, NO_TAG, PROTEIN
+
+MODEL_SOURCE = """
+from qspy.core import Model, Monomer
+from qspy.contexts import monomers, observables
+from qspy.functionaltags import DRUG, PROTEIN
+
+Model()
+with monomers():
+    L = (["r"], None, PROTEIN.LIGAND)
+    R = (["l", "d"], None, PROTEIN.RECEPTOR)
+    D = (["r"], None, DRUG.INHIBITOR)
+    X = (None, None)
+with observables():
+    R(l=None) > "R_free"
+    R(d=1) % D(r=1) > "RD"
+    L() > "L_total"
+"""
+
+
+def _names(components):
+    return [c.name for c in components]
+
+
+@pytest.mark.unit
+def test_tag_index_tracks_added_and_retagged_monomers(run_model_source):
+    namespace = run_model_source(MODEL_SOURCE, "tag_index_test_module")
+    model = namespace["model"]
+    index = model.tag_index
+
+    assert _names(index.monomers(PROTEIN)) == ["L", "R"]
+    assert _names(index.monomers("protein")) == ["L", "R"]
+    assert _names(index.monomers(PROTEIN.RECEPTOR)) == ["R"]
+    assert _names(index.monomers("drug::inhibitor")) == ["D"]
+    assert _names(index.monomers(NO_TAG)) == ["X"]
+    assert _names(index.observables(DRUG)) == ["RD"]
+    assert _names(index.observables(PROTEIN.RECEPTOR)) == ["R_free", "RD"]
+    assert index.species(PROTEIN) == []  # no network generated
+    L, R, D = (namespace[n] for n in ("L", "R", "D"))
+    model.species.extend(
+        as_complex_pattern(p) for p in (L(r=None), R(l=None, d=None), R(l=None, d=1) % D(r=1))
+    )
+    assert index.species(DRUG) == [2]
+    assert index.species(PROTEIN.RECEPTOR) == [1, 2]
+
+    X = namespace["X"]
+    X @= DRUG.AGONIST
+    assert _names(index.monomers(DRUG)) == ["D", "X"]
+    assert index.monomers(NO_TAG) == []
+    Monomer = namespace["Monomer"]
+    Monomer("Y", ["b"]) @ PROTEIN.RECEPTOR
+    assert _names(index.monomers(PROTEIN.RECEPTOR)) == ["R", "Y"]
+    model.monomers["Y"].rename("Z")
+    assert _names(index.monomers(PROTEIN.RECEPTOR)) == ["R", "Z"]
+    assert index.tags()["protein::receptor"] == 2
+    with pytest.raises(TypeError):
+        index.monomers(42)